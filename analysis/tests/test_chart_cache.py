@@ -0,0 +1,111 @@
+import json
+from datetime import timedelta
+from unittest.mock import patch
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from analysis.models import TechnicalAnalysisSettings
+from analysis.utils.chart_cache_utils import chart_cache_key
+
+CHART_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "charts": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+class ChartCacheKeyTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_follows_data_version_and_plot_settings(self):
+        settings = TechnicalAnalysisSettings(selected_plot_indicators="rsi,macd")
+        key = chart_cache_key(settings)
+        self.assertEqual(chart_cache_key(settings), key)
+
+        changes = {
+            "df_last_fetch_time": settings.df_last_fetch_time + timedelta(minutes=1),
+            "selected_plot_indicators": "rsi,cci",
+            "rsi_timeperiod": settings.rsi_timeperiod + 1,
+            "rsi_buy": settings.rsi_buy + 1,
+            "symbol": "ETHUSDC",
+        }
+        for field, value in changes.items():
+            with self.subTest(field=field):
+                changed = TechnicalAnalysisSettings(selected_plot_indicators="rsi,macd")
+                changed.df_last_fetch_time = settings.df_last_fetch_time
+                setattr(changed, field, value)
+                self.assertNotEqual(chart_cache_key(changed), key)
+
+
+@override_settings(CACHES=CHART_CACHES)
+class ShowTechnicalAnalysisChartCacheTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        guest = get_user_model().objects.create_user(username="guest")
+        settings, _ = TechnicalAnalysisSettings.objects.get_or_create(user=guest)
+        settings.df = json.dumps(
+            [
+                {"open_time": 1737702000000 + i * 3600000, "close": 100 + i % 7}
+                for i in range(100)
+            ]
+        )
+        settings.lookback = "2d"
+        settings.selected_plot_indicators = "close"
+        settings.gpt_response = {"analysis": "HOLD"}
+        settings.save()
+
+    @patch("analysis.views.plot_selected_ta_indicators", return_value="png")
+    @patch("analysis.views.calculate_ta_indicators")
+    def test_repeat_views_skip_calculation_and_rendering(self, mock_calc, mock_plot):
+        mock_calc.side_effect = lambda df, settings: df
+        url = reverse("show_technical_analysis") + "?chart=png"
+
+        for _ in range(2):
+            response = self.client.get(url)
+            self.assertEqual(response.context["plot_url"], "png")
+            self.assertEqual(response.context["latest_data"]["close"], 101)
+        self.assertEqual(mock_calc.call_count, 1)
+        self.assertEqual(mock_plot.call_count, 1)
+
+        self.client.post(url, {"indicators": ["rsi"]})
+        self.assertEqual(mock_plot.call_count, 2)
+
+    @patch("analysis.views.plot_selected_ta_indicators")
+    @patch("analysis.views.calculate_ta_indicators")
+    def test_interactive_mode_skips_rendering(self, mock_calc, mock_plot):
+        mock_calc.side_effect = lambda df, settings: df
+
+        for _ in range(2):
+            response = self.client.get(reverse("show_technical_analysis"))
+            self.assertEqual(response.context["chart_mode"], "interactive")
+            self.assertContains(response, reverse("technical_analysis_chart_data"))
+        self.assertEqual(mock_calc.call_count, 1)
+        mock_plot.assert_not_called()
+
+    @override_settings(ANALYSIS_CHART_MAX_POINTS=20)
+    @patch("analysis.views.calculate_ta_indicators")
+    def test_chart_data_returns_downsampled_visible_window(self, mock_calc):
+        mock_calc.side_effect = lambda df, settings: df
+        url = reverse("technical_analysis_chart_data")
+
+        data = self.client.get(url).json()
+        self.assertEqual(self.client.get(url).json(), data)
+
+        self.assertEqual(mock_calc.call_count, 1)
+        self.assertEqual(len(data["t"]), 20)
+        self.assertEqual(len(data["series"]["close"]), 20)
+        self.assertEqual(data["t"][-1], 1737702000000 + 99 * 3600000)
+        self.assertGreaterEqual(data["t"][0], data["t"][-1] - 2 * 86400000)
+        self.assertEqual(data["traces"][0]["name"], "Close Price")
@@ -0,0 +1,64 @@
+import time
+from unittest.mock import MagicMock, patch
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from analysis.utils import exchange_status_utils
+from analysis.utils.exchange_status_utils import (
+    get_exchange_status_context,
+    refresh_exchange_status,
+)
+
+SHARED_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class ExchangeStatusTestCase(TestCase):
+
+    def setUp(self):
+        self.client_mock = MagicMock()
+        self.client_mock.get_server_time.side_effect = lambda: {
+            "serverTime": int(time.time() * 1000) + 60000
+        }
+        self.client_mock.get_system_status.return_value = {"status": 0, "msg": "normal"}
+        patcher = patch(
+            "analysis.utils.exchange_status_utils.create_binance_client",
+            return_value=self.client_mock,
+        )
+        self.mock_create_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(caches["shared"].clear)
+        self.addCleanup(self.expire_local_status)
+        self.expire_local_status()
+
+    def expire_local_status(self):
+        exchange_status_utils._local_status["expires_at"] = 0.0
+
+    def test_refresh_caches_status_and_clock_offset(self):
+        status = refresh_exchange_status()
+
+        self.mock_create_client.assert_called_once()
+        self.assertAlmostEqual(status["clock_offset_ms"], 60000, delta=1000)
+        context = get_exchange_status_context()
+        self.assertAlmostEqual(
+            context["server_time"]["serverTime"] / 1000, time.time() + 60, delta=1
+        )
+        self.assertEqual(context["system_status"]["msg"], "normal")
+
+    def test_pages_render_without_network_calls(self):
+        response = self.client.get(reverse("home_page"))
+        self.assertContains(response, "Binance System status: unavailable")
+
+        refresh_exchange_status()
+        self.mock_create_client.reset_mock()
+        self.expire_local_status()
+
+        response = self.client.get(reverse("home_page"))
+        self.assertContains(response, "Binance System status: 0 normal")
+        response = self.client.get("/missing-page/")
+        self.assertEqual(response.status_code, 404)
+        self.assertContains(response, "0 normal", status_code=404)
+        self.mock_create_client.assert_not_called()
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock
+from datetime import datetime, timezone
 import pandas as pd
 from analysis.utils.fetch_utils import (
     get_binance_api_credentials,
@@ -9,6 +10,7 @@ from analysis.utils.fetch_utils import (
     fetch_data,
     fetch_system_status,
     fetch_server_time,
+    closing_intervals,
 )
 
 
@@ -116,6 +118,38 @@ class TestBinanceFunctions(unittest.TestCase):
         self.assertEqual(server_time, mock_time)
         mock_client.get_server_time.assert_called_once()
 
+    def test_closing_intervals(self):
+        self.assertEqual(closing_intervals(datetime(2024, 1, 2, 10, 7, 2)), ["1m"])
+        self.assertEqual(
+            closing_intervals(datetime(2024, 1, 2, 10, 15, 30)),
+            ["1m", "3m", "5m", "15m"],
+        )
+        self.assertEqual(
+            closing_intervals(datetime(2024, 1, 2, 16, 0, tzinfo=timezone.utc)),
+            ["1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "8h"],
+        )
+        # Monday 1 January 2024, 3d candles open on 31 December.
+        self.assertEqual(
+            closing_intervals(datetime(2024, 1, 1)),
+            [
+                "1m",
+                "3m",
+                "5m",
+                "15m",
+                "30m",
+                "1h",
+                "2h",
+                "4h",
+                "6h",
+                "8h",
+                "12h",
+                "1d",
+                "1w",
+                "1M",
+            ],
+        )
+        self.assertIn("3d", closing_intervals(datetime(2023, 12, 31)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,84 @@
+import json
+from unittest.mock import patch
+import pandas as pd
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from analysis.utils.guest_utils import (
+    GUEST_SNAPSHOT_LEASE_NAME,
+    get_guest_settings,
+    refresh_guest_snapshot,
+)
+from fomo_sapiens.models import SchedulerLease
+from fomo_sapiens.utils.leader_utils import acquire_lease
+
+CHART_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "charts": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+@override_settings(CACHES=CHART_CACHES)
+class GuestSnapshotTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        )
+        self.mock_fetch_data = patcher.start()
+        self.addCleanup(patcher.stop)
+        for target, kwargs in (
+            ("analysis.utils.guest_utils.fetch_and_save_sentiment_analysis", {}),
+            (
+                "analysis.utils.guest_utils.plot_selected_ta_indicators",
+                {"return_value": "png"},
+            ),
+            (
+                "analysis.utils.guest_utils.calculate_ta_indicators",
+                {"side_effect": lambda df, settings: df},
+            ),
+        ):
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch("analysis.utils.guest_utils.fetch_and_save_df")
+        self.mock_fetch = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.guest_ta_settings = get_guest_settings()
+        self.guest_ta_settings.df = json.dumps(
+            [
+                {"open_time": 1737702000000 + i * 3600000, "close": 100 + i % 7}
+                for i in range(100)
+            ]
+        )
+        self.guest_ta_settings.lookback = "2d"
+        self.guest_ta_settings.selected_plot_indicators = "close"
+        self.guest_ta_settings.gpt_response = {"analysis": "HOLD"}
+        self.guest_ta_settings.save()
+        self.mock_fetch_data.reset_mock()
+
+    @patch("analysis.views.calculate_ta_indicators")
+    def test_guest_views_are_served_from_snapshot(self, mock_calc):
+        self.assertTrue(refresh_guest_snapshot())
+        self.mock_fetch.assert_called_once()
+
+        for mode in ("interactive", "png"):
+            response = self.client.get(
+                reverse("show_technical_analysis") + f"?chart={mode}"
+            )
+            self.assertEqual(response.context["latest_data"]["close"], 101)
+        self.assertEqual(response.context["plot_url"], "png")
+        data = self.client.get(reverse("technical_analysis_chart_data")).json()
+        self.assertEqual(data["series"]["close"][-1], 101)
+
+        mock_calc.assert_not_called()
+        self.mock_fetch_data.assert_not_called()
+        self.assertEqual(
+            SchedulerLease.objects.get(name=GUEST_SNAPSHOT_LEASE_NAME).holder, ""
+        )
+
+    def test_refresh_is_single_flight(self):
+        self.assertTrue(acquire_lease(GUEST_SNAPSHOT_LEASE_NAME, "other", 300))
+
+        self.assertFalse(refresh_guest_snapshot())
+        self.mock_fetch.assert_not_called()
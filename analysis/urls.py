@@ -6,6 +6,7 @@ Defines URL patterns for technical analysis views, including:
 - Updating user settings for technical analysis.
 - Refreshing technical analysis data.
 - Sending an email report with analysis results.
+- Serving the chart series for rendering the chart in the browser.
 """
 
 from django.urls import path
@@ -25,4 +26,9 @@ urlpatterns = [
     path(
         "report/", views.send_email_analysis_report, name="send_email_analysis_report"
     ),
+    path(
+        "chart-data/",
+        views.technical_analysis_chart_data,
+        name="technical_analysis_chart_data",
+    ),
 ]
@@ -1,7 +1,10 @@
-from typing import Union, Optional, Dict
+from typing import Union, Optional, Dict, Tuple, Any
 from analysis.models import TechnicalAnalysisSettings
+import warnings
 import talib
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from fomo_sapiens.utils.logging import logger
 from fomo_sapiens.utils.exception_handlers import exception_handler
 
@@ -464,6 +467,45 @@ def calculate_ta_indicators(
     return df
 
 
+INDICATOR_PARAMETER_FIELDS = (
+    "rsi_timeperiod",
+    "cci_timeperiod",
+    "mfi_timeperiod",
+    "adx_timeperiod",
+    "atr_timeperiod",
+    "di_timeperiod",
+    "stoch_k_timeperiod",
+    "stoch_d_timeperiod",
+    "stoch_rsi_timeperiod",
+    "stoch_rsi_k_timeperiod",
+    "stoch_rsi_d_timeperiod",
+    "bollinger_timeperiod",
+    "bollinger_nbdev",
+    "ema_fast_timeperiod",
+    "ema_slow_timeperiod",
+    "macd_timeperiod",
+    "macd_signalperiod",
+    "psar_acceleration",
+    "psar_maximum",
+)
+
+
+def indicator_cache_key(settings: object) -> Tuple[Any, ...]:
+    """
+    Returns the indicator parameters of the settings as a hashable key.
+
+    Settings with equal keys produce identical indicator columns, whatever their
+    thresholds, flags or averaging periods.
+
+    Args:
+        settings (object): The hunter settings.
+
+    Returns:
+        tuple: The values of `INDICATOR_PARAMETER_FIELDS`.
+    """
+    return tuple(getattr(settings, field) for field in INDICATOR_PARAMETER_FIELDS)
+
+
 @exception_handler()
 def calculate_ta_averages(
     df: pd.DataFrame, settings: TechnicalAnalysisSettings
@@ -483,7 +525,27 @@ def calculate_ta_averages(
     """
     averages = {}
 
-    average_mappings = {
+    average_mappings = get_ta_average_mappings(settings)
+
+    for avg_name, (column, period) in average_mappings.items():
+        averages[avg_name] = df[column].iloc[-period:].mean()
+
+    return averages
+
+
+def get_ta_average_mappings(
+    settings: TechnicalAnalysisSettings,
+) -> Dict[str, Tuple[str, int]]:
+    """
+    Returns the mapping of average names to their source column and averaging period.
+
+    Args:
+        settings (object): The settings including the periods for averaging the indicators.
+
+    Returns:
+        dict: A dictionary mapping each average name (e.g. 'avg_rsi') to a (column, period) tuple.
+    """
+    return {
         "avg_volume": ("volume", settings.avg_volume_period),
         "avg_rsi": ("rsi", settings.avg_rsi_period),
         "avg_cci": ("cci", settings.avg_cci_period),
@@ -503,10 +565,61 @@ def calculate_ta_averages(
         "avg_close": ("close", settings.avg_close_period),
     }
 
+
+def rolling_nanmean(values: Any, period: int) -> np.ndarray:
+    """
+    Calculates the mean of the last `period` values for every position of an array.
+
+    NaN values are skipped and shorter windows are used at the start of the array,
+    so the value at each position equals `series.iloc[-period:].mean()` evaluated
+    on the data available up to that position.
+
+    Args:
+        values (array-like): The values to average.
+        period (int): The number of trailing values included in each mean.
+
+    Returns:
+        numpy.ndarray: The trailing means, NaN where a window holds no valid value.
+    """
+    values = np.asarray(values, dtype=float)
+    period = max(int(period), 1)
+    padded = np.concatenate([np.full(period - 1, np.nan), values])
+    windows = sliding_window_view(padded, period)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmean(windows, axis=1)
+
+
+@exception_handler()
+def calculate_ta_rolling_averages(
+    df: pd.DataFrame, settings: TechnicalAnalysisSettings
+) -> Union[pd.DataFrame, Optional[int]]:
+    """
+    Calculates the averages of `calculate_ta_averages` for every row of the DataFrame.
+
+    Each row holds the averages the live check would see if that row were the latest
+    candle. The ADX average used by the trend check is included as 'avg_adx'.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame containing the market data.
+        settings (object): The settings including the periods for averaging the indicators.
+
+    Returns:
+        pandas.DataFrame: A DataFrame with one column per average, aligned with `df`.
+    """
+    average_mappings = get_ta_average_mappings(settings)
+    average_mappings["avg_adx"] = ("adx", settings.avg_adx_period)
+
+    averages = {}
     for avg_name, (column, period) in average_mappings.items():
-        averages[avg_name] = df[column].iloc[-period:].mean()
+        if column in df:
+            values = pd.to_numeric(df[column], errors="coerce")
+            averages[avg_name] = rolling_nanmean(values, period)
+        else:
+            averages[avg_name] = np.full(len(df), np.nan)
 
-    return averages
+    return pd.DataFrame(averages, index=df.index)
 
 
 @exception_handler(default_return="none")
@@ -583,3 +696,121 @@ def check_ta_trend(df: pd.DataFrame, settings: TechnicalAnalysisSettings) -> str
         return "downtrend"
     elif horizontal:
         return "horizontal"
+
+
+def get_array_values(data: Any, key: str) -> np.ndarray:
+    """
+    Returns a column of a DataFrame, a row or a dict of arrays as a float array.
+
+    Missing keys and non-numeric values become NaN, so every comparison made on them
+    is False, the same outcome the row-by-row checks reach through their error handling.
+
+    Args:
+        data (DataFrame, Series or dict): The container holding the values.
+        key (str): The name of the column or entry.
+
+    Returns:
+        numpy.ndarray: The values as floats.
+    """
+    if isinstance(data, pd.DataFrame):
+        if key not in data:
+            return np.full(len(data), np.nan)
+        return pd.to_numeric(data[key], errors="coerce").to_numpy(dtype=float)
+
+    if key not in data:
+        return np.float64(np.nan)
+
+    values = pd.to_numeric(pd.Series(np.ravel(data[key])), errors="coerce")
+    values = values.to_numpy(dtype=float)
+    return values if np.ndim(data[key]) else values[0]
+
+
+def get_setting_values(settings: object, name: str, dtype: type = float) -> np.ndarray:
+    """
+    Returns a settings attribute as an array.
+
+    The attribute may be a single value (one hunter) or an array with one value per
+    hunter, which lets the same vectorised checks evaluate many hunters at once.
+
+    Args:
+        settings (object): The settings or stacked settings object.
+        name (str): The attribute name.
+        dtype (type): The dtype of the returned array.
+
+    Returns:
+        numpy.ndarray: The attribute values.
+    """
+    return np.asarray(getattr(settings, name), dtype=dtype)
+
+
+def check_ta_trend_arrays(
+    latest: Any, averages: Any, settings: TechnicalAnalysisSettings
+) -> np.ndarray:
+    """
+    Vectorised counterpart of `check_ta_trend`.
+
+    Classifies the trend for every element of the given arrays, e.g. every row of a
+    DataFrame (with `calculate_ta_rolling_averages` as averages) or the latest values
+    of many hunters at once.
+
+    Args:
+        latest (DataFrame or dict): The latest values of 'adx', 'plus_di', 'minus_di',
+            'high', 'low', 'atr' and 'rsi'.
+        averages (DataFrame or dict): The 'avg_adx', 'avg_plus_di' and 'avg_minus_di' values.
+        settings (object): The settings including the thresholds for trend identification.
+
+    Returns:
+        numpy.ndarray: The trend ('uptrend', 'downtrend', 'horizontal' or 'none') per element.
+    """
+    adx = get_array_values(latest, "adx")
+    plus_di = get_array_values(latest, "plus_di")
+    minus_di = get_array_values(latest, "minus_di")
+    high = get_array_values(latest, "high")
+    low = get_array_values(latest, "low")
+    atr = get_array_values(latest, "atr")
+    rsi = get_array_values(latest, "rsi")
+
+    avg_adx = get_array_values(averages, "avg_adx")
+    avg_plus_di = get_array_values(averages, "avg_plus_di")
+    avg_minus_di = get_array_values(averages, "avg_minus_di")
+
+    adx_strong_trend = get_setting_values(settings, "adx_strong_trend")
+    adx_weak_trend = get_setting_values(settings, "adx_weak_trend")
+    adx_no_trend = get_setting_values(settings, "adx_no_trend")
+    rsi_buy = get_setting_values(settings, "rsi_buy")
+    rsi_sell = get_setting_values(settings, "rsi_sell")
+
+    with np.errstate(invalid="ignore"):
+        adx_trend = (adx > adx_strong_trend) | (adx > avg_adx)
+        di_difference_increasing = np.abs(plus_di - minus_di) > np.abs(
+            avg_plus_di - avg_minus_di
+        )
+        significant_move = (high - low) > atr
+
+        uptrend = (
+            (rsi < rsi_sell)
+            & adx_trend
+            & di_difference_increasing
+            & (plus_di > adx_weak_trend)
+            & significant_move
+            & (plus_di > avg_minus_di)
+        )
+        downtrend = (
+            (rsi > rsi_buy)
+            & adx_trend
+            & di_difference_increasing
+            & (minus_di > adx_weak_trend)
+            & significant_move
+            & (plus_di < avg_minus_di)
+        )
+        horizontal = (
+            (adx < avg_adx)
+            | (avg_adx < adx_weak_trend)
+            | (np.abs(plus_di - minus_di) < adx_no_trend)
+        )
+
+    return np.where(
+        uptrend,
+        "uptrend",
+        np.where(downtrend, "downtrend", np.where(horizontal, "horizontal", "none")),
+    )
@@ -0,0 +1,85 @@
+import hashlib
+from typing import Any, Dict, Optional
+from django.core.cache import caches
+from fomo_sapiens.utils.logging import logger
+from analysis.utils.calc_utils import indicator_cache_key
+from analysis.utils.plot_utils import get_plot_indicators
+
+CHART_CACHE_ALIAS = "charts"
+
+CHART_SETTINGS_FIELDS = (
+    "symbol",
+    "interval",
+    "lookback",
+    "rsi_buy",
+    "rsi_sell",
+    "cci_buy",
+    "cci_sell",
+    "mfi_buy",
+    "mfi_sell",
+)
+
+
+def chart_cache_key(settings: Any, variant: str = "png") -> str:
+    """
+    Returns the cache key of the rendered chart of a settings object.
+
+    The key covers everything the chart depends on: the market, the data version
+    (`df_last_fetch_time`), the indicator parameters, the plotted indicators and the
+    threshold lines, so a new fetch or any settings change renders a new chart.
+
+    Args:
+        settings (TechnicalAnalysisSettings): The settings the chart is rendered for.
+        variant (str, optional): What is cached: 'png' for the rendered page chart,
+            'interactive' for the page without it, 'series' for the chart series.
+
+    Returns:
+        str: The cache key.
+    """
+    parts = (
+        tuple(getattr(settings, field) for field in CHART_SETTINGS_FIELDS),
+        settings.df_last_fetch_time.isoformat(),
+        indicator_cache_key(settings),
+        tuple(get_plot_indicators(settings)),
+    )
+    return f"chart:{variant}:" + hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def get_cached_chart(settings: Any, variant: str = "png") -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached chart of a settings object.
+
+    Args:
+        settings (TechnicalAnalysisSettings): The settings the chart is rendered for.
+        variant (str, optional): The cached variant, see `chart_cache_key`.
+
+    Returns:
+        dict: The cached chart, None if not cached.
+    """
+    try:
+        return caches[CHART_CACHE_ALIAS].get(chart_cache_key(settings, variant))
+    except Exception as e:
+        logger.warning(f"Chart cache read failed: {e}")
+        return None
+
+
+def cache_chart(settings: Any, chart: Dict[str, Any], variant: str = "png") -> None:
+    """
+    Stores a rendered chart in the chart cache shared by all web workers.
+
+    The cache holds at most `MAX_ENTRIES` charts, a quarter of them is culled when it
+    is full, and every chart expires after the cache `TIMEOUT`.
+
+    Args:
+        settings (TechnicalAnalysisSettings): The settings the chart is rendered for.
+        chart (dict): The page chart ('plot_url', 'latest_data' and 'previous_data')
+            or the chart series.
+        variant (str, optional): The cached variant, see `chart_cache_key`.
+
+    Returns:
+        None
+    """
+    try:
+        caches[CHART_CACHE_ALIAS].set(chart_cache_key(settings, variant), chart)
+    except Exception as e:
+        logger.warning(f"Chart cache write failed: {e}")
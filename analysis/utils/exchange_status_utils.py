@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+from django.conf import settings
+from django.core.cache import caches
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from fomo_sapiens.utils.retry_connection import retry_connection
+from analysis.utils.fetch_utils import create_binance_client
+
+EXCHANGE_STATUS_CACHE_ALIAS = "shared"
+EXCHANGE_STATUS_CACHE_KEY = "exchange-status"
+
+DEFAULT_EXCHANGE_STATUS = {
+    "refresh_seconds": 30,
+    "ttl": 120,
+    "local_ttl": 5,
+}
+
+_local_status: Dict[str, Any] = {"status": None, "expires_at": 0.0}
+_local_lock = threading.Lock()
+
+
+def get_exchange_status_config() -> Dict[str, int]:
+    """
+    Returns the exchange status settings from `settings.EXCHANGE_STATUS`.
+
+    Returns:
+        dict: The 'refresh_seconds', 'ttl' and 'local_ttl'.
+    """
+    config = dict(DEFAULT_EXCHANGE_STATUS)
+    config.update(getattr(settings, "EXCHANGE_STATUS", {}))
+    return config
+
+
+@exception_handler()
+@retry_connection()
+def refresh_exchange_status() -> Optional[Dict[str, Any]]:
+    """
+    Fetches the Binance server time and system status and stores them in the shared cache.
+
+    Both calls share one client. The clock offset is measured against the midpoint of
+    the server time round trip, so readers can derive the current server time from
+    their own clock. Scheduled in the worker process every `refresh_seconds`; the
+    cached status expires after `ttl` seconds, so a status the worker can no longer
+    refresh is shown as unavailable rather than stale.
+
+    Returns:
+        dict: The 'clock_offset_ms', 'system_status' and 'fetched_at' (epoch ms).
+    """
+    client = create_binance_client()
+    sent_at = time.time() * 1000
+    server_time = client.get_server_time()
+    received_at = time.time() * 1000
+    system_status = client.get_system_status()
+
+    status = {
+        "clock_offset_ms": server_time["serverTime"] - (sent_at + received_at) / 2,
+        "system_status": system_status,
+        "fetched_at": received_at,
+    }
+    caches[EXCHANGE_STATUS_CACHE_ALIAS].set(
+        EXCHANGE_STATUS_CACHE_KEY, status, timeout=get_exchange_status_config()["ttl"]
+    )
+    return status
+
+
+def get_exchange_status() -> Optional[Dict[str, Any]]:
+    """
+    Returns the last exchange status refreshed by the worker, without any network call.
+
+    The status is read from the shared cache at most once every `local_ttl` seconds per
+    process, so request floods (e.g. bots hitting the 404 page) do not even read the
+    cache on every request.
+
+    Returns:
+        dict: The status, see `refresh_exchange_status`, None if not available.
+    """
+    now = time.monotonic()
+    with _local_lock:
+        if now < _local_status["expires_at"]:
+            return _local_status["status"]
+
+    try:
+        status = caches[EXCHANGE_STATUS_CACHE_ALIAS].get(EXCHANGE_STATUS_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Exchange status cache read failed: {e}")
+        status = None
+
+    with _local_lock:
+        _local_status["status"] = status
+        _local_status["expires_at"] = now + get_exchange_status_config()["local_ttl"]
+    return status
+
+
+def get_exchange_status_context() -> Dict[str, Any]:
+    """
+    Returns the server time and system status shown on the home and 404 pages.
+
+    The server time is the local clock corrected by the cached clock offset, in the
+    shape returned by the Binance API.
+
+    Returns:
+        dict: The 'server_time' and 'system_status', None when not available.
+    """
+    status = get_exchange_status()
+    if status is None:
+        return {"server_time": None, "system_status": None}
+    server_time = int(time.time() * 1000 + status["clock_offset_ms"])
+    return {
+        "server_time": {"serverTime": server_time},
+        "system_status": status["system_status"],
+    }
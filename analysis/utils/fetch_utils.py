@@ -1,7 +1,7 @@
-from typing import Union, Optional, Tuple
+from typing import List, Union, Optional, Tuple
 from analysis.models import TechnicalAnalysisSettings
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 from binance.client import Client
 import os
@@ -10,6 +10,26 @@ from fomo_sapiens.utils.retry_connection import retry_connection
 
 load_dotenv()
 
+DF_UPDATE_FIELDS = ["df", "df_last_fetch_time"]
+
+BINANCE_INTERVALS = (
+    "1m",
+    "3m",
+    "5m",
+    "15m",
+    "30m",
+    "1h",
+    "2h",
+    "4h",
+    "6h",
+    "8h",
+    "12h",
+    "1d",
+    "3d",
+    "1w",
+    "1M",
+)
+
 
 def get_binance_api_credentials() -> Tuple[Optional[str], Optional[str]]:
     """
@@ -47,6 +67,9 @@ def create_binance_client() -> Union[Client, Optional[int]]:
 @exception_handler()
 def fetch_and_save_df(
     settings: TechnicalAnalysisSettings,
+    df_json: Optional[str] = None,
+    save: bool = True,
+    fetched_at: Optional[datetime] = None,
 ) -> Union[bool, Optional[int]]:
     """
     Fetches data for a given trading symbol and interval, processes it into JSON format,
@@ -55,26 +78,38 @@ def fetch_and_save_df(
     Args:
         settings (TechnicalAnalysisSettings): The settings object containing the user's symbol,
                                               interval, and other configuration details.
+        df_json (str, optional): Klines already fetched and converted to JSON records for
+                                 the same symbol, interval and lookback. Skips the fetch.
+        save (bool, optional): Whether to save the fields right away. Pass False to
+                               collect the update in a `BulkUpdateBuffer`. Default is True.
+        fetched_at (datetime, optional): When `df_json` was fetched, stored as the fetch
+                                         time instead of now.
 
     This function fetches market data using the `fetch_data` function, converts the resulting
     DataFrame to JSON format, and stores it in the `df` field of the `settings` model.
     The timestamp of the fetch is also recorded in the `df_last_fetch_time` field.
+    Only these two fields are written (see `DF_UPDATE_FIELDS`).
 
     Returns:
-        Union[pd.DataFrame, Optional[int]]: The fetched DataFrame if successful, otherwise None or an integer error code.
+        Union[pd.DataFrame, str, Optional[int]]: The fetched DataFrame if successful (the
+            JSON records when `df_json` was given), otherwise None or an integer error code.
     """
     from datetime import datetime as dt
 
-    df_fetched = fetch_data(
-        symbol=settings.symbol,
-        interval=settings.interval,
-        lookback=calculate_lookback_extended(settings),
-    )
+    if df_json is None:
+        df_fetched = fetch_data(
+            symbol=settings.symbol,
+            interval=settings.interval,
+            lookback=calculate_lookback_extended(settings),
+        )
+        json_data = df_fetched.to_json(orient="records")
+    else:
+        df_fetched = json_data = df_json
 
-    json_data = df_fetched.to_json(orient="records")
     settings.df = json_data
-    settings.df_last_fetch_time = dt.now()
-    settings.save()
+    settings.df_last_fetch_time = fetched_at or dt.now()
+    if save:
+        settings.save(update_fields=DF_UPDATE_FIELDS)
 
     return df_fetched
 
@@ -97,6 +132,80 @@ def calculate_lookback_extended(
     return f"{num + 200}{unit}"
 
 
+def interval_to_timedelta(interval: str) -> timedelta:
+    """
+    Converts a Binance kline interval (e.g. '15m', '4h', '1d', '1w', '1M') into a timedelta.
+
+    Months are approximated as 30 days, as in the lookback handling of `fetch_data`.
+
+    Args:
+        interval (str): The kline interval.
+
+    Returns:
+        timedelta: The duration of a single candle.
+
+    Raises:
+        ValueError: If the interval format is not supported.
+    """
+    num = int(interval[:-1])
+    unit = interval[-1]
+
+    if unit == "m":
+        return timedelta(minutes=num)
+    elif unit == "h":
+        return timedelta(hours=num)
+    elif unit == "d":
+        return timedelta(days=num)
+    elif unit == "w":
+        return timedelta(weeks=num)
+    elif unit == "M":
+        return timedelta(days=num * 30)
+
+    raise ValueError(f"Unsupported interval format: {interval}")
+
+
+def closing_intervals(moment: datetime) -> List[str]:
+    """
+    Returns the Binance intervals whose candles close at the given minute boundary.
+
+    Binance aligns candles to the unix epoch in UTC: minute and hour intervals close when
+    the minutes since the epoch are a multiple of their length, '1d' and '3d' on day
+    multiples, '1w' on Monday midnight and '1M' on the first day of the month. Seconds
+    are ignored, so a tick delayed by a few seconds still matches its boundary.
+
+    Args:
+        moment (datetime): The tick time, naive values are taken as UTC.
+
+    Returns:
+        list: The closing intervals, shortest first, e.g. ['1m', '3m', '5m'] at 00:15.
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    moment = moment.replace(second=0, microsecond=0)
+
+    minutes = int((moment - datetime(1970, 1, 1)).total_seconds()) // 60
+    intervals = []
+    for interval in BINANCE_INTERVALS:
+        num = int(interval[:-1])
+        unit = interval[-1]
+
+        if unit == "m":
+            closing = minutes % num == 0
+        elif unit == "h":
+            closing = minutes % (num * 60) == 0
+        elif unit == "d":
+            closing = minutes % (num * 1440) == 0
+        elif unit == "w":
+            closing = minutes % 1440 == 0 and moment.weekday() == 0
+        else:
+            closing = minutes % 1440 == 0 and moment.day == 1
+
+        if closing:
+            intervals.append(interval)
+
+    return intervals
+
+
 @exception_handler()
 @retry_connection()
 def fetch_data(
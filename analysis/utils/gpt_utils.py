@@ -15,8 +15,8 @@ from analysis.utils.calc_utils import calculate_ta_indicators
 from fomo_sapiens.utils.exception_handlers import exception_handler
 from fomo_sapiens.utils.retry_connection import retry_connection
 from .msg_utils import generate_gpt_analyse_msg_content
-from fomo_sapiens.utils.email_utils import send_email
-from fomo_sapiens.utils.telegram_utils import send_telegram
+from fomo_sapiens.utils.outbox_utils import queue_notification
+from fomo_sapiens.utils.email_utils import EMAIL_SIGNATURE
 
 load_dotenv()
 
@@ -161,16 +161,26 @@ def fetch_save_and_send_gpt_analysis(username: str | None = None) -> None:
         user_ta_settings.save()
 
         msg_subject, msg_content = generate_gpt_analyse_msg_content(response_json)
+        dedup_key = f"gpt:{user_ta_settings.user.id}:{user_ta_settings.gpt_last_update_time.isoformat()}"
         if user_ta_settings.user.telegram_gpt_analysis_receiver and user_ta_settings.user.telegram_chat_id:
-            send_telegram(chat_id=user_ta_settings.user.telegram_chat_id, msg=msg_content)
+            queue_notification(
+                "telegram",
+                user_ta_settings.user.telegram_chat_id,
+                msg_content,
+                user=user_ta_settings.user,
+                category="gpt",
+                dedup_key=f"{dedup_key}:telegram",
+            )
         if user_ta_settings.user.email_gpt_analysis_receiver and user_ta_settings.user.email:
-            msg_content += (
-                f"\n\n-- \n\n"
-                "FomoSapiensCryptoDipHunter\nhttps://fomo.ropeaccess.pro\n\n"
-                "StefanCryptoTradingBot\nhttps://stefan.ropeaccess.pro\n\n"
-                "CodeCave\nhttps://cave.ropeaccess.pro\n"
+            queue_notification(
+                "email",
+                user_ta_settings.user.email,
+                msg_content + EMAIL_SIGNATURE,
+                subject=msg_subject,
+                user=user_ta_settings.user,
+                category="gpt",
+                dedup_key=f"{dedup_key}:email",
             )
-            send_email(user_ta_settings.user.email, msg_subject, msg_content)
 
         time.sleep(3)
         
@@ -0,0 +1,109 @@
+from io import StringIO
+from typing import Dict
+import pandas as pd
+from django.conf import settings
+from analysis.models import SentimentAnalysis, TechnicalAnalysisSettings
+from analysis.utils.calc_utils import calculate_ta_indicators
+from analysis.utils.chart_cache_utils import cache_chart
+from analysis.utils.fetch_utils import fetch_and_save_df
+from analysis.utils.plot_utils import build_chart_series, plot_selected_ta_indicators
+from analysis.utils.sentiment_utils import fetch_and_save_sentiment_analysis
+from fomo_sapiens.models import UserProfile
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from fomo_sapiens.utils.leader_utils import (
+    acquire_lease,
+    get_process_identity,
+    release_lease,
+)
+from fomo_sapiens.utils.logging import logger
+
+GUEST_USERNAME = "guest"
+GUEST_SNAPSHOT_LEASE_NAME = "guest_snapshot"
+
+DEFAULT_GUEST_SNAPSHOT = {
+    "refresh_seconds": 60,
+    "lease_ttl": 300,
+}
+
+
+def get_guest_snapshot_config() -> Dict[str, int]:
+    """
+    Returns the guest snapshot settings from `settings.GUEST_SNAPSHOT`.
+
+    Returns:
+        dict: The 'refresh_seconds' and 'lease_ttl'.
+    """
+    config = dict(DEFAULT_GUEST_SNAPSHOT)
+    config.update(getattr(settings, "GUEST_SNAPSHOT", {}))
+    return config
+
+
+def get_guest_settings() -> TechnicalAnalysisSettings:
+    """
+    Returns the Technical Analysis settings shared by all guests, creating them if needed.
+
+    Nothing is fetched here, the data is refreshed by `refresh_guest_snapshot`.
+
+    Returns:
+        TechnicalAnalysisSettings: The settings of the guest account.
+    """
+    guest_user, created = UserProfile.objects.get_or_create(username=GUEST_USERNAME)
+    guest_ta_settings, created = TechnicalAnalysisSettings.objects.get_or_create(
+        user=guest_user
+    )
+    return guest_ta_settings
+
+
+@exception_handler(default_return=False)
+def refresh_guest_snapshot() -> bool:
+    """
+    Refreshes the snapshot served to guests on the Technical Analysis page.
+
+    Fetches the guest klines, calculates the indicators once and stores the page data
+    of both chart modes and the chart series in the chart cache, so anonymous views only
+    read the database and the cache. The refresh is single-flight: it runs under the
+    `guest_snapshot` lease, and a refresh started while another one holds the lease
+    (in any process) is skipped. The sentiment analysis is fetched too if it is missing.
+
+    Returns:
+        bool: True if the snapshot was refreshed, False if skipped or failed.
+    """
+    config = get_guest_snapshot_config()
+    holder = get_process_identity()
+    if not acquire_lease(GUEST_SNAPSHOT_LEASE_NAME, holder, config["lease_ttl"]):
+        logger.info("Guest snapshot refresh skipped, another refresh is running.")
+        return False
+
+    try:
+        guest_ta_settings = get_guest_settings()
+        fetch_and_save_df(guest_ta_settings)
+
+        df_loaded = pd.read_json(StringIO(guest_ta_settings.df))
+        if df_loaded is None or df_loaded.empty:
+            logger.warning("Guest snapshot refresh failed, no data fetched.")
+            return False
+        df_calculated = calculate_ta_indicators(df_loaded, guest_ta_settings)
+        if df_calculated is None or df_calculated.empty:
+            logger.warning("Guest snapshot refresh failed, no indicators calculated.")
+            return False
+
+        chart = {
+            "latest_data": df_calculated.iloc[-1].to_dict(),
+            "previous_data": df_calculated.iloc[-2].to_dict(),
+            "plot_url": None,
+        }
+        cache_chart(guest_ta_settings, chart, "interactive")
+        plot_url = plot_selected_ta_indicators(df_calculated, guest_ta_settings)
+        if plot_url:
+            cache_chart(guest_ta_settings, {**chart, "plot_url": plot_url}, "png")
+        series = build_chart_series(
+            df_calculated, guest_ta_settings, settings.ANALYSIS_CHART_MAX_POINTS
+        )
+        if series:
+            cache_chart(guest_ta_settings, series, "series")
+
+        if not SentimentAnalysis.objects.filter(id=1).exists():
+            fetch_and_save_sentiment_analysis()
+        return True
+    finally:
+        release_lease(GUEST_SNAPSHOT_LEASE_NAME, holder)
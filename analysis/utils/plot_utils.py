@@ -11,8 +11,9 @@ import plotly.graph_objects as go
 import plotly.io as pio
 import base64
 from io import BytesIO
+import numpy as np
 import pandas as pd
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 
 @exception_handler(default_return=None)
@@ -31,11 +32,7 @@ def plot_selected_ta_indicators(df: pd.DataFrame, settings: object) -> Optional[
     Returns:
         str: A base64-encoded PNG image of the chart.
     """
-    selected_indicators = getattr(settings, "selected_plot_indicators", None)
-    if selected_indicators:
-        indicators = prepare_selected_indicators_list(selected_indicators)
-    else:
-        indicators = get_bot_specific_plot_indicators(settings) or ["rsi", "macd"]
+    indicators = get_plot_indicators(settings)
 
     validate_indicators(df, indicators)
     if not is_df_valid(df):
@@ -56,6 +53,22 @@ def plot_selected_ta_indicators(df: pd.DataFrame, settings: object) -> Optional[
     return generate_plot_image(fig)
 
 
+def get_plot_indicators(settings: object) -> List[str]:
+    """
+    Returns the indicators to plot: the selected ones, else those the signals use.
+
+    Parameters:
+        settings (object): The settings object containing user-selected indicators.
+
+    Returns:
+        list: The indicator names, e.g. ["rsi", "macd"].
+    """
+    selected_indicators = getattr(settings, "selected_plot_indicators", None)
+    if selected_indicators:
+        return prepare_selected_indicators_list(selected_indicators)
+    return get_bot_specific_plot_indicators(settings) or ["rsi", "macd"]
+
+
 def trim_df_to_lookback(df: pd.DataFrame, lookback: str) -> pd.DataFrame:
     """
     Cuts the DataFrame to match the user's lookback setting (e.g., '2d', '8h', '100m').
@@ -108,87 +121,26 @@ def get_min_bars_required(indicators: list) -> int:
     return max([indicator_requirements.get(ind, 0) for ind in indicators])
 
 
-@exception_handler(default_return=False)
-def add_price_traces(fig: go.Figure, df: pd.DataFrame, indicators: List[str]) -> None:
-    """
-    Adds traces for price data to the Plotly figure.
-
-    This function adds traces to the figure for various price-related indicators like 'close', 'ema', 'ma50', and 'ma200',
-    based on the selected indicators.
+PRICE_TRACE_MAPPINGS = {
+    "close": [("close", "Close Price", "blue")],
+    "ema": [("ema_fast", "EMA Fast", "green"), ("ema_slow", "EMA Slow", "red")],
+    "ma50": [("ma_50", "MA50", "orange")],
+    "ma200": [("ma_200", "MA200", "purple")],
+}
 
-    Parameters:
-        fig (plotly.graph_objects.Figure): The Plotly figure object to which traces are added.
-        df (DataFrame): The DataFrame containing the data for the price traces.
-        indicators (list): The list of selected indicators to plot.
 
-    Returns:
-        None
+def get_ta_trace_mappings(settings: object) -> dict:
     """
-    if "close" in indicators:
-        fig.add_trace(
-            go.Scatter(
-                x=df["open_time"],
-                y=df["close"],
-                name="Close Price",
-                line=dict(color="blue"),
-            )
-        )
-    if "ema" in indicators:
-        fig.add_trace(
-            go.Scatter(
-                x=df["open_time"],
-                y=df["ema_fast"],
-                name="EMA Fast",
-                line=dict(color="green"),
-            )
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=df["open_time"],
-                y=df["ema_slow"],
-                name="EMA Slow",
-                line=dict(color="red"),
-            )
-        )
-    if "ma50" in indicators:
-        fig.add_trace(
-            go.Scatter(
-                x=df["open_time"], 
-                y=df["ma_50"], 
-                name="MA50", 
-                line=dict(color="orange")
-            )
-        )
-    if "ma200" in indicators:
-        fig.add_trace(
-            go.Scatter(
-                x=df["open_time"],
-                y=df["ma_200"],
-                name="MA200",
-                line=dict(color="purple"),
-            )
-        )
-
-
-@exception_handler(default_return=False)
-def add_ta_traces(
-    fig: go.Figure, df: pd.DataFrame, indicators: List[str], settings: object
-) -> None:
-    """
-    Adds traces for various technical analysis indicators to the Plotly figure.
-
-    This function checks which technical analysis indicators are selected and adds their respective traces to the figure.
+    Returns the traces of each technical analysis indicator.
 
     Parameters:
-        fig (plotly.graph_objects.Figure): The Plotly figure object to which traces are added.
-        df (DataFrame): The DataFrame containing the data for the indicators.
-        indicators (list): The list of selected indicators to plot.
-        settings (object): The settings object containing configuration values for indicators.
+        settings (object): The settings object containing the indicator thresholds.
 
     Returns:
-        None
+        dict: Indicator name to a list of (column, color, mode, fillcolor,
+              horizontal_lines) tuples, trailing items are optional.
     """
-    ta_mappings = {
+    return {
         "macd": [
             ("macd", "blue"),
             ("macd_signal", "orange"),
@@ -235,6 +187,56 @@ def add_ta_traces(
         "di": [("plus_di", "green"), ("minus_di", "red")],
     }
 
+
+@exception_handler(default_return=False)
+def add_price_traces(fig: go.Figure, df: pd.DataFrame, indicators: List[str]) -> None:
+    """
+    Adds traces for price data to the Plotly figure.
+
+    This function adds traces to the figure for various price-related indicators like 'close', 'ema', 'ma50', and 'ma200',
+    based on the selected indicators.
+
+    Parameters:
+        fig (plotly.graph_objects.Figure): The Plotly figure object to which traces are added.
+        df (DataFrame): The DataFrame containing the data for the price traces.
+        indicators (list): The list of selected indicators to plot.
+
+    Returns:
+        None
+    """
+    for indicator, traces in PRICE_TRACE_MAPPINGS.items():
+        if indicator in indicators:
+            for column, name, color in traces:
+                fig.add_trace(
+                    go.Scatter(
+                        x=df["open_time"],
+                        y=df[column],
+                        name=name,
+                        line=dict(color=color),
+                    )
+                )
+
+
+@exception_handler(default_return=False)
+def add_ta_traces(
+    fig: go.Figure, df: pd.DataFrame, indicators: List[str], settings: object
+) -> None:
+    """
+    Adds traces for various technical analysis indicators to the Plotly figure.
+
+    This function checks which technical analysis indicators are selected and adds their respective traces to the figure.
+
+    Parameters:
+        fig (plotly.graph_objects.Figure): The Plotly figure object to which traces are added.
+        df (DataFrame): The DataFrame containing the data for the indicators.
+        indicators (list): The list of selected indicators to plot.
+        settings (object): The settings object containing configuration values for indicators.
+
+    Returns:
+        None
+    """
+    ta_mappings = get_ta_trace_mappings(settings)
+
     for indicator, traces in ta_mappings.items():
         if indicator in indicators:
             for trace in traces:
@@ -357,6 +359,118 @@ def generate_plot_image(fig: go.Figure) -> Optional[str]:
     return base64.b64encode(img.getvalue()).decode("utf8")
 
 
+def downsample_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Picks the points of a series to keep with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept, and from each of `max_points - 2` buckets the
+    point forming the largest triangle with its neighbours, so peaks and dips survive
+    the downsampling.
+
+    Parameters:
+        values (numpy.ndarray): The series, e.g. the close prices.
+        max_points (int): The maximum number of points to keep.
+
+    Returns:
+        numpy.ndarray: The sorted indices of the kept points.
+    """
+    n = len(values)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+
+    values = np.nan_to_num(np.asarray(values, dtype=float))
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    indices = [0]
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = (end + next_end - 1) / 2
+        next_y = values[end:next_end].mean()
+        x0, y0 = indices[-1], values[indices[-1]]
+        xs = np.arange(start, end)
+        areas = np.abs(
+            (x0 - next_x) * (values[start:end] - y0) - (x0 - xs) * (next_y - y0)
+        )
+        indices.append(start + int(areas.argmax()))
+    indices.append(n - 1)
+    return np.array(indices)
+
+
+def compact_values(values: pd.Series) -> List[Optional[float]]:
+    """Returns the values rounded to 6 significant digits, with None for NaN."""
+    return [None if pd.isna(value) else float(f"{value:.6g}") for value in values]
+
+
+@exception_handler(default_return=None)
+def build_chart_series(
+    df: pd.DataFrame, settings: object, max_points: int = 500
+) -> Optional[Dict[str, Any]]:
+    """
+    Builds the compact series of the chart, for rendering it in the browser.
+
+    Only the visible lookback window of the plotted indicators is included, downsampled
+    to at most `max_points` points chosen on the first price series.
+
+    Parameters:
+        df (DataFrame): The DataFrame with the calculated technical indicators.
+        settings (object): The settings object containing user-selected indicators and chart configurations.
+        max_points (int, optional): The maximum number of points per series.
+
+    Returns:
+        dict: 't' (open times in epoch milliseconds), 'series' (column to values),
+              'traces' (the name, color and mode of each column) and 'lines' (the
+              horizontal threshold lines).
+    """
+    indicators = get_plot_indicators(settings)
+    if not is_df_valid(df):
+        return None
+    df_visible = trim_df_to_lookback(df, settings.lookback)
+
+    traces = [
+        {"column": column, "name": name, "color": color, "mode": "lines"}
+        for indicator, specs in PRICE_TRACE_MAPPINGS.items()
+        if indicator in indicators
+        for column, name, color in specs
+    ]
+    lines = []
+    for indicator, specs in get_ta_trace_mappings(settings).items():
+        if indicator not in indicators:
+            continue
+        for column, color, *options in specs:
+            mode, _, horizontal_lines = (options + [None, None, None])[:3]
+            traces.append(
+                {
+                    "column": column,
+                    "name": column.upper(),
+                    "color": color,
+                    "mode": mode or "lines",
+                }
+            )
+            lines += [
+                {"y": y_val, "color": h_color}
+                for y_val, h_color in horizontal_lines or []
+            ]
+    traces = [trace for trace in traces if trace["column"] in df_visible]
+
+    if traces:
+        keep = downsample_indices(df_visible[traces[0]["column"]].to_numpy(), max_points)
+        df_visible = df_visible.iloc[keep]
+    open_time = pd.to_datetime(df_visible["open_time"])
+    if open_time.dt.tz is not None:
+        open_time = open_time.dt.tz_convert(None)
+    return {
+        "symbol": settings.symbol,
+        "interval": settings.interval,
+        "t": (open_time.astype("int64") // 1_000_000).tolist(),
+        "series": {
+            trace["column"]: compact_values(df_visible[trace["column"]])
+            for trace in traces
+        },
+        "traces": traces,
+        "lines": lines,
+    }
+
+
 @exception_handler(default_return=False)
 def parse_lookback(lookback: str) -> timedelta:
     """
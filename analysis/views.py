@@ -1,24 +1,68 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import HttpRequest, HttpResponse
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.urls import reverse
 from io import StringIO
+from typing import Optional
 import pandas as pd
 from .forms import TechnicalAnalysisSettingsForm
 from .models import TechnicalAnalysisSettings, SentimentAnalysis
-from fomo_sapiens.models import UserProfile
 from fomo_sapiens.utils.exception_handlers import exception_handler
-from fomo_sapiens.utils.email_utils import send_email
-from .utils.fetch_utils import fetch_and_save_df
+from fomo_sapiens.utils.email_utils import EMAIL_SIGNATURE, send_email
+from fomo_sapiens.utils.job_utils import enqueue_job
 from analysis.utils.calc_utils import calculate_ta_indicators
 from analysis.utils.report_utils import generate_ta_report_email
 from analysis.utils.msg_utils import generate_gpt_analyse_msg_content
-from analysis.utils.sentiment_utils import fetch_and_save_sentiment_analysis
-from analysis.utils.gpt_utils import fetch_save_and_send_gpt_analysis
 from .utils.plot_utils import (
+    build_chart_series,
     plot_selected_ta_indicators,
     prepare_selected_indicators_list,
 )
+from .utils.chart_cache_utils import cache_chart, get_cached_chart
+from .utils.guest_utils import GUEST_USERNAME, get_guest_settings
+
+
+def redirect_to_job(job) -> HttpResponse:
+    """
+    Redirects to the technical analysis page, which polls the status of the given job.
+
+    Args:
+        job (BackgroundJob): The enqueued job.
+
+    Returns:
+        HttpResponseRedirect: The redirect to the technical analysis page.
+    """
+    return redirect(f"{reverse('show_technical_analysis')}?job={job.id}")
+
+
+def enqueue_missing_analysis_job(
+    user, user_ta_settings: TechnicalAnalysisSettings, sentiment_analysis
+) -> Optional[int]:
+    """
+    Enqueues the background job fetching the sentiment or AI-GPT analysis not yet fetched.
+
+    The sentiment analysis is fetched first, as the AI-GPT analysis is based on it; the
+    page polls the job and enqueues the next one once it is done.
+
+    Args:
+        user (UserProfile): The authenticated user.
+        user_ta_settings (TechnicalAnalysisSettings): The user's settings.
+        sentiment_analysis (SentimentAnalysis): The saved sentiment analysis, if any.
+
+    Returns:
+        int: The id of the job the page polls, None if nothing is missing.
+    """
+    if not sentiment_analysis:
+        return enqueue_job("sentiment_analysis", user).id
+    if (
+        not user_ta_settings.gpt_response
+        and sentiment_analysis.use_gpt_analysis
+        and user_ta_settings.use_gpt_analysis
+    ):
+        return enqueue_job("gpt_analysis", user).id
+    return None
 
 
 @exception_handler(default_return=lambda: redirect("show_technical_analysis"))
@@ -29,7 +73,8 @@ def update_technical_analysis_settings(request: HttpRequest) -> HttpResponse:
 
     This function handles both displaying the settings form and processing the submitted form.
     If the request method is POST, it validates and saves the form data. If successful, the
-    settings are updated, and new technical analysis data is fetched and saved.
+    settings are updated, and a background job fetching the new technical analysis data is
+    enqueued.
 
     Args:
         request: The HTTP request object.
@@ -45,9 +90,11 @@ def update_technical_analysis_settings(request: HttpRequest) -> HttpResponse:
         form = TechnicalAnalysisSettingsForm(request.POST, instance=user_ta_settings)
         if form.is_valid():
             form.save()
-            fetch_and_save_df(user_ta_settings)
-            messages.success(request, "Settings saved succesfully.")
-            return redirect("show_technical_analysis")
+            job = enqueue_job("technical_analysis", request.user)
+            messages.success(
+                request, "Settings saved succesfully. Technical Analysis refresh queued."
+            )
+            return redirect_to_job(job)
     else:
         form = TechnicalAnalysisSettingsForm(instance=user_ta_settings)
 
@@ -60,21 +107,18 @@ def refresh_technical_analysis(request: HttpRequest) -> HttpResponse:
     """
     View function to refresh the user's technical analysis data.
 
-    This function retrieves or creates the user's technical analysis settings,
-    updates the analysis data, and informs the user upon successful completion.
+    This function enqueues a background job updating the analysis data and returns at
+    once; the technical analysis page polls the job and reloads when it is finished.
 
     Args:
         request: The HTTP request object.
 
     Returns:
-        HttpResponseRedirect: Redirects to the technical analysis page after refreshing the data.
+        HttpResponseRedirect: Redirects to the technical analysis page after enqueuing the job.
     """
-    user_ta_settings, created = TechnicalAnalysisSettings.objects.get_or_create(
-        user=request.user
-    )
-    fetch_and_save_df(user_ta_settings)
-    messages.success(request, "Technical Analysis refreshed successfully")
-    return redirect("show_technical_analysis")
+    job = enqueue_job("technical_analysis", request.user)
+    messages.success(request, "Technical Analysis refresh queued.")
+    return redirect_to_job(job)
 
 
 @exception_handler(default_return=lambda: redirect("show_technical_analysis"))
@@ -82,20 +126,20 @@ def refresh_sentiment_analysis(request: HttpRequest) -> HttpResponse:
     """
     Refreshes the market sentiment analysis data.
 
-    This view triggers the sentiment analysis update by fetching new 
-    cryptocurrency news, analyzing their sentiment, and updating the database. 
-    After the process is completed, the user is redirected to the 
-    technical analysis page with a success message.
+    This view enqueues a background job fetching new cryptocurrency news, analyzing
+    their sentiment, and updating the database. The user is redirected to the
+    technical analysis page at once, which polls the job.
 
     Args:
         request (HttpRequest): The HTTP request object.
 
     Returns:
-        HttpResponseRedirect: Redirects to the technical analysis page after refreshing the sentiment data.
+        HttpResponseRedirect: Redirects to the technical analysis page after enqueuing the job.
     """
-    fetch_and_save_sentiment_analysis()
-    messages.success(request, "Sentiment Analysis refreshed successfully.")
-    return redirect("show_technical_analysis")
+    user = request.user if request.user.is_authenticated else None
+    job = enqueue_job("sentiment_analysis", user)
+    messages.success(request, "Sentiment Analysis refresh queued.")
+    return redirect_to_job(job)
 
 
 @exception_handler(default_return=lambda: redirect("show_technical_analysis"))
@@ -103,42 +147,40 @@ def refresh_gpt_analysis_all_users(request: HttpRequest) -> HttpResponse:
     """
     Refreshes the AI-GPT market analysis.
 
-    This view triggers the gpt analysis update by fetching new 
-    gpt response and updating the database. 
-    After the process is completed, the user is redirected to the 
-    technical analysis page with a success message.
+    This view enqueues a background job fetching new gpt responses and
+    updating the database. The user is redirected to the technical analysis
+    page at once, which polls the job.
 
     Args:
         request (HttpRequest): The HTTP request object.
 
     Returns:
-        HttpResponseRedirect: Redirects to the technical analysis page after refreshing the gpt analysis data.
+        HttpResponseRedirect: Redirects to the technical analysis page after enqueuing the job.
     """
     if not request.user.is_superuser:
         messages.error(request, "You do not have permission to refresh AI-GPT Analysis for all users.")
         return redirect("show_technical_analysis")
     
-    fetch_save_and_send_gpt_analysis()
-    messages.success(request, "AI-GPT Analysis for all users refreshed successfully.")
-    return redirect("show_technical_analysis")
+    job = enqueue_job("gpt_analysis_all", request.user)
+    messages.success(request, "AI-GPT Analysis refresh for all users queued.")
+    return redirect_to_job(job)
 
 
 @exception_handler(default_return=lambda: redirect("show_technical_analysis"))
 def refresh_gpt_analysis_selected_user(request: HttpRequest) -> HttpResponse:
     """
     Refreshes the AI-GPT market analysis for the logged-in user.
-    This view triggers the gpt analysis update by fetching new 
-    gpt response for the logged-in user and updating the database. 
-    After the process is completed, the user is redirected to the 
-    technical analysis page with a success message.
+    This view enqueues a background job fetching a new gpt response for the
+    logged-in user and updating the database. The user is redirected to the
+    technical analysis page at once, which polls the job.
     """
     if not request.user.is_authenticated:
         messages.error(request, "You must be logged in to refresh your AI-GPT Analysis.")
         return redirect("show_technical_analysis")
     
-    fetch_save_and_send_gpt_analysis(username=request.user.username)
-    messages.success(request, f"AI-GPT Analysis for {request.user.username} refreshed successfully.")
-    return redirect("show_technical_analysis")
+    job = enqueue_job("gpt_analysis", request.user)
+    messages.success(request, f"AI-GPT Analysis refresh for {request.user.username} queued.")
+    return redirect_to_job(job)
 
 
 @exception_handler(default_return=lambda: redirect("show_technical_analysis"))
@@ -147,9 +189,17 @@ def show_technical_analysis(request: HttpRequest) -> HttpResponse:
     View function to display technical analysis data.
 
     This view is accessible to both authenticated users and guests. If a user is authenticated,
-    their saved settings are loaded or created. If a guest accesses the page, a guest account
-    is used to generate technical analysis data. Users can select technical indicators to be
-    displayed, and the latest data is fetched and plotted accordingly.
+    their saved settings are loaded or created. If a guest accesses the page, the snapshot of
+    the shared guest account is shown: it is refreshed in the background by
+    `refresh_guest_snapshot`, so anonymous views never fetch anything. A missing sentiment
+    or AI-GPT analysis of an authenticated user is fetched by a background job the page
+    polls, see `enqueue_missing_analysis_job`. Users can select technical indicators to
+    be displayed, and the latest data is plotted accordingly.
+
+    The chart is rendered in the browser from `technical_analysis_chart_data`, or as a
+    server-side PNG with `?chart=png` (the default mode is `settings.ANALYSIS_CHART_MODE`).
+    The chart and the latest data points are cached per data version and plot settings,
+    so repeated views skip the indicator calculation and the rendering.
 
     Args:
         request: The HTTP request object.
@@ -162,34 +212,48 @@ def show_technical_analysis(request: HttpRequest) -> HttpResponse:
             user=request.user
         )
     else:
-        guest_user, created = UserProfile.objects.get_or_create(username="guest")
-        user_ta_settings, created = TechnicalAnalysisSettings.objects.get_or_create(
-            user=guest_user
-        )
-        fetch_and_save_df(user_ta_settings)
+        user_ta_settings = get_guest_settings()
 
     if request.method == "POST":
         selected_indicators = request.POST.getlist("indicators")
         user_ta_settings.selected_plot_indicators = ",".join(selected_indicators)
         user_ta_settings.save()
 
-    df_loaded = pd.read_json(StringIO(user_ta_settings.df))
-    if df_loaded is None or df_loaded.empty:
-        messages.success(request, "Error loading data.")
-        return render(request, "analysis/show_analysis.html")
-
-    df_calculated = calculate_ta_indicators(df_loaded, user_ta_settings)
-    if df_calculated is None or df_calculated.empty:
-        messages.success(request, "Error calculating Technical Analysis.")
-        return render(request, "analysis/show_analysis.html")
+    chart_mode = request.GET.get("chart", settings.ANALYSIS_CHART_MODE)
+    if chart_mode not in ("interactive", "png"):
+        chart_mode = settings.ANALYSIS_CHART_MODE
+
+    chart = get_cached_chart(user_ta_settings, chart_mode)
+    if chart is None:
+        df_loaded = pd.read_json(StringIO(user_ta_settings.df))
+        if df_loaded is None or df_loaded.empty:
+            messages.success(request, "Error loading data.")
+            return render(request, "analysis/show_analysis.html")
+
+        df_calculated = calculate_ta_indicators(df_loaded, user_ta_settings)
+        if df_calculated is None or df_calculated.empty:
+            messages.success(request, "Error calculating Technical Analysis.")
+            return render(request, "analysis/show_analysis.html")
+
+        chart = {
+            "latest_data": df_calculated.iloc[-1].to_dict(),
+            "previous_data": df_calculated.iloc[-2].to_dict(),
+            "plot_url": None,
+        }
+        if chart_mode == "png":
+            chart["plot_url"] = plot_selected_ta_indicators(
+                df_calculated, user_ta_settings
+            )
+        if chart_mode != "png" or chart["plot_url"]:
+            cache_chart(user_ta_settings, chart, chart_mode)
 
-    latest_data = df_calculated.iloc[-1].to_dict()
-    previous_data = df_calculated.iloc[-2].to_dict()
+    latest_data = chart["latest_data"]
+    previous_data = chart["previous_data"]
+    plot_url = chart["plot_url"]
 
     selected_indicators_list = prepare_selected_indicators_list(
         user_ta_settings.selected_plot_indicators
     )
-    plot_url = plot_selected_ta_indicators(df_calculated, user_ta_settings)
     indicators_list = [
         "close",
         "rsi",
@@ -210,24 +274,14 @@ def show_technical_analysis(request: HttpRequest) -> HttpResponse:
     ]
 
     sentiment_analysis = SentimentAnalysis.objects.filter(id=1).first()
-    if not sentiment_analysis:
-        fetch_and_save_sentiment_analysis()
-        sentiment_analysis = SentimentAnalysis.objects.filter(id=1).first()
-        
     gpt_analysis = user_ta_settings.gpt_response
-    if not gpt_analysis:
-        fetch_and_save_sentiment_analysis()
-        fetch_save_and_send_gpt_analysis()
-        if request.user.is_authenticated:
-            user_ta_settings, created = TechnicalAnalysisSettings.objects.get_or_create(
-                user=request.user
-            )
-        else:
-            guest_user, created = UserProfile.objects.get_or_create(username="guest")
-            user_ta_settings, created = TechnicalAnalysisSettings.objects.get_or_create(
-                user=guest_user
-            )
-        gpt_analysis = user_ta_settings.gpt_response
+
+    job_id = request.GET.get("job", "")
+    job_id = int(job_id) if job_id.isdigit() else None
+    if job_id is None and request.user.is_authenticated:
+        job_id = enqueue_missing_analysis_job(
+            request.user, user_ta_settings, sentiment_analysis
+        )
 
     return render(
         request,
@@ -237,6 +291,8 @@ def show_technical_analysis(request: HttpRequest) -> HttpResponse:
             "latest_data": latest_data,
             "previous_data": previous_data,
             "plot_url": plot_url,
+            "chart_mode": chart_mode,
+            "job_id": job_id,
             "selected_indicators_list": selected_indicators_list,
             "indicators_list": indicators_list,
             "sentiment_analysis": sentiment_analysis,
@@ -245,6 +301,50 @@ def show_technical_analysis(request: HttpRequest) -> HttpResponse:
     )
 
 
+@exception_handler(
+    default_return=lambda: JsonResponse({"error": "Chart unavailable."}, status=500)
+)
+def technical_analysis_chart_data(request: HttpRequest) -> JsonResponse:
+    """
+    Returns the series of the technical analysis chart as JSON, for rendering it in the
+    browser.
+
+    The series cover the visible lookback window of the plotted indicators and are
+    downsampled to `settings.ANALYSIS_CHART_MAX_POINTS` points, see
+    `build_chart_series`. They are cached per data version and plot settings.
+
+    Args:
+        request: The HTTP request object.
+
+    Returns:
+        JsonResponse: The chart series, or an error with status 404.
+    """
+    if request.user.is_authenticated:
+        user_ta_settings = TechnicalAnalysisSettings.objects.filter(
+            user=request.user
+        ).first()
+    else:
+        user_ta_settings = TechnicalAnalysisSettings.objects.filter(
+            user__username=GUEST_USERNAME
+        ).first()
+    if user_ta_settings is None:
+        return JsonResponse({"error": "No Technical Analysis settings."}, status=404)
+
+    series = get_cached_chart(user_ta_settings, "series")
+    if series is None:
+        df_loaded = pd.read_json(StringIO(user_ta_settings.df))
+        df_calculated = calculate_ta_indicators(df_loaded, user_ta_settings)
+        if df_calculated is None or df_calculated.empty:
+            return JsonResponse({"error": "No data available."}, status=404)
+        series = build_chart_series(
+            df_calculated, user_ta_settings, settings.ANALYSIS_CHART_MAX_POINTS
+        )
+        if series is None:
+            return JsonResponse({"error": "No data available."}, status=404)
+        cache_chart(user_ta_settings, series, "series")
+    return JsonResponse(series)
+
+
 @exception_handler(default_return=lambda: redirect("show_technical_analysis"))
 @login_required
 def send_email_analysis_report(request: HttpRequest) -> HttpResponse:
@@ -282,14 +382,8 @@ def send_email_analysis_report(request: HttpRequest) -> HttpResponse:
         ai_response = user_ta_settings.gpt_response
         ta_subject, ta_content = generate_ta_report_email(user_ta_settings, df_calculated)
         ai_subject, ai_content = generate_gpt_analyse_msg_content(ai_response)
-        ai_content += (
-            f"\n\n-- \n\n"
-            "FomoSapiensCryptoDipHunter\nhttps://fomo.ropeaccess.pro\n\n"
-            "StefanCryptoTradingBot\nhttps://stefan.ropeaccess.pro\n\n"
-            "CodeCave\nhttps://cave.ropeaccess.pro\n"
-        )
         send_email(email, ta_subject, ta_content)
-        send_email(email, ai_subject, ai_content)
+        send_email(email, ai_subject, ai_content + EMAIL_SIGNATURE)
 
     messages.success(request, "Email sent successfully.")
     return redirect("show_technical_analysis")
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import UserProfile
+from .models import UserProfile, SchedulerLease, NotificationOutbox, BackgroundJob
 
 
 class UserProfileAdmin(UserAdmin):
@@ -14,6 +14,7 @@ class UserProfileAdmin(UserAdmin):
                     "telegram_signals_receiver",
                     "telegram_gpt_analysis_receiver",
                     "telegram_chat_id",
+                    "signals_digest",
                 )
             },
         ),
@@ -21,3 +22,39 @@ class UserProfileAdmin(UserAdmin):
 
 
 admin.site.register(UserProfile, UserProfileAdmin)
+
+
+class SchedulerLeaseAdmin(admin.ModelAdmin):
+    list_display = ("name", "holder", "acquired_at", "renewed_at", "expires_at")
+    readonly_fields = ("acquired_at", "renewed_at")
+
+
+admin.site.register(SchedulerLease, SchedulerLeaseAdmin)
+
+
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "channel",
+        "category",
+        "recipient",
+        "status",
+        "attempts",
+        "created_at",
+        "sent_at",
+    )
+    list_filter = ("status", "channel", "category", "digest")
+    search_fields = ("recipient", "subject", "dedup_key")
+    readonly_fields = ("created_at", "sent_at", "last_error")
+
+
+admin.site.register(NotificationOutbox, NotificationOutboxAdmin)
+
+
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "user", "status", "created_at", "finished_at")
+    list_filter = ("status", "kind")
+    readonly_fields = ("created_at", "started_at", "finished_at", "error")
+
+
+admin.site.register(BackgroundJob, BackgroundJobAdmin)
@@ -0,0 +1,39 @@
+"""
+Management command running the background scheduler in a dedicated worker process.
+
+Usage:
+    python manage.py run_hunter_worker [--lease-name scheduler] [--lease-ttl 30]
+
+Web processes never start the scheduler. Start one or more workers next to gunicorn:
+the worker holding the database lease runs the hunters, sentiment, GPT and housekeeping
+jobs, the others take over within one lease TTL if it dies.
+"""
+
+import signal
+import threading
+from django.core.management.base import BaseCommand
+from fomo_sapiens.utils.worker_utils import SchedulerWorker
+
+
+class Command(BaseCommand):
+    help = "Runs the hunter scheduler worker until SIGINT or SIGTERM."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lease-name", default=None, help="Scheduler lease name.")
+        parser.add_argument(
+            "--lease-ttl", type=float, default=None, help="Lease TTL in seconds."
+        )
+
+    def handle(self, *args, **options):
+        stop_event = threading.Event()
+
+        def stop(signum, frame):
+            self.stdout.write(f"Received signal {signum}, stopping worker...")
+            stop_event.set()
+
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGTERM, stop)
+
+        worker = SchedulerWorker(options["lease_name"], options["lease_ttl"])
+        self.stdout.write(f"Hunter worker {worker.elector.holder} running.")
+        worker.run(stop_event)
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 
 
 class UserProfile(AbstractUser):
@@ -8,6 +9,153 @@ class UserProfile(AbstractUser):
     telegram_gpt_analysis_receiver = models.BooleanField(default=True)
     email_signals_receiver = models.BooleanField(default=True)
     email_gpt_analysis_receiver = models.BooleanField(default=True)
+    signals_digest = models.BooleanField(default=True)
 
     def __str__(self):
         return self.username
+
+
+class SchedulerLease(models.Model):
+    """
+    Model storing a named lease used for leader election between processes and hosts.
+
+    The process holding an unexpired lease is the leader (e.g. the only one running the
+    scheduler). The leader renews `expires_at` on every heartbeat; when it stops doing so
+    any other process can take the lease over once it expires.
+
+    Attributes:
+        name (str): The lease name, e.g. 'scheduler'.
+        holder (str): The identity of the holding process, empty when released.
+        acquired_at (DateTimeField): When the current holder acquired the lease.
+        renewed_at (DateTimeField): When the lease was last renewed.
+        expires_at (DateTimeField): When the lease expires unless renewed.
+    """
+
+    name = models.CharField(max_length=64, unique=True)
+    holder = models.CharField(max_length=255, blank=True, default="")
+    acquired_at = models.DateTimeField(null=True, blank=True)
+    renewed_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.name} {self.holder or 'free'}"
+
+
+class NotificationOutbox(models.Model):
+    """
+    Model storing a Telegram message or email waiting to be delivered.
+
+    Hunters and the GPT job append a row instead of calling Telegram or SMTP inline; the
+    dispatcher job of `fomo_sapiens.utils.outbox_utils` delivers due rows in batches,
+    retries failures with exponential backoff and records the outcome. Rows with the
+    same `dedup_key` are only queued once. Due `digest` rows of one recipient and
+    channel are merged into a single digest message.
+
+    Attributes:
+        user (ForeignKey): The recipient user, if any.
+        channel (str): 'telegram' or 'email'.
+        category (str): What the message is about, e.g. 'signal' or 'gpt'.
+        recipient (str): The Telegram chat ID or the email address.
+        subject (str): The email subject, unused for Telegram.
+        body (str): The message content.
+        summary (str): The one-line summary of the message shown in digests.
+        digest (bool): Whether the message may be merged into a digest.
+        dedup_key (str): Identifies a logical message, None to never deduplicate.
+        status (str): 'pending', 'sending', 'sent' or 'failed'.
+        attempts (int): Delivery attempts so far.
+        next_attempt_at (DateTimeField): When the row is due for the next attempt.
+        last_error (str): The error of the last failed attempt.
+        created_at (DateTimeField): When the row was queued.
+        sent_at (DateTimeField): When the message was delivered.
+    """
+
+    CHANNEL_CHOICES = [("telegram", "Telegram"), ("email", "Email")]
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    user = models.ForeignKey(
+        UserProfile,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="notifications",
+    )
+    channel = models.CharField(max_length=16, choices=CHANNEL_CHOICES)
+    category = models.CharField(max_length=32, default="signal")
+    recipient = models.CharField(max_length=512)
+    subject = models.CharField(max_length=255, blank=True, default="")
+    body = models.TextField()
+    summary = models.CharField(max_length=255, blank=True, default="")
+    digest = models.BooleanField(default=False)
+    dedup_key = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+        verbose_name_plural = "notification outbox"
+
+    def __str__(self):
+        return f"{self.channel} {self.recipient} {self.status}"
+
+
+class BackgroundJob(models.Model):
+    """
+    Model storing a user-triggered refresh running in the scheduler worker.
+
+    Views enqueue a row and return at once instead of calling Binance, the news feeds or
+    OpenAI inside the request; the runner job of `fomo_sapiens.utils.job_utils` runs
+    pending rows in order and records the outcome, which the page polls through the
+    job status endpoint. A user has at most one pending or running job of each kind.
+
+    Attributes:
+        user (ForeignKey): The user who triggered the job, None for guests.
+        kind (str): What the job refreshes, see `fomo_sapiens.utils.job_utils.JOB_HANDLERS`.
+        status (str): 'pending', 'running', 'done' or 'failed'.
+        error (str): The error of a failed job.
+        created_at (DateTimeField): When the job was enqueued.
+        started_at (DateTimeField): When the runner started the job.
+        finished_at (DateTimeField): When the job finished.
+    """
+
+    KIND_CHOICES = [
+        ("technical_analysis", "Technical Analysis refresh"),
+        ("sentiment_analysis", "Sentiment Analysis refresh"),
+        ("gpt_analysis", "AI-GPT Analysis refresh"),
+        ("gpt_analysis_all", "AI-GPT Analysis refresh for all users"),
+        ("hunter_dfs", "Sleeping hunters refresh"),
+    ]
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    user = models.ForeignKey(
+        UserProfile,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="background_jobs",
+    )
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"{self.kind} {self.user or 'guest'} {self.status}"
@@ -115,6 +115,47 @@ DATABASES = {
     }
 }
 
+# "shared" is visible to every gunicorn worker and to the hunter worker process.
+SHARED_CACHE_DIR = Path(os.environ.get("SHARED_CACHE_DIR", BASE_DIR / "cache"))
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": SHARED_CACHE_DIR,
+        "OPTIONS": {"MAX_ENTRIES": 2000},
+    },
+    # Rendered analysis charts, a few hundred KB each, see analysis.utils.chart_cache_utils.
+    "charts": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": SHARED_CACHE_DIR / "charts",
+        "TIMEOUT": int(os.environ.get("CHART_CACHE_TIMEOUT", 86400)),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.environ.get("CHART_CACHE_MAX_ENTRIES", 300)),
+            "CULL_FREQUENCY": 4,
+        },
+    },
+}
+
+# "interactive" renders the analysis chart in the browser from a downsampled JSON
+# series of at most ANALYSIS_CHART_MAX_POINTS points, "png" renders it server-side.
+ANALYSIS_CHART_MODE = os.environ.get("ANALYSIS_CHART_MODE", "interactive")
+ANALYSIS_CHART_MAX_POINTS = int(os.environ.get("ANALYSIS_CHART_MAX_POINTS", 500))
+# The home and 404 pages show the Binance status cached by a scheduler job every
+# `refresh_seconds`, see analysis.utils.exchange_status_utils.
+EXCHANGE_STATUS = {
+    "refresh_seconds": int(os.environ.get("EXCHANGE_STATUS_REFRESH_SECONDS", 30)),
+    "ttl": int(os.environ.get("EXCHANGE_STATUS_TTL", 120)),
+    "local_ttl": 5,
+}
+# Guests are served a snapshot refreshed by a scheduler job every `refresh_seconds`,
+# see analysis.utils.guest_utils.
+GUEST_SNAPSHOT = {
+    "refresh_seconds": int(os.environ.get("GUEST_SNAPSHOT_REFRESH_SECONDS", 60)),
+    "lease_ttl": 300,
+}
+
 AUTH_USER_MODEL = "fomo_sapiens.UserProfile"
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -209,7 +250,90 @@ USE_TZ = True
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+SCHEDULER_EXECUTORS = {
+    "hunters": int(os.environ.get("SCHEDULER_HUNTERS_WORKERS", 2)),
+    "external": int(os.environ.get("SCHEDULER_EXTERNAL_WORKERS", 2)),
+    "refresh": int(os.environ.get("SCHEDULER_REFRESH_WORKERS", 2)),
+    "jobs": int(os.environ.get("SCHEDULER_JOBS_WORKERS", 1)),
+    "housekeeping": int(os.environ.get("SCHEDULER_HOUSEKEEPING_WORKERS", 1)),
+    "notifications": int(os.environ.get("SCHEDULER_NOTIFICATIONS_WORKERS", 1)),
+}
+SCHEDULER_METRICS_INTERVAL_MINUTES = 15
+SCHEDULER_WAIT_WARNING_SECONDS = 60
+# Exactly one `run_hunter_worker` process holding the database lease runs the
+# scheduler, see fomo_sapiens.utils.leader_utils.
+SCHEDULER_LEASE_NAME = "scheduler"
+SCHEDULER_LEASE_TTL_SECONDS = int(os.environ.get("SCHEDULER_LEASE_TTL_SECONDS", 30))
+
+HUNTER_PIPELINE = {
+    "fetch_workers": int(os.environ.get("HUNTER_PIPELINE_FETCH_WORKERS", 4)),
+    "compute_workers": int(os.environ.get("HUNTER_PIPELINE_COMPUTE_WORKERS", 2)),
+    "notify_workers": int(os.environ.get("HUNTER_PIPELINE_NOTIFY_WORKERS", 4)),
+    "queue_size": int(os.environ.get("HUNTER_PIPELINE_QUEUE_SIZE", 8)),
+}
+HUNTER_TELEMETRY_RETENTION_DAYS = int(
+    os.environ.get("HUNTER_TELEMETRY_RETENTION_DAYS", 14)
+)
+# Seconds after the candle close by which a hunter tick should finish, the next
+# tick starts a minute after it.
+HUNTER_TICK_DEADLINE_SECONDS = 50
+
+# Rows per UPDATE/INSERT statement when a hunter tick writes its data in bulk.
+HUNTER_BULK_UPDATE_BATCH_SIZE = int(
+    os.environ.get("HUNTER_BULK_UPDATE_BATCH_SIZE", 200)
+)
+
+# Telegram allows about 30 messages per second overall and one per second per chat.
+TELEGRAM_API_BASE_URL = os.environ.get(
+    "TELEGRAM_API_BASE_URL", "https://api.telegram.org/bot"
+)
+TELEGRAM_NOTIFIER = {
+    "max_concurrency": int(os.environ.get("TELEGRAM_NOTIFIER_CONCURRENCY", 8)),
+    "global_rate": float(os.environ.get("TELEGRAM_NOTIFIER_GLOBAL_RATE", 30)),
+    "chat_interval": float(os.environ.get("TELEGRAM_NOTIFIER_CHAT_INTERVAL", 1)),
+    "max_attempts": int(os.environ.get("TELEGRAM_NOTIFIER_MAX_ATTEMPTS", 3)),
+}
+
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+# Hunters and the GPT job queue notifications in the outbox table, a scheduler
+# job delivers them every `poll_seconds`, see fomo_sapiens.utils.outbox_utils.
+NOTIFICATION_OUTBOX = {
+    "poll_seconds": int(os.environ.get("NOTIFICATION_OUTBOX_POLL_SECONDS", 5)),
+    "batch_size": int(os.environ.get("NOTIFICATION_OUTBOX_BATCH_SIZE", 100)),
+    "max_attempts": int(os.environ.get("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", 5)),
+    "backoff_seconds": 30,
+    "max_backoff_seconds": 3600,
+    "send_timeout": 120,
+    "retention_days": int(os.environ.get("NOTIFICATION_OUTBOX_RETENTION_DAYS", 7)),
+}
+# Signals of users with `signals_digest` wait `delay_seconds` in the outbox, then all
+# signals of the user and channel go out as one digest of up to `max_messages`
+# signals, Telegram digests are also split at `max_chars`.
+NOTIFICATION_DIGEST = {
+    "delay_seconds": int(os.environ.get("NOTIFICATION_DIGEST_DELAY_SECONDS", 30)),
+    "max_messages": int(os.environ.get("NOTIFICATION_DIGEST_MAX_MESSAGES", 20)),
+    "max_chars": 4000,
+}
+# Refreshes triggered from the analysis page are enqueued as background jobs, the
+# scheduler worker runs them every `poll_seconds`, see fomo_sapiens.utils.job_utils.
+BACKGROUND_JOBS = {
+    "poll_seconds": int(os.environ.get("BACKGROUND_JOBS_POLL_SECONDS", 2)),
+    "batch_size": 10,
+    "timeout": int(os.environ.get("BACKGROUND_JOBS_TIMEOUT", 900)),
+    "retention_days": 7,
+}
+# Errors caught by exception_handler are counted per function and exception type,
+# the admins get the first one at once and then a summary every `flush_interval`.
+ERROR_REPORTING = {
+    "flush_interval": float(os.environ.get("ERROR_REPORTING_FLUSH_INTERVAL", 300)),
+    "max_fingerprints": 100,
+}
+# Queued emails are sent together after `batch_delay` seconds over one SMTP
+# connection, closed after `idle_timeout` seconds without emails.
+EMAIL_DISPATCHER = {
+    "batch_delay": float(os.environ.get("EMAIL_DISPATCHER_BATCH_DELAY", 0.5)),
+    "idle_timeout": float(os.environ.get("EMAIL_DISPATCHER_IDLE_TIMEOUT", 60)),
+}
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
@@ -0,0 +1,62 @@
+const {
+  buildChartTraces,
+  buildChartShapes,
+  loadChart,
+} = require("../../static/js/chart");
+
+const data = {
+  symbol: "BTCUSDC",
+  interval: "1h",
+  t: [1737702000000, 1737705600000, 1737709200000],
+  series: { close: [100.5, 101, null], psar: [99, 99.5, 100] },
+  traces: [
+    { column: "close", name: "Close Price", color: "blue", mode: "lines" },
+    { column: "psar", name: "PSAR", color: "red", mode: "markers" },
+  ],
+  lines: [{ y: 70, color: "red" }, { y: 30, color: "green" }],
+};
+
+describe("Chart rendering", () => {
+  test("buildChartTraces maps the compact series to Plotly traces", () => {
+    const traces = buildChartTraces(data);
+
+    expect(traces).toHaveLength(2);
+    expect(traces[0].x[0].getTime()).toBe(1737702000000);
+    expect(traces[0].y).toEqual([100.5, 101, null]);
+    expect(traces[0].line.color).toBe("blue");
+    expect(traces[1].mode).toBe("markers");
+    expect(traces[1].marker.color).toBe("red");
+  });
+
+  test("buildChartShapes spans the threshold lines over the window", () => {
+    const shapes = buildChartShapes(data);
+
+    expect(shapes.map(shape => shape.y0)).toEqual([70, 30]);
+    expect(shapes[0].x1.getTime()).toBe(1737709200000);
+    expect(buildChartShapes({ ...data, t: [] })).toEqual([]);
+  });
+
+  test("loadChart fetches the series and renders them", async () => {
+    document.body.innerHTML = `<div id="ta-chart" data-url="/analysis/chart-data/">Loading</div>`;
+    const container = document.getElementById("ta-chart");
+    const fetchFn = jest.fn(() => Promise.resolve({ ok: true, json: () => Promise.resolve(data) }));
+    const plotly = { newPlot: jest.fn() };
+
+    await loadChart(container, fetchFn, plotly);
+
+    expect(fetchFn.mock.calls[0][0]).toBe("/analysis/chart-data/");
+    expect(plotly.newPlot).toHaveBeenCalledTimes(1);
+    expect(plotly.newPlot.mock.calls[0][1]).toHaveLength(2);
+  });
+
+  test("loadChart shows a message when the series are unavailable", async () => {
+    document.body.innerHTML = `<div id="ta-chart" data-url="/analysis/chart-data/"></div>`;
+    const container = document.getElementById("ta-chart");
+    const fetchFn = jest.fn(() => Promise.resolve({ ok: false, status: 404 }));
+    jest.spyOn(console, "error").mockImplementation(() => {});
+
+    await loadChart(container, fetchFn, { newPlot: jest.fn() });
+
+    expect(container.textContent).toBe("No data available for Technical Analysis Plot.");
+  });
+});
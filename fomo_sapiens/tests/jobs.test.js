@@ -0,0 +1,36 @@
+const { handleJobStatus, pollJob } = require("../../static/js/jobs");
+
+function createContainer() {
+  document.body.innerHTML = `<div id="background-job" class="alert alert-info" data-url="/jobs/7/" data-done-url="/analysis/">Refresh in progress...</div>`;
+  return document.getElementById("background-job");
+}
+
+describe("Background job polling", () => {
+  test("reloads the page when the job is done", () => {
+    const container = createContainer();
+    const navigate = jest.fn();
+
+    expect(handleJobStatus(container, { status: "done" }, navigate)).toBe(true);
+    expect(navigate).toHaveBeenCalledWith("/analysis/");
+  });
+
+  test("shows the error of a failed job", () => {
+    const container = createContainer();
+
+    expect(handleJobStatus(container, { status: "failed", error: "Timed out." }, jest.fn())).toBe(true);
+    expect(container.textContent).toBe("Refresh failed: Timed out.");
+    expect(container.classList.contains("alert-danger")).toBe(true);
+  });
+
+  test("polls again while the job is pending", async () => {
+    const container = createContainer();
+    const fetchFn = jest.fn(() => Promise.resolve({ ok: true, json: () => Promise.resolve({ status: "running" }) }));
+    const schedule = jest.fn();
+
+    await pollJob(container, fetchFn, jest.fn(), schedule);
+
+    expect(fetchFn.mock.calls[0][0]).toBe("/jobs/7/");
+    expect(schedule).toHaveBeenCalledTimes(1);
+    expect(schedule.mock.calls[0][1]).toBe(2000);
+  });
+});
@@ -0,0 +1,120 @@
+import smtplib
+from unittest.mock import patch
+import pandas as pd
+from django.core import mail
+from django.core.mail import get_connection
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from fomo_sapiens.utils.email_utils import (
+    EmailDispatcher,
+    get_email_dispatcher,
+    send_admin_email,
+)
+
+
+class EmailDispatcherTestCase(TestCase):
+
+    @patch("fomo_sapiens.utils.email_utils.get_connection", wraps=get_connection)
+    def test_flushes_reuse_one_connection(self, mock_get_connection):
+        dispatcher = EmailDispatcher(batch_delay=60)
+        self.addCleanup(dispatcher.stop)
+
+        for i in range(3):
+            dispatcher.enqueue(f"user{i}@example.com", "Signal", "Body")
+        self.assertEqual(dispatcher.flush(), 3)
+        dispatcher.enqueue("user9@example.com", "Report", "Body")
+        self.assertEqual(dispatcher.flush(), 1)
+
+        self.assertEqual(mock_get_connection.call_count, 1)
+        self.assertEqual(len(mail.outbox), 4)
+        self.assertEqual(mail.outbox[3].to, ["user9@example.com"])
+        self.assertEqual(dispatcher.sent, 4)
+
+    def test_thread_sends_queued_emails_on_stop(self):
+        dispatcher = EmailDispatcher(batch_delay=60)
+
+        dispatcher.enqueue("user@example.com", "Signal", "Body")
+        dispatcher.stop()
+
+        self.assertEqual([message.subject for message in mail.outbox], ["Signal"])
+
+    def test_retry_resends_only_unsent_emails(self):
+        dispatcher = EmailDispatcher(batch_delay=60)
+        self.addCleanup(dispatcher.stop)
+        connection = get_connection()
+        send_messages = connection.send_messages
+        calls = []
+
+        def flaky_send_messages(messages):
+            calls.append(messages[0].to)
+            if len(calls) == 2:
+                raise ConnectionError("Connection reset")
+            return send_messages(messages)
+
+        connection.send_messages = flaky_send_messages
+        dispatcher._connection = connection
+        for i in range(3):
+            dispatcher.enqueue(f"user{i}@example.com", "Signal", "Body")
+
+        with patch("fomo_sapiens.utils.email_utils.get_connection") as mock_get:
+            mock_get.return_value = connection
+            with patch("fomo_sapiens.utils.retry_connection.time.sleep"):
+                self.assertEqual(dispatcher.flush(), 3)
+
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [["user0@example.com"], ["user1@example.com"], ["user2@example.com"]],
+        )
+        self.assertEqual((dispatcher.sent, dispatcher.failed), (3, 0))
+
+    def test_refused_recipient_does_not_stop_the_others(self):
+        dispatcher = EmailDispatcher(batch_delay=60)
+        self.addCleanup(dispatcher.stop)
+        connection = get_connection()
+        send_messages = connection.send_messages
+
+        def refusing_send_messages(messages):
+            if messages[0].to == ["bad@example.com"]:
+                raise smtplib.SMTPRecipientsRefused(
+                    {"bad@example.com": (550, b"No such user")}
+                )
+            return send_messages(messages)
+
+        connection.send_messages = refusing_send_messages
+        dispatcher._connection = connection
+        for email in ("user1@example.com", "bad@example.com", "user3@example.com"):
+            dispatcher.enqueue(email, "Signal", "Body")
+
+        with patch("fomo_sapiens.utils.retry_connection.time.sleep") as mock_sleep:
+            self.assertEqual(dispatcher.flush(), 2)
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [["user1@example.com"], ["user3@example.com"]],
+        )
+        self.assertEqual((dispatcher.sent, dispatcher.failed), (2, 1))
+        self.assertEqual(
+            dispatcher.deliver(
+                [
+                    ("bad@example.com", "Report", "Body"),
+                    ("user4@example.com", "Report", "Body"),
+                ]
+            )[1],
+            None,
+        )
+
+    @patch("analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([]))
+    def test_send_admin_email_sends_one_message_per_admin(self, _):
+        for name in ("admin1", "admin2"):
+            get_user_model().objects.create_superuser(
+                username=name, password="testpassword", email=f"{name}@example.com"
+            )
+
+        send_admin_email("Admin Subject", "Admin Body")
+        get_email_dispatcher().stop()
+
+        self.assertEqual(
+            sorted(message.to for message in mail.outbox),
+            [["admin1@example.com"], ["admin2@example.com"]],
+        )
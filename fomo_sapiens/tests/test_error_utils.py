@@ -0,0 +1,54 @@
+import time
+import unittest
+from unittest.mock import patch
+from fomo_sapiens.utils.error_utils import ErrorAggregator
+
+
+@patch("fomo_sapiens.utils.email_utils.get_email_dispatcher")
+@patch("fomo_sapiens.utils.email_utils.send_admin_email")
+class ErrorAggregatorTestCase(unittest.TestCase):
+
+    def wait_for_calls(self, mock, count, timeout=5):
+        deadline = time.monotonic() + timeout
+        while mock.call_count < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_first_error_is_reported_then_summarized(self, mock_send, _):
+        aggregator = ErrorAggregator(flush_interval=60)
+
+        aggregator.record("fetch_data", "ConnectionError", "Binance down")
+        self.wait_for_calls(mock_send, 1)
+        self.assertEqual(mock_send.call_args.args[0], "ConnectionError in fetch_data")
+
+        for i in range(50):
+            aggregator.record("fetch_data", "ConnectionError", f"Binance down {i}")
+        aggregator.record("send_telegram", "TimeoutError", "timed out")
+        time.sleep(0.1)
+        self.assertEqual(mock_send.call_count, 1)
+
+        aggregator.stop()
+
+        self.assertEqual(mock_send.call_count, 2)
+        subject, body = mock_send.call_args.args
+        self.assertEqual(subject, "51 errors in 2 places")
+        self.assertIn("50x ConnectionError in fetch_data", body)
+        self.assertIn("Binance down 49", body)
+        self.assertIn("1x TimeoutError in send_telegram", body)
+        self.assertLess(body.index("ConnectionError"), body.index("TimeoutError"))
+
+    def test_fingerprints_are_bounded(self, mock_send, _):
+        aggregator = ErrorAggregator(flush_interval=60, max_fingerprints=2)
+        aggregator._last_flush = time.monotonic()
+
+        for function in ("a", "b", "c", "d"):
+            aggregator.record(function, "ValueError", "bad value")
+        aggregator.stop()
+
+        mock_send.assert_called_once()
+        subject, body = mock_send.call_args.args
+        self.assertEqual(subject, "2 errors in 2 places")
+        self.assertIn("2 more errors of other functions not counted.", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from analysis.models import SentimentAnalysis, TechnicalAnalysisSettings
+from fomo_sapiens.models import BackgroundJob
+from fomo_sapiens.utils.job_utils import (
+    JOB_HANDLERS,
+    claim_pending_jobs,
+    enqueue_job,
+    run_background_jobs,
+)
+
+
+class BackgroundJobTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = get_user_model().objects.create_user(username="alice")
+
+    def test_enqueue_returns_queued_job_of_same_kind_and_user(self):
+        job = enqueue_job("technical_analysis", self.user)
+
+        self.assertEqual(enqueue_job("technical_analysis", self.user), job)
+        self.assertNotEqual(enqueue_job("gpt_analysis", self.user), job)
+        self.assertNotEqual(enqueue_job("technical_analysis"), job)
+        with self.assertRaises(ValueError):
+            enqueue_job("unknown")
+
+    def test_run_background_jobs_records_outcome(self):
+        handler = MagicMock(side_effect=[None, RuntimeError("Binance down")])
+        done = enqueue_job("technical_analysis", self.user)
+        failed = enqueue_job("sentiment_analysis")
+
+        with patch.dict(
+            JOB_HANDLERS, technical_analysis=handler, sentiment_analysis=handler
+        ):
+            self.assertEqual(run_background_jobs(), 2)
+
+        done.refresh_from_db()
+        failed.refresh_from_db()
+        self.assertEqual(done.status, "done")
+        self.assertEqual(failed.status, "failed")
+        self.assertEqual(failed.error, "Binance down")
+        self.assertIsNotNone(failed.finished_at)
+        self.assertEqual(enqueue_job("technical_analysis", self.user).status, "pending")
+
+    def test_stale_running_job_is_failed(self):
+        job = enqueue_job("gpt_analysis", self.user)
+        now = timezone.now()
+        claim_pending_jobs(10, now)
+
+        self.assertEqual(claim_pending_jobs(10, now + timedelta(seconds=901)), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.error, "Timed out.")
+
+    @patch("analysis.utils.sentiment_utils.fetch_and_save_sentiment_analysis")
+    def test_refresh_view_enqueues_job_and_status_is_polled(self, mock_sentiment):
+        mock_sentiment.side_effect = lambda: SentimentAnalysis.objects.create(id=1)
+        response = self.client.get(reverse("refresh_sentiment_analysis"))
+        job = BackgroundJob.objects.get()
+        self.assertRedirects(
+            response,
+            f"{reverse('show_technical_analysis')}?job={job.id}",
+            fetch_redirect_response=False,
+        )
+        mock_sentiment.assert_not_called()
+
+        url = reverse("background_job_status", args=[job.id])
+        self.assertEqual(self.client.get(url).json()["status"], "pending")
+        run_background_jobs()
+        self.assertEqual(self.client.get(url).json()["status"], "done")
+        mock_sentiment.assert_called_once()
+
+        job.user = self.user
+        job.save()
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    @patch("analysis.views.calculate_ta_indicators", side_effect=lambda df, s: df)
+    @patch("analysis.utils.gpt_utils.fetch_save_and_send_gpt_analysis")
+    @patch("analysis.utils.sentiment_utils.fetch_and_save_sentiment_analysis")
+    def test_missing_analyses_are_fetched_by_jobs(self, mock_sentiment, mock_gpt, _):
+        user_ta_settings, _ = TechnicalAnalysisSettings.objects.get_or_create(
+            user=self.user
+        )
+        user_ta_settings.df = json.dumps(
+            [
+                {"open_time": 1737702000000 + i * 3600000, "close": 100 + i % 7}
+                for i in range(100)
+            ]
+        )
+        user_ta_settings.save()
+        with patch("django.contrib.auth.signals.user_logged_in.send"):
+            self.client.force_login(self.user)
+        url = reverse("show_technical_analysis")
+
+        response = self.client.get(url)
+        sentiment_job = BackgroundJob.objects.get(kind="sentiment_analysis")
+        self.assertEqual(response.context["job_id"], sentiment_job.id)
+        self.assertContains(response, "Refresh in progress")
+
+        SentimentAnalysis.objects.create(id=1)
+        response = self.client.get(url)
+        gpt_job = BackgroundJob.objects.get(kind="gpt_analysis")
+        self.assertEqual(response.context["job_id"], gpt_job.id)
+        self.assertEqual(self.client.get(f"{url}?job={gpt_job.id}").status_code, 200)
+        self.assertEqual(BackgroundJob.objects.count(), 2)
+
+        mock_sentiment.assert_not_called()
+        mock_gpt.assert_not_called()
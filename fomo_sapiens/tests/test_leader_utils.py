@@ -0,0 +1,91 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from django.test import TestCase
+from django.utils import timezone
+from fomo_sapiens.models import SchedulerLease
+from fomo_sapiens.utils.leader_utils import (
+    LeaderElector,
+    acquire_lease,
+    release_lease,
+)
+
+
+class LeaderUtilsTestCase(TestCase):
+
+    def setUp(self):
+        self.now = timezone.now()
+
+    def test_only_one_holder_acquires_lease(self):
+        self.assertTrue(acquire_lease("scheduler", "a", 30, self.now))
+        self.assertFalse(acquire_lease("scheduler", "b", 30, self.now))
+        self.assertTrue(
+            acquire_lease("scheduler", "a", 30, self.now + timedelta(seconds=10))
+        )
+
+        lease = SchedulerLease.objects.get(name="scheduler")
+        self.assertEqual(lease.holder, "a")
+        self.assertEqual(lease.acquired_at, self.now)
+        self.assertEqual(lease.expires_at, self.now + timedelta(seconds=40))
+
+    def test_expired_lease_is_taken_over(self):
+        acquire_lease("scheduler", "a", 30, self.now)
+        later = self.now + timedelta(seconds=31)
+
+        self.assertTrue(acquire_lease("scheduler", "b", 30, later))
+        self.assertFalse(acquire_lease("scheduler", "a", 30, later))
+        self.assertEqual(
+            SchedulerLease.objects.get(name="scheduler").acquired_at, later
+        )
+
+    def test_released_lease_is_free(self):
+        acquire_lease("scheduler", "a", 30, self.now)
+
+        self.assertFalse(release_lease("scheduler", "b"))
+        self.assertTrue(release_lease("scheduler", "a"))
+        self.assertTrue(acquire_lease("scheduler", "b", 30))
+
+    def test_elector_failover(self):
+        leader = LeaderElector("scheduler", MagicMock(), MagicMock(), 30, "a")
+        standby = LeaderElector("scheduler", MagicMock(), MagicMock(), 30, "b")
+
+        self.assertTrue(leader.run_once(self.now))
+        self.assertFalse(standby.run_once(self.now))
+        self.assertTrue(leader.run_once(self.now + timedelta(seconds=10)))
+        leader.on_elected.assert_called_once()
+
+        self.assertTrue(standby.run_once(self.now + timedelta(seconds=41)))
+        standby.on_elected.assert_called_once()
+        self.assertFalse(leader.run_once(self.now + timedelta(seconds=42)))
+        leader.on_demoted.assert_called_once()
+
+    def test_elector_steps_down_when_lease_can_not_be_renewed(self):
+        elector = LeaderElector("scheduler", MagicMock(), MagicMock(), 30, "a")
+        elector.run_once(self.now)
+
+        with patch(
+            "fomo_sapiens.utils.leader_utils.acquire_lease",
+            side_effect=Exception("database is down"),
+        ):
+            self.assertTrue(elector.run_once(self.now + timedelta(seconds=10)))
+            # The lease would expire before the next heartbeat at +30s.
+            self.assertFalse(elector.run_once(self.now + timedelta(seconds=20)))
+
+        elector.on_demoted.assert_called_once()
+
+    def test_lease_expiry_uses_database_time(self):
+        self.assertTrue(acquire_lease("scheduler", "a", 30))
+
+        lease = SchedulerLease.objects.get(name="scheduler")
+        self.assertAlmostEqual(
+            (lease.expires_at - lease.renewed_at).total_seconds(), 30, places=3
+        )
+        self.assertFalse(acquire_lease("scheduler", "b", 30))
+
+    def test_elector_stop_releases_lease(self):
+        elector = LeaderElector("scheduler", MagicMock(), MagicMock(), 30, "a")
+        elector.run_once()
+
+        elector.stop()
+
+        elector.on_demoted.assert_called_once()
+        self.assertEqual(SchedulerLease.objects.get(name="scheduler").holder, "")
@@ -0,0 +1,123 @@
+from concurrent.futures import Future
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from fomo_sapiens.models import NotificationOutbox
+from fomo_sapiens.utils.email_utils import EMAIL_SIGNATURE
+from fomo_sapiens.utils.outbox_utils import dispatch_notifications, queue_notification
+
+
+def make_future(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class NotificationOutboxTestCase(TestCase):
+
+    def setUp(self):
+        self.notifier = MagicMock()
+        self.notifier.submit.side_effect = lambda chat_id, msg: make_future(
+            chat_id != "2"
+        )
+        patcher = patch(
+            "fomo_sapiens.utils.telegram_utils.get_telegram_notifier",
+            return_value=self.notifier,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_queue_notification_deduplicates(self):
+        for _ in range(2):
+            queue_notification("telegram", "1", "BUY BTCUSDC", dedup_key="signal:1")
+        queue_notification("telegram", "1", "BUY BTCUSDC")
+
+        self.assertEqual(NotificationOutbox.objects.count(), 2)
+
+    def test_dispatch_records_delivery_and_backs_off(self):
+        queue_notification("telegram", "1", "BUY BTCUSDC")
+        queue_notification("telegram", "2", "SELL ETHUSDC")
+        queue_notification("email", "user@example.com", "Report", subject="GPT")
+
+        self.assertEqual(dispatch_notifications(), 2)
+
+        rows = {row.recipient: row for row in NotificationOutbox.objects.all()}
+        self.assertEqual(rows["1"].status, "sent")
+        self.assertIsNotNone(rows["1"].sent_at)
+        self.assertEqual(rows["user@example.com"].status, "sent")
+        self.assertEqual(mail.outbox[0].subject, "GPT")
+        failed = rows["2"]
+        self.assertEqual((failed.status, failed.attempts), ("pending", 1))
+        self.assertGreater(
+            failed.next_attempt_at, timezone.now() + timedelta(seconds=20)
+        )
+        self.assertTrue(failed.last_error)
+
+        # Not due before its backoff.
+        self.assertEqual(dispatch_notifications(), 0)
+        self.assertEqual(self.notifier.submit.call_count, 2)
+
+    def test_dispatch_gives_up_after_max_attempts(self):
+        queue_notification("telegram", "2", "SELL ETHUSDC")
+        NotificationOutbox.objects.update(attempts=4)
+
+        dispatch_notifications()
+
+        row = NotificationOutbox.objects.get()
+        self.assertEqual((row.status, row.attempts), ("failed", 5))
+
+    def queue_signals(self, channel, recipient, count):
+        for i in range(count):
+            queue_notification(
+                channel,
+                recipient,
+                f"Report {i}",
+                subject=f"Hunter {i} BUY signal",
+                summary=f"Hunter {i} BTCUSDC 1h BUY",
+                digest=True,
+            )
+
+    def test_digest_rows_wait_for_their_window(self):
+        self.queue_signals("telegram", "1", 2)
+
+        self.assertEqual(dispatch_notifications(), 0)
+        self.notifier.submit.assert_not_called()
+
+    def test_due_digest_sends_all_signals_of_recipient_in_one_message(self):
+        self.queue_signals("telegram", "1", 3)
+        queue_notification("telegram", "3", "Held", summary="Other", digest=True)
+        first = NotificationOutbox.objects.order_by("id").first()
+        NotificationOutbox.objects.filter(id=first.id).update(
+            next_attempt_at=timezone.now()
+        )
+
+        self.assertEqual(dispatch_notifications(), 3)
+
+        self.notifier.submit.assert_called_once()
+        chat_id, body = self.notifier.submit.call_args.args
+        self.assertEqual(chat_id, "1")
+        self.assertIn("3 hunter signals", body)
+        for i in range(3):
+            self.assertIn(f"Hunter {i} BTCUSDC 1h BUY", body)
+        self.assertEqual(
+            NotificationOutbox.objects.get(recipient="3").status, "pending"
+        )
+
+    @override_settings(NOTIFICATION_DIGEST={"delay_seconds": 0, "max_messages": 2})
+    def test_email_digest_is_split_at_max_messages(self):
+        self.queue_signals("email", "user@example.com", 3)
+
+        self.assertEqual(dispatch_notifications(), 3)
+
+        self.assertEqual(
+            [message.subject for message in mail.outbox],
+            ["2 hunter signals", "Hunter 2 BUY signal"],
+        )
+        digest = mail.outbox[0].body
+        self.assertIn("Report 0", digest)
+        self.assertIn("Report 1", digest)
+        self.assertTrue(digest.endswith(EMAIL_SIGNATURE))
+        self.assertEqual(digest.count(EMAIL_SIGNATURE), 1)
+        self.assertEqual(mail.outbox[1].body, "Report 2" + EMAIL_SIGNATURE)
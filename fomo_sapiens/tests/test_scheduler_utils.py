@@ -0,0 +1,81 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+from django.test import override_settings
+from fomo_sapiens.utils.scheduler_utils import (
+    ExecutorMetrics,
+    add_scheduler_jobs,
+    create_scheduler,
+    get_scheduler_metrics,
+)
+
+
+class TestSchedulerUtils(unittest.TestCase):
+
+    def test_executor_metrics(self):
+        metrics = ExecutorMetrics("test", 1)
+
+        metrics.job_queued()
+        metrics.job_queued()
+        metrics.job_started(0.5)
+        metrics.job_finished(2.0)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["queued"], 1)
+        self.assertEqual(snapshot["running"], 0)
+        self.assertEqual(snapshot["completed"], 1)
+        self.assertEqual(snapshot["last_wait"], 0.5)
+        self.assertEqual(snapshot["avg_duration"], 2.0)
+
+    def test_refreshers_do_not_share_the_gpt_executor(self):
+        scheduler = create_scheduler()
+        add_scheduler_jobs(scheduler)
+
+        executors = {job.id: job.executor for job in scheduler.get_jobs()}
+        self.assertEqual(executors["every_day_gpt_analysis_task"], "external")
+        self.assertEqual(executors["exchange_status_task"], "refresh")
+        self.assertEqual(executors["guest_snapshot_task"], "refresh")
+        self.assertEqual(executors["background_jobs_task"], "jobs")
+
+    @override_settings(
+        SCHEDULER_EXECUTORS={"hunters": 1, "external": 1, "housekeeping": 1}
+    )
+    def test_hunters_are_not_blocked_by_other_executors(self):
+        release = threading.Event()
+        hunter_done = threading.Event()
+        slow_started = threading.Event()
+
+        def slow_job():
+            slow_started.set()
+            release.wait(5)
+
+        scheduler = create_scheduler()
+        now = datetime.now()
+        for job_id in ("slow", "queued"):
+            scheduler.add_job(
+                slow_job, "date", run_date=now, id=job_id, executor="external"
+            )
+        scheduler.add_job(
+            hunter_done.set,
+            "date",
+            run_date=now + timedelta(milliseconds=200),
+            executor="hunters",
+        )
+        scheduler.start()
+        try:
+            self.assertTrue(slow_started.wait(5))
+            self.assertTrue(hunter_done.wait(5))
+
+            external = get_scheduler_metrics("external")
+            self.assertEqual(external["running"], 1)
+            self.assertEqual(external["queued"], 1)
+        finally:
+            release.set()
+            scheduler.shutdown(wait=True)
+
+        self.assertEqual(get_scheduler_metrics("external")["completed"], 2)
+        self.assertEqual(get_scheduler_metrics("hunters")["completed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
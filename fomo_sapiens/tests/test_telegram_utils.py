@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from aiohttp import web
+from telegram.request import HTTPXRequest
+from fomo_sapiens.utils.telegram_utils import TelegramNotifier, TelegramRateLimiter
+
+TOKEN = "123456:TEST"
+
+
+class FakeBotApi:
+    """A local Bot API server answering getMe and sendMessage."""
+
+    def __init__(self):
+        self.messages = []
+        self.flood_chats = set()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result(5)
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post(f"/bot{TOKEN}/getMe", self.get_me)
+        app.router.add_post(f"/bot{TOKEN}/sendMessage", self.send_message)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}/bot"
+
+    async def get_me(self, request):
+        return web.json_response(
+            {
+                "ok": True,
+                "result": {
+                    "id": 1,
+                    "is_bot": True,
+                    "first_name": "Fomo",
+                    "username": "fomo_bot",
+                },
+            }
+        )
+
+    async def send_message(self, request):
+        data = await request.post()
+        chat_id = data["chat_id"]
+        if chat_id in self.flood_chats:
+            self.flood_chats.discard(chat_id)
+            return web.json_response(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": "Too Many Requests: retry after 1",
+                    "parameters": {"retry_after": 1},
+                },
+                status=429,
+            )
+        self.messages.append((chat_id, data["text"], time.monotonic()))
+        return web.json_response(
+            {
+                "ok": True,
+                "result": {
+                    "message_id": len(self.messages),
+                    "date": int(time.time()),
+                    "chat": {"id": int(chat_id), "type": "private"},
+                    "text": data["text"],
+                },
+            }
+        )
+
+
+class TelegramNotifierTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = FakeBotApi()
+        self.api.start()
+        self.addCleanup(self.api.stop)
+        self.notifier = TelegramNotifier(
+            token=TOKEN,
+            base_url=self.api.base_url,
+            max_concurrency=4,
+            global_rate=100,
+            chat_interval=0.2,
+        )
+        self.addCleanup(self.notifier.stop)
+
+    def test_enqueue_returns_at_once_and_honours_chat_interval(self):
+        # Initialize the bot first, so its getMe does not skew the send times.
+        self.notifier.enqueue("0", "warm up")
+        self.assertTrue(self.notifier.flush(10))
+        self.api.messages.clear()
+
+        started = time.monotonic()
+        for i in range(3):
+            for chat_id in ("1", "2"):
+                self.assertTrue(self.notifier.enqueue(chat_id, f"signal {i}"))
+        self.assertLess(time.monotonic() - started, 0.5)
+
+        self.assertTrue(self.notifier.flush(10))
+
+        self.assertEqual(self.notifier.sent, 7)
+        self.assertEqual(len(self.api.messages), 6)
+        for chat_id in ("1", "2"):
+            times = [sent for chat, _, sent in self.api.messages if chat == chat_id]
+            self.assertEqual(len(times), 3)
+            for previous, current in zip(times, times[1:]):
+                self.assertGreaterEqual(current - previous, 0.18)
+
+    def test_enqueue_waits_for_a_starting_loop(self):
+        gate = threading.Event()
+
+        def slow_request(**kwargs):
+            gate.wait(5)
+            return HTTPXRequest(**kwargs)
+
+        with patch(
+            "fomo_sapiens.utils.telegram_utils.HTTPXRequest", side_effect=slow_request
+        ):
+            senders = [
+                threading.Thread(target=self.notifier.enqueue, args=(chat_id, "buy"))
+                for chat_id in ("1", "2")
+            ]
+            for sender in senders:
+                sender.start()
+            time.sleep(0.1)
+            self.assertFalse(self.notifier.running)
+            gate.set()
+            for sender in senders:
+                sender.join(5)
+
+        self.assertTrue(self.notifier.running)
+        self.assertTrue(self.notifier.flush(10))
+        self.assertEqual(
+            sorted(message[0] for message in self.api.messages), ["1", "2"]
+        )
+
+    def test_flood_control_is_retried(self):
+        self.api.flood_chats.add("7")
+
+        self.notifier.enqueue("7", "buy")
+        self.assertTrue(self.notifier.flush(10))
+
+        self.assertEqual(self.notifier.sent, 1)
+        self.assertEqual([message[:2] for message in self.api.messages], [("7", "buy")])
+
+
+class TelegramRateLimiterTestCase(unittest.TestCase):
+
+    def test_reserve_spaces_messages(self):
+        limiter = TelegramRateLimiter(global_rate=10, chat_interval=1)
+
+        self.assertEqual(limiter.reserve("1", now=100.0), 0.0)
+        self.assertAlmostEqual(limiter.reserve("2", now=100.0), 0.1)
+        self.assertAlmostEqual(limiter.reserve("1", now=100.0), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from fomo_sapiens.apps import FomoSapiensConfig
+from fomo_sapiens.utils.worker_utils import SchedulerWorker
+
+
+class SchedulerWorkerTestCase(TestCase):
+
+    def test_app_does_not_start_scheduler(self):
+        self.assertFalse(hasattr(FomoSapiensConfig, "scheduler"))
+
+    def test_only_leader_runs_scheduler(self):
+        now = timezone.now()
+        leader = SchedulerWorker("scheduler", 30)
+        standby = SchedulerWorker("scheduler", 30)
+        try:
+            leader.elector.run_once(now)
+            standby.elector.run_once(now)
+
+            self.assertIsNone(standby.scheduler)
+            self.assertTrue(leader.scheduler.running)
+            job_ids = {job.id for job in leader.scheduler.get_jobs()}
+            self.assertIn("every_minute_hunter_task", job_ids)
+            self.assertIn("every_day_telemetry_purge_task", job_ids)
+
+            leader.elector.stop()
+            self.assertIsNone(leader.scheduler)
+
+            standby.elector.run_once(now + timedelta(seconds=1))
+            self.assertTrue(standby.scheduler.running)
+        finally:
+            leader.stop_scheduler()
+            standby.stop_scheduler()
@@ -13,6 +13,7 @@ URL Patterns:
     - '/admin/': URL for the Django admin interface.
     - '/analysis/': Includes URLs for the analysis app.
     - '/hunter/': Includes URLs for the hunter app.
+    - '/jobs/<id>/' (background_job_status): The status of a background job.
 
 Custom Error Handling:
     - 404 errors are handled by the custom_404_view in fomo_sapiens.views.
@@ -20,7 +21,7 @@ Custom Error Handling:
 
 from django.contrib import admin
 from django.urls import path, include
-from fomo_sapiens.views import home_page, custom_404_view
+from fomo_sapiens.views import home_page, custom_404_view, background_job_status
 
 urlpatterns = [
     path("", home_page, name="home_page"),
@@ -29,6 +30,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("analysis/", include("analysis.urls")),
     path("hunter/", include("hunter.urls")),
+    path("jobs/<int:job_id>/", background_job_status, name="background_job_status"),
 ]
 
 handler404 = "fomo_sapiens.views.custom_404_view"
@@ -1,18 +1,288 @@
-from django.core.mail import send_mail
+import atexit
+import smtplib
+import threading
+from typing import List, Optional, Sequence, Tuple, Union
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
 from .logging import logger
 from .exception_handlers import exception_handler
 from ..utils.retry_connection import retry_connection
 
+EMAIL_FROM = "fomosapienscryptodiphunter@gmail.com"
+EMAIL_SIGNATURE = (
+    "\n\n-- \n\n"
+    "FomoSapiensCryptoDipHunter\nhttps://fomo.ropeaccess.pro\n\n"
+    "StefanCryptoTradingBot\nhttps://stefan.ropeaccess.pro\n\n"
+    "CodeCave\nhttps://cave.ropeaccess.pro\n"
+)
+# Errors the SMTP server returns for a single message, e.g. a refused recipient. The
+# session stays usable, so the other messages are still sent.
+SMTP_MESSAGE_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+DEFAULT_EMAIL_DISPATCHER = {
+    "batch_delay": 0.5,
+    "idle_timeout": 60.0,
+}
+
+
+class EmailDispatcher:
+    """
+    Sends queued emails in batches over one pooled SMTP connection.
+
+    Messages are queued and sent by a daemon thread, which waits `batch_delay` seconds
+    after the first message so a burst (signals at a candle close, the daily GPT reports)
+    goes out together. All messages of a flush are sent in one SMTP session, and the
+    connection stays open for the next flush until it has been idle for `idle_timeout`
+    seconds, so the SMTP/TLS handshake is paid once per burst instead of per email.
+
+    Args:
+        **options: Overrides of `settings.EMAIL_DISPATCHER`: 'batch_delay' and
+            'idle_timeout'.
+
+    Attributes:
+        sent (int): Messages sent successfully.
+        failed (int): Messages given up on.
+    """
+
+    def __init__(self, **options: float) -> None:
+        config = dict(DEFAULT_EMAIL_DISPATCHER)
+        config.update(getattr(settings, "EMAIL_DISPATCHER", {}))
+        config.update(options)
+        self.batch_delay = config["batch_delay"]
+        self.idle_timeout = config["idle_timeout"]
+        self.sent = 0
+        self.failed = 0
+        self._pending: List[EmailMessage] = []
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.RLock()
+        self._connection = None
+        self._wake = threading.Event()
+        self._stop_requested = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(
+        self, recipients: Union[str, Sequence[str]], subject: str, body: str
+    ) -> bool:
+        """
+        Queues an email without waiting for it to be sent.
+
+        Args:
+            recipients (str or list): The recipient address or addresses of one message.
+            subject (str): The subject of the email.
+            body (str): The body content of the email.
+
+        Returns:
+            bool: True once the email is queued.
+        """
+        message = self._build_message(recipients, subject, body)
+        with self._pending_lock:
+            self._pending.append(message)
+        self.start()
+        self._wake.set()
+        return True
+
+    def start(self) -> None:
+        """Starts the sending thread."""
+        with self._pending_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_requested.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="email-dispatcher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_requested.is_set():
+            if not self._wake.wait(self.idle_timeout):
+                self.close()
+                continue
+            self._stop_requested.wait(self.batch_delay)
+            self._wake.clear()
+            self.flush()
+        self.flush()
+        self.close()
+
+    def flush(self) -> int:
+        """
+        Sends all queued emails in one SMTP session.
+
+        Returns:
+            int: The number of sent emails.
+        """
+        with self._pending_lock:
+            messages, self._pending = self._pending, []
+        if not messages:
+            return 0
+
+        unsent = list(messages)
+        rejected: List[Tuple[EmailMessage, Exception]] = []
+        with self._send_lock:
+            try:
+                self._send_messages(unsent, rejected)
+            except Exception as e:
+                logger.error(
+                    f"Error sending {len(unsent)} of {len(messages)} emails. Error: {e}"
+                )
+
+        rejected_messages = [message for message, _ in rejected]
+        sent = [
+            message
+            for message in messages[: len(messages) - len(unsent)]
+            if message not in rejected_messages
+        ]
+        self.sent += len(sent)
+        self.failed += len(unsent) + len(rejected)
+        for message in sent:
+            logger.info(
+                f'Email "{message.subject}" to {", ".join(message.to)} sent successfully.'
+            )
+        return len(sent)
+
+    def deliver(
+        self, emails: Sequence[Tuple[Union[str, Sequence[str]], str, str]]
+    ) -> List[Optional[str]]:
+        """
+        Sends emails right away over the pooled connection, reporting each outcome.
+
+        After a connection failure the remaining emails are not attempted, as the SMTP
+        server is most likely unavailable for them too. An email rejected by the server,
+        e.g. for a refused recipient, does not stop the others.
+
+        Args:
+            emails (list): (recipients, subject, body) tuples.
+
+        Returns:
+            list: None for each sent email, the error message for each unsent one.
+        """
+        errors: List[Optional[str]] = []
+        connection_error = None
+        with self._send_lock:
+            for recipients, subject, body in emails:
+                if connection_error is not None:
+                    errors.append(connection_error)
+                    continue
+                rejected: List[Tuple[EmailMessage, Exception]] = []
+                try:
+                    self._send_messages(
+                        [self._build_message(recipients, subject, body)], rejected
+                    )
+                except Exception as e:
+                    connection_error = str(e)
+                    errors.append(connection_error)
+                    continue
+                errors.append(str(rejected[0][1]) if rejected else None)
+        self.sent += errors.count(None)
+        self.failed += len(errors) - errors.count(None)
+        return errors
+
+    @staticmethod
+    def _build_message(
+        recipients: Union[str, Sequence[str]], subject: str, body: str
+    ) -> EmailMessage:
+        if isinstance(recipients, str):
+            recipients = [recipients]
+        return EmailMessage(subject, body, EMAIL_FROM, list(recipients))
+
+    @retry_connection()
+    def _send_messages(
+        self,
+        messages: List[EmailMessage],
+        rejected: List[Tuple[EmailMessage, Exception]],
+    ) -> None:
+        """
+        Sends the messages one by one over the pooled connection.
+
+        Each message is removed from `messages` once sent or rejected by the server (see
+        `SMTP_MESSAGE_ERRORS`), so a retry after a connection error resends only the
+        unsent ones and a rejected message never blocks the others.
+
+        Args:
+            messages (list): The messages to send, emptied as they are sent.
+            rejected (list): Collects the (message, error) pairs of rejected messages.
+
+        Returns:
+            None
+        """
+        if self._connection is None:
+            self._connection = get_connection(fail_silently=False)
+        try:
+            self._connection.open()
+            while messages:
+                message = messages[0]
+                try:
+                    self._connection.send_messages([message])
+                except SMTP_MESSAGE_ERRORS as e:
+                    rejected.append((message, e))
+                    logger.error(
+                        f'Email "{message.subject}" to {", ".join(message.to)} rejected. Error: {e}'
+                    )
+                messages.pop(0)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Closes the pooled SMTP connection, it is reopened by the next flush."""
+        with self._send_lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception as e:
+                logger.warning(f"Error closing the SMTP connection: {e}")
+
+    def stop(self, timeout: Optional[float] = 30) -> None:
+        """
+        Sends the queued emails, closes the connection and stops the sending thread.
+
+        Args:
+            timeout (float, optional): The maximum seconds to wait for the thread.
+
+        Returns:
+            None
+        """
+        thread = self._thread
+        if not thread or not thread.is_alive():
+            self.flush()
+            self.close()
+            return
+        self._stop_requested.set()
+        self._wake.set()
+        thread.join(timeout)
+
+
+_dispatcher: Optional[EmailDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_email_dispatcher() -> EmailDispatcher:
+    """
+    Returns the email dispatcher of this process, created on first use.
+
+    Queued emails are still sent when the process exits normally.
+
+    Returns:
+        EmailDispatcher: The process-wide dispatcher.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = EmailDispatcher()
+            atexit.register(_dispatcher.stop)
+        return _dispatcher
+
 
 @exception_handler(default_return=False)
-@retry_connection()
 def send_email(email: str, subject: str, body: str) -> bool:
     """
-    Sends an email to a specified recipient.
+    Queues an email to a specified recipient.
 
-    This function uses Django's send_mail to send an email with the given subject and body
-    to the specified email address. If an exception occurs, it logs the error
-    and notifies the admin via email.
+    The email is sent in the background together with the other queued emails, see
+    `EmailDispatcher`, so the caller does not wait for the SMTP server.
 
     Args:
         email (str): The recipient's email address.
@@ -20,23 +290,22 @@ def send_email(email: str, subject: str, body: str) -> bool:
         body (str): The body content of the email.
 
     Returns:
-        bool: True if the email was sent successfully, False otherwise.
+        bool: True if the email was queued successfully, False otherwise.
 
     Raises:
         Logs any exceptions encountered and notifies the admin.
     """
-    send_mail(subject, body, "fomosapienscryptodiphunter@gmail.com", [email])
-    logger.info(f'Email "{subject}" to {email} sent successfully.')
-    return True
+    return get_email_dispatcher().enqueue(email, subject, body)
 
 
 def send_admin_email(subject: str, body: str) -> None:
     """
     Sends an email notification to all users with admin panel access.
 
-    This function retrieves all users who have `is_superuser=True`
-    and sends them an email with the given subject and body. If an exception
-    occurs, it logs the error.
+    This function retrieves all users who have `is_superuser=True` and queues one email
+    per admin with the given subject and body, so the admins do not see each other's
+    addresses; the emails go out together in one SMTP session. If an exception occurs,
+    it logs the error.
 
     Args:
         subject (str): The subject of the email.
@@ -50,12 +319,18 @@ def send_admin_email(subject: str, body: str) -> None:
     if apps.ready:
         from fomo_sapiens.models import UserProfile
     try:
-        users = UserProfile.objects.filter(is_superuser=True)
-        for user in users:
-            success = send_email(user.email, subject, body)
-            if not success:
-                logger.error(
-                    f"Failed to send admin email to {user.email}. {subject} {body}"
-                )
+        emails = [
+            email
+            for email in UserProfile.objects.filter(is_superuser=True).values_list(
+                "email", flat=True
+            )
+            if email
+        ]
+        if not emails:
+            logger.info("No superuser found to send admin email.")
+            return
+        dispatcher = get_email_dispatcher()
+        for email in emails:
+            dispatcher.enqueue(email, subject, body)
     except Exception as e:
         logger.error(f"Exception in send_admin_email: {str(e)}")
@@ -0,0 +1,195 @@
+import atexit
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from django.conf import settings
+from .logging import logger
+
+DEFAULT_ERROR_REPORTING = {
+    "flush_interval": 300.0,
+    "max_fingerprints": 100,
+}
+
+
+class ErrorAggregator:
+    """
+    Counts caught exceptions in memory and mails the admins a rate-limited summary.
+
+    Exceptions are fingerprinted by the function and exception type. `record` only
+    updates an in-memory counter, a daemon thread mails the summary: the first error
+    after a quiet period is reported at once, later ones are collected and reported
+    together at most every `flush_interval` seconds. An outage raising the same error
+    in every hunter thus sends one email per interval instead of one per call.
+
+    Args:
+        **options: Overrides of `settings.ERROR_REPORTING`: 'flush_interval' and
+            'max_fingerprints'.
+
+    Attributes:
+        dropped (int): Errors not counted since `max_fingerprints` was reached.
+    """
+
+    def __init__(self, **options: float) -> None:
+        config = dict(DEFAULT_ERROR_REPORTING)
+        config.update(getattr(settings, "ERROR_REPORTING", {}))
+        config.update(options)
+        self.flush_interval = config["flush_interval"]
+        self.max_fingerprints = config["max_fingerprints"]
+        self.dropped = 0
+        self._errors: Dict[Tuple[str, str], Dict] = {}
+        self._lock = threading.Lock()
+        self._last_flush = float("-inf")
+        self._wake = threading.Event()
+        self._stop_requested = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, function: str, exception_type: str, message: str) -> None:
+        """
+        Counts an exception without waiting for it to be reported.
+
+        Args:
+            function (str): The name of the function that raised.
+            exception_type (str): The exception class name.
+            message (str): The exception message, the latest one is reported.
+
+        Returns:
+            None
+        """
+        now = datetime.now()
+        with self._lock:
+            error = self._errors.get((function, exception_type))
+            if error is None:
+                if len(self._errors) >= self.max_fingerprints:
+                    self.dropped += 1
+                    return
+                error = self._errors[(function, exception_type)] = {
+                    "count": 0,
+                    "first_seen": now,
+                }
+            error["count"] += 1
+            error["last_seen"] = now
+            error["message"] = message
+        self.start()
+        self._wake.set()
+
+    def start(self) -> None:
+        """Starts the reporting thread."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_requested.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="error-aggregator", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_requested.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            delay = self._last_flush + self.flush_interval - time.monotonic()
+            if delay > 0:
+                self._stop_requested.wait(delay)
+            self.flush()
+        self.flush()
+
+    def flush(self) -> int:
+        """
+        Mails the admins the summary of the errors counted since the last flush.
+
+        Returns:
+            int: The number of reported errors.
+        """
+        with self._lock:
+            errors, self._errors = self._errors, {}
+            dropped, self.dropped = self.dropped, 0
+        self._last_flush = time.monotonic()
+        if not errors:
+            return 0
+
+        total = sum(error["count"] for error in errors.values())
+        if len(errors) == 1 and total == 1:
+            (function, exception_type), error = next(iter(errors.items()))
+            subject = f"{exception_type} in {function}"
+        else:
+            subject = f"{total} errors in {len(errors)} places"
+
+        lines = [
+            f"{error['count']}x {exception_type} in {function} "
+            f"({error['first_seen']:%Y-%m-%d %H:%M:%S} - "
+            f"{error['last_seen']:%Y-%m-%d %H:%M:%S}): {error['message']}"
+            for (function, exception_type), error in sorted(
+                errors.items(), key=lambda item: -item[1]["count"]
+            )
+        ]
+        if dropped:
+            lines.append(f"{dropped} more errors of other functions not counted.")
+
+        from .email_utils import send_admin_email
+
+        send_admin_email(subject, "FomoSapiensCryptoDipHunter\n\n" + "\n\n".join(lines))
+        return total
+
+    def stop(self, timeout: Optional[float] = 10) -> None:
+        """
+        Reports the counted errors and stops the reporting thread.
+
+        The summary email is sent before returning, so it is not lost when the process
+        exits.
+
+        Args:
+            timeout (float, optional): The maximum seconds to wait for the thread.
+
+        Returns:
+            None
+        """
+        from .email_utils import get_email_dispatcher
+
+        thread = self._thread
+        if thread and thread.is_alive():
+            self._stop_requested.set()
+            self._wake.set()
+            thread.join(timeout)
+        else:
+            self.flush()
+        get_email_dispatcher().flush()
+
+
+_aggregator: Optional[ErrorAggregator] = None
+_aggregator_lock = threading.Lock()
+
+
+def get_error_aggregator() -> ErrorAggregator:
+    """
+    Returns the error aggregator of this process, created on first use.
+
+    Counted errors are still reported when the process exits normally.
+
+    Returns:
+        ErrorAggregator: The process-wide aggregator.
+    """
+    global _aggregator
+    with _aggregator_lock:
+        if _aggregator is None:
+            _aggregator = ErrorAggregator()
+            atexit.register(_aggregator.stop)
+        return _aggregator
+
+
+def report_error(function: str, exception_type: str, message: str) -> None:
+    """
+    Counts a caught exception for the admin error summary, see `ErrorAggregator`.
+
+    Args:
+        function (str): The name of the function that raised.
+        exception_type (str): The exception class name.
+        message (str): The exception message.
+
+    Returns:
+        None
+    """
+    try:
+        get_error_aggregator().record(function, exception_type, message)
+    except Exception as e:
+        logger.error(f"Exception in report_error: {str(e)}")
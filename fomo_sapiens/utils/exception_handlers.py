@@ -13,7 +13,9 @@ def exception_handler(default_return=None):
 
     This decorator catches a set of predefined exceptions (e.g., IndexError, BinanceAPIException,
     ConnectionError, etc.) and logs them along with the function name where the exception occurred.
-    In case of an exception, it also sends an email to the admin with the error details.
+    In case of an exception, it also counts the error for the rate-limited admin error
+    summary, see `fomo_sapiens.utils.error_utils.ErrorAggregator`, without waiting for
+    any email to be sent.
 
     If the exception is of an unhandled type, a generic exception handler is invoked to log and report
     the error.
@@ -58,18 +60,15 @@ def exception_handler(default_return=None):
             ) as e:
                 exception_type = type(e).__name__
                 logger.error(f"{exception_type} in {func.__name__}: {str(e)}")
-                from .email_utils import send_admin_email
+                from .error_utils import report_error
 
-                send_admin_email(f"{exception_type} in {func.__name__}", str(e))
+                report_error(func.__name__, exception_type, str(e))
             except Exception as e:
                 exception_type = "Exception"
                 logger.error(f"{exception_type} in {func.__name__}: {str(e)}")
-                from .email_utils import send_admin_email
+                from .error_utils import report_error
 
-                send_admin_email(
-                    f"{exception_type} in {func.__name__}",
-                    f"FomoSapiensCryptoDipHunter\n{exception_type} in {func.__name__}\n\n{str(e)}",
-                )
+                report_error(func.__name__, type(e).__name__, str(e))
 
             if default_return is exit:
                 logger.error("sys.exit(1) Exiting program due to an error.")
@@ -0,0 +1,297 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from django.conf import settings
+from django.utils import timezone
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+
+DEFAULT_BACKGROUND_JOBS = {
+    "poll_seconds": 2,
+    "batch_size": 10,
+    "timeout": 900,
+    "retention_days": 7,
+}
+
+JOB_UPDATE_FIELDS = ["status", "error", "finished_at"]
+
+
+def get_background_jobs_config() -> Dict[str, int]:
+    """
+    Returns the background job settings from `settings.BACKGROUND_JOBS`.
+
+    Returns:
+        dict: The 'poll_seconds', 'batch_size', 'timeout' and 'retention_days'.
+    """
+    config = dict(DEFAULT_BACKGROUND_JOBS)
+    config.update(getattr(settings, "BACKGROUND_JOBS", {}))
+    return config
+
+
+def refresh_technical_analysis(job: Any) -> None:
+    """
+    Fetches the klines of the user who enqueued the job.
+
+    Args:
+        job (BackgroundJob): The job.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If the klines could not be fetched.
+    """
+    from analysis.models import TechnicalAnalysisSettings
+    from analysis.utils.fetch_utils import fetch_and_save_df
+
+    user_ta_settings, created = TechnicalAnalysisSettings.objects.get_or_create(
+        user=job.user
+    )
+    df_fetched = fetch_and_save_df(user_ta_settings)
+    if df_fetched is None or isinstance(df_fetched, int):
+        raise RuntimeError("Fetching the Technical Analysis data failed.")
+
+
+def refresh_sentiment_analysis(job: Any) -> None:
+    """
+    Fetches and analyses the latest crypto news.
+
+    Args:
+        job (BackgroundJob): The job.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If no sentiment analysis was saved.
+    """
+    from analysis.models import SentimentAnalysis
+    from analysis.utils.sentiment_utils import fetch_and_save_sentiment_analysis
+
+    fetch_and_save_sentiment_analysis()
+    if not SentimentAnalysis.objects.filter(id=1).exists():
+        raise RuntimeError("Fetching the Sentiment Analysis failed.")
+
+
+def refresh_gpt_analysis(job: Any) -> None:
+    """
+    Fetches the AI-GPT analysis of the user who enqueued the job.
+
+    Args:
+        job (BackgroundJob): The job.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If the user still has no AI-GPT analysis.
+    """
+    from analysis.models import TechnicalAnalysisSettings
+    from analysis.utils.gpt_utils import fetch_save_and_send_gpt_analysis
+
+    fetch_save_and_send_gpt_analysis(username=job.user.username)
+    user_ta_settings = TechnicalAnalysisSettings.objects.filter(user=job.user).first()
+    if not user_ta_settings or not user_ta_settings.gpt_response:
+        raise RuntimeError("Fetching the AI-GPT analysis failed.")
+
+
+def refresh_gpt_analysis_all(job: Any) -> None:
+    """
+    Fetches the AI-GPT analysis of all users.
+
+    Args:
+        job (BackgroundJob): The job.
+
+    Returns:
+        None
+    """
+    from analysis.utils.gpt_utils import fetch_save_and_send_gpt_analysis
+
+    fetch_save_and_send_gpt_analysis()
+
+
+def refresh_sleeping_hunters(job: Any) -> None:
+    """
+    Fetches the klines of the stale sleeping hunters of the user who enqueued the job.
+
+    Enqueued by the hunters list when the shared market cache misses their markets.
+
+    Args:
+        job (BackgroundJob): The job.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If a sleeping hunter could not be refreshed.
+    """
+    from hunter.models import TechnicalAnalysisHunter
+    from hunter.utils.market_cache_utils import (
+        has_stale_sleeping_hunters,
+        refresh_sleeping_hunter_dfs,
+    )
+
+    hunters = list(TechnicalAnalysisHunter.objects.filter(user=job.user, running=False))
+    refresh_sleeping_hunter_dfs(hunters, fetch_missing=True)
+    if has_stale_sleeping_hunters(hunters):
+        raise RuntimeError("Refreshing the sleeping hunters data failed.")
+
+
+JOB_HANDLERS: Dict[str, Callable[[Any], None]] = {
+    "technical_analysis": refresh_technical_analysis,
+    "sentiment_analysis": refresh_sentiment_analysis,
+    "gpt_analysis": refresh_gpt_analysis,
+    "gpt_analysis_all": refresh_gpt_analysis_all,
+    "hunter_dfs": refresh_sleeping_hunters,
+}
+
+
+def enqueue_job(kind: str, user: Optional[Any] = None) -> Any:
+    """
+    Enqueues a background job, or returns the pending or running job of the same kind
+    and user.
+
+    Repeated clicks therefore never pile up jobs, and the web worker returns at once.
+
+    Args:
+        kind (str): The job kind, a key of `JOB_HANDLERS`.
+        user (UserProfile, optional): The user triggering the job, None for guests.
+
+    Returns:
+        BackgroundJob: The enqueued or already queued job.
+
+    Raises:
+        ValueError: If the kind is unknown.
+    """
+    from fomo_sapiens.models import BackgroundJob
+
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown background job kind: {kind}")
+
+    queued = BackgroundJob.objects.filter(
+        kind=kind, user=user, status__in=["pending", "running"]
+    ).first()
+    if queued:
+        return queued
+    return BackgroundJob.objects.create(kind=kind, user=user)
+
+
+def claim_pending_jobs(limit: int, now: Optional[datetime] = None) -> List[Any]:
+    """
+    Marks the oldest pending jobs as 'running' and returns them.
+
+    Jobs left 'running' longer than the job timeout (e.g. the worker died) are failed.
+
+    Args:
+        limit (int): The maximum number of jobs.
+        now (datetime, optional): The current time. Defaults to `timezone.now()`.
+
+    Returns:
+        list: The claimed BackgroundJob rows.
+    """
+    from fomo_sapiens.models import BackgroundJob
+
+    now = now or timezone.now()
+    stale = now - timedelta(seconds=get_background_jobs_config()["timeout"])
+    BackgroundJob.objects.filter(status="running", started_at__lte=stale).update(
+        status="failed", error="Timed out.", finished_at=now
+    )
+
+    ids = list(
+        BackgroundJob.objects.filter(status="pending")
+        .order_by("created_at", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+    BackgroundJob.objects.filter(id__in=ids, status="pending").update(
+        status="running", started_at=now
+    )
+    return list(
+        BackgroundJob.objects.filter(id__in=ids, status="running")
+        .select_related("user")
+        .order_by("created_at", "id")
+    )
+
+
+def run_job(job: Any) -> None:
+    """
+    Runs one claimed job and saves its outcome.
+
+    Args:
+        job (BackgroundJob): The claimed job.
+
+    Returns:
+        None
+    """
+    try:
+        JOB_HANDLERS[job.kind](job)
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e) or type(e).__name__
+        logger.warning(f"Background job {job.id} {job.kind} failed: {job.error}")
+    else:
+        job.status = "done"
+    job.finished_at = timezone.now()
+    job.save(update_fields=JOB_UPDATE_FIELDS)
+
+
+@exception_handler(default_return=0)
+def run_background_jobs() -> int:
+    """
+    Runs the pending background jobs, oldest first.
+
+    Scheduled every few seconds on its own 'jobs' executor with a single instance, so
+    however many refreshes users trigger, at most one runs at a time, web workers are
+    never tied up by them and they never wait behind the scheduled GPT analysis.
+
+    Returns:
+        int: The number of jobs run.
+    """
+    config = get_background_jobs_config()
+    jobs = claim_pending_jobs(config["batch_size"])
+    for job in jobs:
+        run_job(job)
+    if jobs:
+        logger.info(f"Ran {len(jobs)} background jobs.")
+    return len(jobs)
+
+
+def get_job_status(job: Any) -> Dict[str, Any]:
+    """
+    Returns the status of a job as served by the job status endpoint.
+
+    Args:
+        job (BackgroundJob): The job.
+
+    Returns:
+        dict: The 'id', 'kind', 'status', 'error', 'created_at' and 'finished_at'.
+    """
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "error": job.error,
+        "created_at": job.created_at.isoformat(),
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+@exception_handler(default_return=0)
+def purge_background_jobs(days: Optional[int] = None) -> int:
+    """
+    Deletes finished background jobs older than the retention period.
+
+    Args:
+        days (int, optional): The retention in days.
+            Defaults to `settings.BACKGROUND_JOBS['retention_days']`.
+
+    Returns:
+        int: The number of deleted jobs.
+    """
+    from fomo_sapiens.models import BackgroundJob
+
+    days = days or get_background_jobs_config()["retention_days"]
+    deleted, _ = BackgroundJob.objects.filter(
+        status__in=["done", "failed"],
+        created_at__lt=timezone.now() - timedelta(days=days),
+    ).delete()
+    logger.info(f"Purged {deleted} background jobs older than {days} days.")
+    return deleted
@@ -0,0 +1,206 @@
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections
+from django.db.models import Case, DateTimeField, ExpressionWrapper, F, Q, Value, When
+from django.db.models.functions import Now
+from django.utils import timezone
+from fomo_sapiens.utils.logging import logger
+
+DEFAULT_LEASE_TTL_SECONDS = 30
+
+
+def get_process_identity() -> str:
+    """
+    Returns an identity unique to this process, e.g. 'web-1:4242:1a2b3c4d'.
+
+    The random suffix keeps identities unique when a restarted process reuses a pid.
+
+    Returns:
+        str: The host name, process id and a random suffix.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def acquire_lease(
+    name: str, holder: str, ttl: float, now: Optional[datetime] = None
+) -> bool:
+    """
+    Acquires or renews a named lease for `ttl` seconds.
+
+    The lease is taken with a single conditional UPDATE that only matches when the
+    caller already holds the lease or the lease has expired, so of several processes
+    racing for a free lease exactly one succeeds, on any host sharing the database.
+    Expiry is checked and set against the database clock, so hosts with skewed clocks
+    never take over a lease that is still valid.
+
+    Args:
+        name (str): The lease name.
+        holder (str): The identity of the calling process.
+        ttl (float): The lease duration in seconds.
+        now (datetime, optional): The current time. Defaults to the database time.
+
+    Returns:
+        bool: True if the caller holds the lease until `now + ttl`.
+    """
+    from fomo_sapiens.models import SchedulerLease
+
+    now = Value(now) if now else Now()
+    expires_at = ExpressionWrapper(
+        now + timedelta(seconds=ttl), output_field=DateTimeField()
+    )
+
+    if not SchedulerLease.objects.filter(name=name).exists():
+        try:
+            SchedulerLease.objects.create(name=name, expires_at=now)
+        except IntegrityError:
+            pass
+
+    updated = (
+        SchedulerLease.objects.filter(name=name)
+        .filter(Q(holder=holder) | Q(expires_at__lte=now))
+        .update(
+            acquired_at=Case(When(holder=holder, then=F("acquired_at")), default=now),
+            holder=holder,
+            renewed_at=now,
+            expires_at=expires_at,
+        )
+    )
+    return updated == 1
+
+
+def release_lease(name: str, holder: str) -> bool:
+    """
+    Releases a lease held by `holder`, so another process can take it over at once.
+
+    Args:
+        name (str): The lease name.
+        holder (str): The identity of the calling process.
+
+    Returns:
+        bool: True if the lease was held by the caller and released.
+    """
+    from fomo_sapiens.models import SchedulerLease
+
+    return (
+        SchedulerLease.objects.filter(name=name, holder=holder).update(
+            holder="", expires_at=Now()
+        )
+        == 1
+    )
+
+
+class LeaderElector:
+    """
+    Runs a heartbeat thread competing for a named database lease.
+
+    Every `ttl / 3` seconds the leader renews its lease and every other process tries
+    to acquire it, so a crashed leader is replaced within `ttl + ttl / 3` seconds and a
+    leader shutting down cleanly is replaced on the next heartbeat. A leader that can not
+    renew its lease (e.g. the database is unreachable) steps down once its lease would
+    expire before the next heartbeat, measured from the start of its last successful
+    renewal, so two processes never act as leader at the same time.
+
+    Args:
+        name (str): The lease name.
+        on_elected (callable): Called when this process becomes the leader.
+        on_demoted (callable): Called when this process stops being the leader.
+        ttl (float, optional): The lease duration in seconds.
+            Defaults to `settings.SCHEDULER_LEASE_TTL_SECONDS`.
+        holder (str, optional): The identity of this process.
+            Defaults to `get_process_identity()`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        ttl: Optional[float] = None,
+        holder: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.ttl = ttl or getattr(
+            settings, "SCHEDULER_LEASE_TTL_SECONDS", DEFAULT_LEASE_TTL_SECONDS
+        )
+        self.heartbeat = self.ttl / 3
+        self.holder = holder or get_process_identity()
+        self.is_leader = False
+        self.lease_valid_until: Optional[datetime] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts the heartbeat thread."""
+        self._thread = threading.Thread(
+            target=self.run, name=f"leader-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def run(self) -> None:
+        """Runs heartbeats until `stop` is called."""
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.heartbeat)
+
+    def run_once(self, now: Optional[datetime] = None) -> bool:
+        """
+        Performs one heartbeat: acquires or renews the lease and reacts to changes.
+
+        Args:
+            now (datetime, optional): The current time, also passed to `acquire_lease`.
+                Defaults to `timezone.now()` locally and the database time for the lease.
+
+        Returns:
+            bool: True if this process is the leader after the heartbeat.
+        """
+        started = now or timezone.now()
+        try:
+            close_old_connections()
+            acquired = acquire_lease(self.name, self.holder, self.ttl, now)
+        except Exception as e:
+            logger.warning(f"Lease {self.name} heartbeat failed: {e}")
+            acquired = bool(
+                self.is_leader
+                and self.lease_valid_until
+                and started + timedelta(seconds=self.heartbeat) < self.lease_valid_until
+            )
+        else:
+            if acquired:
+                self.lease_valid_until = started + timedelta(seconds=self.ttl)
+
+        if acquired and not self.is_leader:
+            logger.info(f"Process {self.holder} elected leader of {self.name}.")
+            self.is_leader = True
+            self.on_elected()
+        elif not acquired and self.is_leader:
+            logger.warning(f"Process {self.holder} lost leadership of {self.name}.")
+            self.is_leader = False
+            self.on_demoted()
+
+        return self.is_leader
+
+    def stop(self) -> None:
+        """
+        Stops the heartbeat thread, steps down and releases the lease.
+
+        Returns:
+            None
+        """
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(self.heartbeat)
+
+        if self.is_leader:
+            self.is_leader = False
+            self.on_demoted()
+            try:
+                release_lease(self.name, self.holder)
+            except Exception as e:
+                logger.warning(f"Lease {self.name} release failed: {e}")
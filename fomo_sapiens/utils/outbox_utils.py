@@ -0,0 +1,372 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from django.conf import settings
+from django.utils import timezone
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+
+DEFAULT_NOTIFICATION_OUTBOX = {
+    "poll_seconds": 5,
+    "batch_size": 100,
+    "max_attempts": 5,
+    "backoff_seconds": 30,
+    "max_backoff_seconds": 3600,
+    "send_timeout": 120,
+    "retention_days": 7,
+}
+
+DEFAULT_NOTIFICATION_DIGEST = {
+    "delay_seconds": 30,
+    "max_messages": 20,
+    "max_chars": 4000,
+}
+
+DIGEST_SEPARATOR = "\n\n----------\n\n"
+
+OUTBOX_UPDATE_FIELDS = [
+    "status",
+    "attempts",
+    "next_attempt_at",
+    "last_error",
+    "sent_at",
+]
+
+
+def get_outbox_config() -> Dict[str, int]:
+    """
+    Returns the outbox settings from `settings.NOTIFICATION_OUTBOX`.
+
+    Returns:
+        dict: The 'poll_seconds', 'batch_size', 'max_attempts', 'backoff_seconds',
+              'max_backoff_seconds', 'send_timeout' and 'retention_days'.
+    """
+    config = dict(DEFAULT_NOTIFICATION_OUTBOX)
+    config.update(getattr(settings, "NOTIFICATION_OUTBOX", {}))
+    return config
+
+
+def get_digest_config() -> Dict[str, int]:
+    """
+    Returns the digest settings from `settings.NOTIFICATION_DIGEST`.
+
+    Returns:
+        dict: The 'delay_seconds', 'max_messages' and 'max_chars'.
+    """
+    config = dict(DEFAULT_NOTIFICATION_DIGEST)
+    config.update(getattr(settings, "NOTIFICATION_DIGEST", {}))
+    return config
+
+
+def queue_notification(
+    channel: str,
+    recipient: str,
+    body: str,
+    subject: str = "",
+    user: Optional[Any] = None,
+    category: str = "signal",
+    dedup_key: Optional[str] = None,
+    summary: str = "",
+    digest: bool = False,
+) -> None:
+    """
+    Appends a message to the notification outbox with a single INSERT.
+
+    A message whose `dedup_key` is already in the outbox is silently dropped. A digest
+    message is held for `settings.NOTIFICATION_DIGEST['delay_seconds']`, so the other
+    messages queued for the recipient meanwhile are delivered with it as one digest.
+
+    Args:
+        channel (str): 'telegram' or 'email'.
+        recipient (str): The Telegram chat ID or the email address.
+        body (str): The message content.
+        subject (str, optional): The email subject.
+        user (UserProfile, optional): The recipient user.
+        category (str, optional): What the message is about. Default is 'signal'.
+        dedup_key (str, optional): Identifies the logical message.
+        summary (str, optional): The one-line summary shown in digests.
+        digest (bool, optional): Whether the message may be merged into a digest.
+
+    Returns:
+        None
+    """
+    from fomo_sapiens.models import NotificationOutbox
+
+    delay = get_digest_config()["delay_seconds"] if digest else 0
+    NotificationOutbox.objects.bulk_create(
+        [
+            NotificationOutbox(
+                user=user,
+                channel=channel,
+                category=category,
+                recipient=recipient,
+                subject=subject,
+                body=body,
+                summary=summary[:255],
+                digest=digest,
+                dedup_key=dedup_key,
+                next_attempt_at=timezone.now() + timedelta(seconds=delay),
+            )
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def claim_due_notifications(limit: int, now: Optional[datetime] = None) -> List[Any]:
+    """
+    Marks the oldest due pending rows as 'sending' and returns them.
+
+    Once a digest row is due, the other pending digest rows of its recipient and
+    channel are claimed with it, even if still held. Rows left in 'sending' by a
+    dispatcher that died are due again after twice the send timeout.
+
+    Args:
+        limit (int): The maximum number of rows.
+        now (datetime, optional): The current time. Defaults to `timezone.now()`.
+
+    Returns:
+        list: The claimed NotificationOutbox rows.
+    """
+    from fomo_sapiens.models import NotificationOutbox
+
+    now = now or timezone.now()
+    stale = now - timedelta(seconds=2 * get_outbox_config()["send_timeout"])
+    NotificationOutbox.objects.filter(
+        status="sending", next_attempt_at__lte=stale
+    ).update(status="pending")
+
+    due = list(
+        NotificationOutbox.objects.filter(status="pending", next_attempt_at__lte=now)
+        .order_by("next_attempt_at", "id")
+        .values_list("id", "digest", "channel", "recipient")[:limit]
+    )
+    ids = [row[0] for row in due]
+    digests = {(channel, recipient) for _, digest, channel, recipient in due if digest}
+    if digests:
+        ids += [
+            row_id
+            for row_id, channel, recipient in NotificationOutbox.objects.filter(
+                status="pending",
+                digest=True,
+                next_attempt_at__gt=now,
+                recipient__in={recipient for _, recipient in digests},
+            ).values_list("id", "channel", "recipient")
+            if (channel, recipient) in digests
+        ]
+    NotificationOutbox.objects.filter(id__in=ids, status="pending").update(
+        status="sending", next_attempt_at=now
+    )
+    return list(
+        NotificationOutbox.objects.filter(id__in=ids, status="sending").order_by("id")
+    )
+
+
+def coalesce_notifications(rows: List[Any]) -> List[List[Any]]:
+    """
+    Groups digest rows of the same recipient and channel, keeping other rows alone.
+
+    A group holds at most `max_messages` rows, and for Telegram at most `max_chars`
+    characters of summaries, further rows start a new group.
+
+    Args:
+        rows (list): The NotificationOutbox rows, in delivery order.
+
+    Returns:
+        list: The groups of rows, each delivered as one message.
+    """
+    config = get_digest_config()
+    groups: List[List[Any]] = []
+    open_groups: Dict[Tuple[str, str], List[Any]] = {}
+    for row in rows:
+        if not row.digest:
+            groups.append([row])
+            continue
+        key = (row.channel, row.recipient)
+        group = open_groups.get(key)
+        if (
+            group is None
+            or len(group) >= config["max_messages"]
+            or row.channel == "telegram"
+            and sum(len(other.summary) + 1 for other in group) + len(row.summary)
+            > config["max_chars"]
+        ):
+            group = open_groups[key] = []
+            groups.append(group)
+        group.append(row)
+    return groups
+
+
+def render_notification(group: List[Any]) -> Tuple[str, str]:
+    """
+    Renders the subject and body of the message delivering a group of rows.
+
+    A Telegram digest lists the summaries of its rows, an email digest adds their full
+    bodies below. Digest emails get the signature once, at the end.
+
+    Args:
+        group (list): The NotificationOutbox rows of one message.
+
+    Returns:
+        tuple: The subject and the body.
+    """
+    row = group[0]
+    signature = ""
+    if row.digest and row.channel == "email":
+        from fomo_sapiens.utils.email_utils import EMAIL_SIGNATURE
+
+        signature = EMAIL_SIGNATURE
+    if len(group) == 1:
+        return row.subject, row.body + signature
+
+    summaries = "\n".join(other.summary or other.subject for other in group)
+    subject = f"{len(group)} hunter signals"
+    body = (
+        f"FomoSapiensCryptoDipHunter\n"
+        f"https://fomo.ropeaccess.pro\n\n"
+        f"{subject}:\n\n"
+        f"{summaries}"
+    )
+    if row.channel == "email":
+        body += DIGEST_SEPARATOR + DIGEST_SEPARATOR.join(other.body for other in group)
+    return subject, body + signature
+
+
+def deliver_notifications(
+    groups: List[List[Any]], timeout: float
+) -> Dict[int, Optional[str]]:
+    """
+    Sends one message per group, Telegram messages concurrently and emails in one SMTP
+    session.
+
+    Args:
+        groups (list): The groups of NotificationOutbox rows, see
+            `coalesce_notifications`.
+        timeout (float): The maximum seconds to wait for the Telegram messages.
+
+    Returns:
+        dict: None for each delivered row, the error for each failed one, keyed by id.
+    """
+    from fomo_sapiens.utils.email_utils import get_email_dispatcher
+    from fomo_sapiens.utils.telegram_utils import get_telegram_notifier
+
+    results: Dict[int, Optional[str]] = {}
+    messages = [(group, *render_notification(group)) for group in groups]
+    telegram_messages = [m for m in messages if m[0][0].channel == "telegram"]
+    email_messages = [m for m in messages if m[0][0].channel == "email"]
+
+    futures = []
+    if telegram_messages:
+        notifier = get_telegram_notifier()
+        futures = [
+            (group, notifier.submit(group[0].recipient, body))
+            for group, _, body in telegram_messages
+        ]
+
+    if email_messages:
+        errors = get_email_dispatcher().deliver(
+            [
+                (group[0].recipient, subject, body)
+                for group, subject, body in email_messages
+            ]
+        )
+        for (group, _, _), error in zip(email_messages, errors):
+            results.update({row.id: error for row in group})
+
+    for group, future in futures:
+        try:
+            error = None if future.result(timeout) else "Telegram delivery failed"
+        except Exception as e:
+            future.cancel()
+            error = f"Telegram delivery failed: {e or type(e).__name__}"
+        results.update({row.id: error for row in group})
+    return results
+
+
+def record_delivery(row: Any, error: Optional[str], now: datetime) -> None:
+    """
+    Records the outcome of one delivery attempt on a row, without saving it.
+
+    Failed rows are retried after an exponential backoff until `max_attempts`.
+
+    Args:
+        row (NotificationOutbox): The delivered row.
+        error (str): The error of the attempt, None if delivered.
+        now (datetime): The time of the attempt.
+
+    Returns:
+        None
+    """
+    config = get_outbox_config()
+    row.attempts += 1
+    if error is None:
+        row.status = "sent"
+        row.sent_at = now
+        row.last_error = ""
+    elif row.attempts >= config["max_attempts"]:
+        row.status = "failed"
+        row.last_error = error
+    else:
+        backoff = min(
+            config["backoff_seconds"] * 2 ** (row.attempts - 1),
+            config["max_backoff_seconds"],
+        )
+        row.status = "pending"
+        row.next_attempt_at = now + timedelta(seconds=backoff)
+        row.last_error = error
+
+
+@exception_handler(default_return=0)
+def dispatch_notifications() -> int:
+    """
+    Delivers due outbox rows and records their delivery status.
+
+    Scheduled every few seconds on its own executor, so notification latency never
+    delays hunter ticks or the GPT job. Digest rows of one recipient and channel are
+    delivered as one message.
+
+    Returns:
+        int: The number of delivered rows.
+    """
+    from fomo_sapiens.models import NotificationOutbox
+
+    config = get_outbox_config()
+    rows = claim_due_notifications(config["batch_size"])
+    if not rows:
+        return 0
+
+    groups = coalesce_notifications(rows)
+    results = deliver_notifications(groups, config["send_timeout"])
+    now = timezone.now()
+    for row in rows:
+        record_delivery(row, results.get(row.id, "Not delivered"), now)
+    NotificationOutbox.objects.bulk_update(rows, OUTBOX_UPDATE_FIELDS)
+
+    delivered = sum(row.status == "sent" for row in rows)
+    log = logger.info if delivered == len(rows) else logger.warning
+    log(
+        f"Notification outbox delivered {delivered}/{len(rows)} notifications "
+        f"in {len(groups)} messages."
+    )
+    return delivered
+
+
+@exception_handler(default_return=0)
+def purge_notification_outbox(days: Optional[int] = None) -> int:
+    """
+    Deletes sent and failed outbox rows older than the retention period.
+
+    Args:
+        days (int, optional): The retention in days.
+            Defaults to `settings.NOTIFICATION_OUTBOX['retention_days']`.
+
+    Returns:
+        int: The number of deleted rows.
+    """
+    from fomo_sapiens.models import NotificationOutbox
+
+    days = days or get_outbox_config()["retention_days"]
+    deleted, _ = NotificationOutbox.objects.filter(
+        status__in=["sent", "failed"],
+        created_at__lt=timezone.now() - timedelta(days=days),
+    ).delete()
+    logger.info(f"Purged {deleted} notification outbox rows older than {days} days.")
+    return deleted
@@ -0,0 +1,420 @@
+import time
+import threading
+from datetime import datetime
+from collections import deque
+from typing import Any, Dict, Optional
+from django.conf import settings
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+from apscheduler.executors.base import run_job
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+
+DEFAULT_SCHEDULER_EXECUTORS = {
+    "hunters": 2,
+    "external": 2,
+    "refresh": 2,
+    "jobs": 1,
+    "housekeeping": 1,
+    "notifications": 1,
+}
+SCHEDULER_METRICS_WINDOW = 100
+
+EXECUTOR_METRICS: Dict[str, "ExecutorMetrics"] = {}
+
+
+class ExecutorMetrics:
+    """
+    Thread-safe queue depth, wait time and run time counters of one executor.
+
+    The wait time is measured from the moment the scheduler submits a job to the
+    moment a worker thread starts running it, so it grows when the executor is
+    saturated by earlier jobs.
+
+    Attributes:
+        name (str): The executor name.
+        max_workers (int): The number of worker threads.
+        queued (int): Jobs submitted but not started yet.
+        running (int): Jobs currently running.
+        completed (int): Jobs finished since startup.
+        max_wait (float): The longest wait time since startup, in seconds.
+        waits (deque): The most recent wait times, in seconds.
+        durations (deque): The most recent run times, in seconds.
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_wait = 0.0
+        self.waits: deque = deque(maxlen=SCHEDULER_METRICS_WINDOW)
+        self.durations: deque = deque(maxlen=SCHEDULER_METRICS_WINDOW)
+        self._lock = threading.Lock()
+
+    def job_queued(self) -> None:
+        """Records a job submitted to the executor."""
+        with self._lock:
+            self.queued += 1
+
+    def job_started(self, wait: float) -> None:
+        """Records a job picked up by a worker after waiting `wait` seconds."""
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.waits.append(wait)
+            self.max_wait = max(self.max_wait, wait)
+
+    def job_finished(self, duration: float) -> None:
+        """Records a job finished after running `duration` seconds."""
+        with self._lock:
+            self.running -= 1
+            self.completed += 1
+            self.durations.append(duration)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the current counters.
+
+        Returns:
+            dict: The queue depth, running and completed jobs, and the last, average
+                  and maximum wait times and average run time in seconds.
+        """
+        with self._lock:
+            waits = list(self.waits)
+            durations = list(self.durations)
+            return {
+                "executor": self.name,
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "last_wait": waits[-1] if waits else 0.0,
+                "avg_wait": sum(waits) / len(waits) if waits else 0.0,
+                "max_wait": self.max_wait,
+                "avg_duration": sum(durations) / len(durations) if durations else 0.0,
+            }
+
+
+class MonitoredThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    APScheduler thread pool executor recording its queue depth and wait times.
+
+    Args:
+        name (str): The executor name the metrics are registered under.
+        max_workers (int): The number of worker threads.
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        super().__init__(max_workers)
+        self.metrics = ExecutorMetrics(name, max_workers)
+        EXECUTOR_METRICS[name] = self.metrics
+
+    def _do_submit_job(self, job: Any, run_times: Any) -> None:
+        queued_at = time.monotonic()
+        metrics = self.metrics
+        metrics.job_queued()
+
+        def measured_run_job(*args: Any) -> Any:
+            started_at = time.monotonic()
+            metrics.job_started(started_at - queued_at)
+            try:
+                return run_job(*args)
+            finally:
+                metrics.job_finished(time.monotonic() - started_at)
+
+        def callback(f: Any) -> None:
+            exc, tb = (
+                f.exception_info()
+                if hasattr(f, "exception_info")
+                else (f.exception(), getattr(f.exception(), "__traceback__", None))
+            )
+            if exc:
+                self._run_job_error(job.id, exc, tb)
+            else:
+                self._run_job_success(job.id, f.result())
+
+        f = self._pool.submit(
+            measured_run_job, job, job._jobstore_alias, run_times, self._logger.name
+        )
+        f.add_done_callback(callback)
+
+
+def get_scheduler_executors_config() -> Dict[str, int]:
+    """
+    Returns the worker count of every executor from `settings.SCHEDULER_EXECUTORS`.
+
+    Returns:
+        dict: The max workers keyed by executor name.
+    """
+    executors = dict(DEFAULT_SCHEDULER_EXECUTORS)
+    executors.update(getattr(settings, "SCHEDULER_EXECUTORS", {}))
+    return executors
+
+
+def log_skipped_job(event: Any) -> None:
+    """
+    Logs a job run skipped because the previous run overflowed or the run was missed.
+
+    Args:
+        event (JobEvent): The APScheduler max instances or missed event.
+
+    Returns:
+        None
+    """
+    reason = (
+        "the previous run is still running"
+        if event.code == EVENT_JOB_MAX_INSTANCES
+        else "it missed its misfire grace time"
+    )
+    logger.warning(
+        f"Scheduler job {event.job_id} run at {event.scheduled_run_time} skipped, {reason}."
+    )
+
+
+def create_scheduler() -> BackgroundScheduler:
+    """
+    Creates the background scheduler with one monitored executor per job class.
+
+    Hunters, slow external calls (sentiment, GPT), the short refreshers pages are served
+    from (exchange status, guest snapshot), the background jobs enqueued by users,
+    housekeeping (logs, backups) and the notification outbox run on separate thread
+    pools, so a slow GPT batch or SMTP retry never delays a hunter tick or leaves the
+    pages serving stale data. Jobs pick their pool with the `executor` argument of
+    `add_job`. Runs skipped by `max_instances` or the misfire grace time are logged as
+    warnings.
+
+    Returns:
+        BackgroundScheduler: The configured, not yet started scheduler.
+    """
+    executors = {
+        name: MonitoredThreadPoolExecutor(name, max_workers)
+        for name, max_workers in get_scheduler_executors_config().items()
+    }
+    scheduler = BackgroundScheduler(executors=executors)
+    scheduler.add_listener(log_skipped_job, EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED)
+    return scheduler
+
+
+def add_scheduler_jobs(scheduler: BackgroundScheduler) -> None:
+    """
+    Adds the periodic tasks of the application to a scheduler.
+
+    The hunter, sentiment and GPT stacks are imported here, so only the worker process
+    running the scheduler loads them.
+
+    Scheduled tasks include:
+        - Running the hunters of every interval closing at each minute boundary.
+        - Fetching the market sentiment every hour and the GPT analysis daily.
+        - Refreshing the guest Technical Analysis snapshot every minute, and at startup.
+        - Refreshing the Binance server time and system status every 30 seconds.
+        - Delivering the notification outbox every few seconds.
+        - Running the refreshes enqueued by users every few seconds.
+        - Sending daily logs and clearing logs every 24 hours.
+        - Backing up the database and purging hunter run telemetry, delivered
+          notifications and finished background jobs every 24 hours.
+
+    Args:
+        scheduler (BackgroundScheduler): The scheduler, see `create_scheduler`.
+
+    Returns:
+        None
+    """
+    from hunter.utils import hunter_logic, telemetry_utils
+    from fomo_sapiens.utils import logs_utils, db_utils, outbox_utils, job_utils
+    from analysis.utils import (
+        sentiment_utils,
+        gpt_utils,
+        guest_utils,
+        exchange_status_utils,
+    )
+
+    scheduler.add_job(
+        hunter_logic.run_closing_interval_hunters,
+        "cron",
+        second=2,
+        id="every_minute_hunter_task",
+        executor="hunters",
+        max_instances=1,
+        misfire_grace_time=30,
+    )
+
+    scheduler.add_job(
+        outbox_utils.dispatch_notifications,
+        "interval",
+        seconds=outbox_utils.get_outbox_config()["poll_seconds"],
+        id="notification_outbox_task",
+        executor="notifications",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=30,
+    )
+
+    scheduler.add_job(
+        job_utils.run_background_jobs,
+        "interval",
+        seconds=job_utils.get_background_jobs_config()["poll_seconds"],
+        id="background_jobs_task",
+        executor="jobs",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=30,
+    )
+
+    scheduler.add_job(
+        sentiment_utils.fetch_and_save_sentiment_analysis,
+        "interval",
+        hours=1,
+        id="every_hour_sentiment_check_task",
+        executor="external",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        guest_utils.refresh_guest_snapshot,
+        "interval",
+        seconds=guest_utils.get_guest_snapshot_config()["refresh_seconds"],
+        next_run_time=datetime.now(),
+        id="guest_snapshot_task",
+        executor="refresh",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=30,
+    )
+
+    scheduler.add_job(
+        exchange_status_utils.refresh_exchange_status,
+        "interval",
+        seconds=exchange_status_utils.get_exchange_status_config()["refresh_seconds"],
+        next_run_time=datetime.now(),
+        id="exchange_status_task",
+        executor="refresh",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=30,
+    )
+
+    scheduler.add_job(
+        gpt_utils.fetch_save_and_send_gpt_analysis,
+        "interval",
+        hours=24,
+        id="every_day_gpt_analysis_task",
+        executor="external",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        logs_utils.send_daily_logs,
+        "interval",
+        hours=24,
+        id="every_day_logs_task",
+        executor="housekeeping",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        logs_utils.clear_logs,
+        "interval",
+        hours=24,
+        id="every_day_cleaning_task",
+        executor="housekeeping",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        db_utils.backup_database,
+        "interval",
+        hours=24,
+        id="every_day_db_backup_task",
+        executor="housekeeping",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        telemetry_utils.purge_hunter_telemetry,
+        "interval",
+        hours=24,
+        id="every_day_telemetry_purge_task",
+        executor="housekeeping",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        outbox_utils.purge_notification_outbox,
+        "interval",
+        hours=24,
+        id="every_day_outbox_purge_task",
+        executor="housekeeping",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        job_utils.purge_background_jobs,
+        "interval",
+        hours=24,
+        id="every_day_background_jobs_purge_task",
+        executor="housekeeping",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+    scheduler.add_job(
+        log_scheduler_metrics,
+        "interval",
+        minutes=settings.SCHEDULER_METRICS_INTERVAL_MINUTES,
+        id="scheduler_metrics_task",
+        executor="housekeeping",
+        max_instances=1,
+        misfire_grace_time=900,
+    )
+
+
+def get_scheduler_metrics(name: Optional[str] = None) -> Any:
+    """
+    Returns the metrics snapshot of one or all executors.
+
+    Args:
+        name (str, optional): The executor name. Defaults to all executors.
+
+    Returns:
+        dict: The snapshot, or the snapshots keyed by executor name.
+    """
+    if name:
+        metrics = EXECUTOR_METRICS.get(name)
+        return metrics.snapshot() if metrics else None
+    return {name: metrics.snapshot() for name, metrics in EXECUTOR_METRICS.items()}
+
+
+@exception_handler()
+def log_scheduler_metrics() -> None:
+    """
+    Logs the queue depth and wait times of every executor.
+
+    Executors whose last wait exceeded `settings.SCHEDULER_WAIT_WARNING_SECONDS` are
+    logged as warnings.
+
+    Returns:
+        None
+    """
+    warning_seconds = getattr(settings, "SCHEDULER_WAIT_WARNING_SECONDS", 60)
+    for snapshot in get_scheduler_metrics().values():
+        message = (
+            f"Scheduler executor {snapshot['executor']} "
+            f"workers {snapshot['max_workers']} queued {snapshot['queued']} "
+            f"running {snapshot['running']} completed {snapshot['completed']} "
+            f"wait last {snapshot['last_wait']:.2f}s avg {snapshot['avg_wait']:.2f}s "
+            f"max {snapshot['max_wait']:.2f}s"
+        )
+        if snapshot["last_wait"] > warning_seconds:
+            logger.warning(message)
+        else:
+            logger.info(message)
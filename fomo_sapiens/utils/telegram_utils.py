@@ -1,45 +1,327 @@
 import os
+import time
+import atexit
 import asyncio
+import threading
+import concurrent.futures
+from typing import Dict, Optional
 from dotenv import load_dotenv
+from django.conf import settings
 from .logging import logger
 from .exception_handlers import exception_handler
-from ..utils.retry_connection import retry_connection
 from telegram import Bot as TelegramBot
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 
 load_dotenv()
 
+DEFAULT_TELEGRAM_API_BASE_URL = "https://api.telegram.org/bot"
+DEFAULT_TELEGRAM_NOTIFIER = {
+    "max_concurrency": 8,
+    "global_rate": 30.0,
+    "chat_interval": 1.0,
+    "max_attempts": 3,
+}
 
-@exception_handler(default_return=False)
-@retry_connection()
-def init_telegram_bot() -> TelegramBot:
+
+class TelegramRateLimiter:
+    """
+    Spaces out messages to honour Telegram's global and per-chat rate limits.
+
+    Every message reserves the earliest slot that is at least `1 / global_rate` seconds
+    after the previous message and `chat_interval` seconds after the previous message
+    to the same chat. It is used from the notifier event loop only, so reserving a slot
+    needs no lock.
+
+    Args:
+        global_rate (float): Messages per second over all chats.
+        chat_interval (float): Seconds between two messages to the same chat.
+    """
+
+    def __init__(self, global_rate: float, chat_interval: float) -> None:
+        self.global_interval = 1 / global_rate
+        self.chat_interval = chat_interval
+        self._next_global = 0.0
+        self._next_chat: Dict[str, float] = {}
+
+    def reserve(self, chat_id: str, now: Optional[float] = None) -> float:
+        """
+        Reserves the next slot for a message to `chat_id`.
+
+        Args:
+            chat_id (str): The Telegram chat ID.
+            now (float, optional): The current monotonic time.
+
+        Returns:
+            float: The seconds to wait before sending.
+        """
+        now = time.monotonic() if now is None else now
+        if len(self._next_chat) > 1000:
+            self._next_chat = {
+                chat: slot for chat, slot in self._next_chat.items() if slot > now
+            }
+        slot = max(now, self._next_global, self._next_chat.get(chat_id, 0.0))
+        self._next_global = slot + self.global_interval
+        self._next_chat[chat_id] = slot + self.chat_interval
+        return slot - now
+
+    def pause(self, seconds: float) -> None:
+        """Delays all messages by `seconds`, after Telegram answered 429 Retry-After."""
+        self._next_global = max(self._next_global, time.monotonic() + seconds)
+
+    async def wait(self, chat_id: str) -> None:
+        """Waits for the next slot for a message to `chat_id`."""
+        delay = self.reserve(chat_id)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TelegramNotifier:
+    """
+    Sends Telegram messages from a long-lived bot on a background event loop.
+
+    One bot with one pooled HTTP session lives on a persistent event loop in a daemon
+    thread. `enqueue` hands a message to the loop and returns at once, and up to
+    `max_concurrency` messages are sent at the same time within the rate limits of
+    `TelegramRateLimiter`. Flood control (429) and network errors are retried.
+
+    Args:
+        token (str, optional): The bot token. Defaults to the TELEGRAM_API_SECRET env var.
+        base_url (str, optional): The Bot API URL the token is appended to.
+            Defaults to `settings.TELEGRAM_API_BASE_URL`.
+        **options: Overrides of `settings.TELEGRAM_NOTIFIER`: 'max_concurrency',
+            'global_rate', 'chat_interval' and 'max_attempts'.
+
+    Attributes:
+        sent (int): Messages sent successfully.
+        failed (int): Messages given up on.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        **options: float,
+    ) -> None:
+        config = dict(DEFAULT_TELEGRAM_NOTIFIER)
+        config.update(getattr(settings, "TELEGRAM_NOTIFIER", {}))
+        config.update(options)
+        self.token = token or os.environ["TELEGRAM_API_SECRET"]
+        self.base_url = base_url or getattr(
+            settings, "TELEGRAM_API_BASE_URL", DEFAULT_TELEGRAM_API_BASE_URL
+        )
+        self.max_concurrency = int(config["max_concurrency"])
+        self.max_attempts = int(config["max_attempts"])
+        self.limiter = TelegramRateLimiter(
+            config["global_rate"], config["chat_interval"]
+        )
+        self.sent = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._queue: Optional[asyncio.Queue] = None
+        self._bot: Optional[TelegramBot] = None
+        self._bot_ready: Optional[asyncio.Lock] = None
+        self._workers: list = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the event loop thread is running and ready to take messages."""
+        return bool(self._thread and self._thread.is_alive() and self._ready.is_set())
+
+    def start(self) -> None:
+        """
+        Starts the event loop thread with the bot and the sending tasks.
+
+        Returns once the loop is ready to take messages, also when another thread is
+        still starting it.
+        """
+        with self._lock:
+            if not (self._thread and self._thread.is_alive()):
+                self._ready = threading.Event()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(self._ready,),
+                    name="telegram-notifier",
+                    daemon=True,
+                )
+                self._thread.start()
+            ready = self._ready
+        ready.wait()
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        self._bot_ready = asyncio.Lock()
+        self._bot = TelegramBot(
+            token=self.token,
+            base_url=self.base_url,
+            request=HTTPXRequest(connection_pool_size=self.max_concurrency),
+        )
+        self._workers = [
+            self._loop.create_task(self._work()) for _ in range(self.max_concurrency)
+        ]
+        ready.set()
+        self._loop.run_forever()
+
+    def enqueue(self, chat_id: str, msg: str) -> bool:
+        """
+        Queues a message without waiting for it to be sent.
+
+        Args:
+            chat_id (str): The Telegram chat ID where the message should be sent.
+            msg (str): The message content.
+
+        Returns:
+            bool: True once the message is queued.
+        """
+        self.start()
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (str(chat_id), msg))
+        return True
+
+    def submit(self, chat_id: str, msg: str) -> concurrent.futures.Future:
+        """
+        Sends a message concurrently with the others and returns its outcome as a future.
+
+        Args:
+            chat_id (str): The Telegram chat ID where the message should be sent.
+            msg (str): The message content.
+
+        Returns:
+            concurrent.futures.Future: Resolves to True once sent, False if given up on.
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(
+            self._send(str(chat_id), msg), self._loop
+        )
+
+    async def _work(self) -> None:
+        while True:
+            chat_id, msg = await self._queue.get()
+            try:
+                await self._send(chat_id, msg)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Telegram {chat_id}: message dropped: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _send(self, chat_id: str, msg: str) -> bool:
+        for attempt in range(1, self.max_attempts + 1):
+            await self.limiter.wait(chat_id)
+            try:
+                async with self._bot_ready:
+                    await self._bot.initialize()
+                await self._bot.send_message(chat_id=chat_id, text=msg)
+            except RetryAfter as e:
+                retry_after = getattr(e.retry_after, "total_seconds", None)
+                delay = retry_after() if retry_after else float(e.retry_after)
+                logger.warning(f"Telegram {chat_id}: flood control, retry in {delay}s.")
+                self.limiter.pause(delay)
+            except (BadRequest, Forbidden) as e:
+                logger.error(f"Telegram {chat_id}: not sent: {e}")
+                break
+            except TelegramError as e:
+                logger.warning(
+                    f"Telegram {chat_id}: attempt {attempt}/{self.max_attempts} failed: {e}"
+                )
+                if attempt < self.max_attempts:
+                    await asyncio.sleep(2 ** (attempt - 1))
+            else:
+                self.sent += 1
+                logger.info(f"Telegram {chat_id}: sent successfully.")
+                return True
+
+        self.failed += 1
+        logger.error(f"Telegram {chat_id}: message dropped.")
+        return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all queued messages are sent or given up on.
+
+        Args:
+            timeout (float, optional): The maximum seconds to wait.
+
+        Returns:
+            bool: True if the queue was drained in time.
+        """
+        if not self.running:
+            return True
+        future = asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop)
+        try:
+            future.result(timeout)
+            return True
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return False
+
+    def stop(self, timeout: Optional[float] = 10) -> None:
+        """
+        Sends the queued messages, closes the HTTP session and stops the event loop.
+
+        Args:
+            timeout (float, optional): The maximum seconds to wait for queued messages.
+
+        Returns:
+            None
+        """
+        if not self.running:
+            return
+        if not self.flush(timeout):
+            logger.warning(
+                f"Telegram notifier stopped with {self._queue.qsize()} unsent messages."
+            )
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop.close()
+        self._thread = None
+
+    async def _shutdown(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        await self._bot.shutdown()
+
+
+_notifier: Optional[TelegramNotifier] = None
+_notifier_lock = threading.Lock()
+
+
+def get_telegram_notifier() -> TelegramNotifier:
     """
-    Initializes and returns a Telegram bot instance.
+    Returns the notifier of this process, created on first use.
+
+    Queued messages are still sent when the process exits normally.
 
     Returns:
-        TelegramBot: An instance of the Telegram bot.
+        TelegramNotifier: The process-wide notifier.
     """
-    TELEGRAM_API_SECRET = os.environ["TELEGRAM_API_SECRET"]
-    return TelegramBot(token=TELEGRAM_API_SECRET)
+    global _notifier
+    with _notifier_lock:
+        if _notifier is None:
+            _notifier = TelegramNotifier()
+            atexit.register(_notifier.stop)
+        return _notifier
 
 
 @exception_handler(default_return=False)
-@retry_connection()
 def send_telegram(chat_id: str, msg: str) -> bool:
     """
-    Sends a message to a specific Telegram chat.
+    Queues a message to a specific Telegram chat on the notifier of this process.
+
+    The message is sent in the background, see `TelegramNotifier`, so the caller does
+    not wait for the Telegram round trip.
 
     Args:
         chat_id (str): The Telegram chat ID where the message should be sent.
         msg (str): The message content.
 
     Returns:
-        bool: True if the message was sent successfully.
+        bool: True if the message was queued successfully.
     """
-    telegram_bot = init_telegram_bot()
-
-    if telegram_bot:
-        asyncio.run(telegram_bot.send_message(chat_id=chat_id, text=msg))
-        logger.info(f"Telegram {chat_id}: sent successfully.")
-        return True
-
-    return False
+    return get_telegram_notifier().enqueue(chat_id, msg)
@@ -0,0 +1,77 @@
+import threading
+from typing import Optional
+from django.conf import settings
+from apscheduler.schedulers.background import BackgroundScheduler
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.leader_utils import LeaderElector
+from fomo_sapiens.utils.scheduler_utils import add_scheduler_jobs, create_scheduler
+
+
+class SchedulerWorker:
+    """
+    Runs the background scheduler in a dedicated worker process.
+
+    The worker joins the scheduler lease election and runs the scheduler only while it
+    is the leader, so several workers (on one or many hosts) can be started for fast
+    failover while the jobs run exactly once.
+
+    Args:
+        lease_name (str, optional): The lease name. Defaults to `settings.SCHEDULER_LEASE_NAME`.
+        ttl (float, optional): The lease duration in seconds.
+            Defaults to `settings.SCHEDULER_LEASE_TTL_SECONDS`.
+
+    Attributes:
+        scheduler (BackgroundScheduler): The running scheduler, None while on standby.
+        elector (LeaderElector): The heartbeat competing for the lease.
+    """
+
+    def __init__(
+        self, lease_name: Optional[str] = None, ttl: Optional[float] = None
+    ) -> None:
+        self.scheduler: Optional[BackgroundScheduler] = None
+        self.elector = LeaderElector(
+            lease_name or settings.SCHEDULER_LEASE_NAME,
+            on_elected=self.start_scheduler,
+            on_demoted=self.stop_scheduler,
+            ttl=ttl,
+        )
+
+    def start_scheduler(self) -> None:
+        """Creates the scheduler with all application jobs and starts it."""
+        if self.scheduler:
+            return
+
+        scheduler = create_scheduler()
+        add_scheduler_jobs(scheduler)
+        logger.info("Starting scheduler...")
+        scheduler.start()
+        self.scheduler = scheduler
+
+    def stop_scheduler(self) -> None:
+        """
+        Shuts the scheduler down after the worker lost the leadership or is stopping.
+
+        Running jobs are not awaited, so a new leader is never blocked by them.
+        """
+        scheduler, self.scheduler = self.scheduler, None
+        if scheduler and scheduler.running:
+            logger.info("Stopping scheduler...")
+            scheduler.shutdown(wait=False)
+
+    def run(self, stop_event: threading.Event) -> None:
+        """
+        Runs the worker until `stop_event` is set, then steps down and releases the lease.
+
+        Args:
+            stop_event (threading.Event): Set to stop the worker, e.g. on SIGTERM.
+
+        Returns:
+            None
+        """
+        logger.info(f"Hunter worker {self.elector.holder} started.")
+        self.elector.start()
+        try:
+            stop_event.wait()
+        finally:
+            self.elector.stop()
+            logger.info(f"Hunter worker {self.elector.holder} stopped.")
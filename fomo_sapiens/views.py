@@ -1,7 +1,9 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from django.http import HttpRequest, HttpResponse
-from analysis.utils.fetch_utils import fetch_server_time, fetch_system_status
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from analysis.utils.exchange_status_utils import get_exchange_status_context
+from fomo_sapiens.models import BackgroundJob
+from fomo_sapiens.utils.job_utils import get_job_status
 
 
 def custom_404_view(request: HttpRequest, exception: Exception) -> HttpResponse:
@@ -19,22 +21,15 @@ def custom_404_view(request: HttpRequest, exception: Exception) -> HttpResponse:
     Returns:
         HttpResponse: A redirect to the home page.
     """
-    server_time = fetch_server_time()
-    system_status = fetch_system_status()
-    return render(
-        request,
-        "error_404.html",
-        {"server_time": server_time, "system_status": system_status},
-        status=404,
-    )
+    return render(request, "error_404.html", get_exchange_status_context(), status=404)
 
 
 def home_page(request: HttpRequest) -> HttpResponse:
     """
     Renders the home page with server time and system status.
 
-    This view fetches the current server time and system status,
-    then renders the home page template with this information.
+    The server time and system status are read from the exchange status cached by
+    the worker, see `refresh_exchange_status`, so no request reaches Binance.
 
     Args:
         request (HttpRequest): The request object.
@@ -42,10 +37,26 @@ def home_page(request: HttpRequest) -> HttpResponse:
     Returns:
         HttpResponse: The rendered home page with server time and system status.
     """
-    server_time = fetch_server_time()
-    system_status = fetch_system_status()
-    return render(
-        request,
-        "home/home_page.html",
-        {"server_time": server_time, "system_status": system_status},
-    )
+    return render(request, "home/home_page.html", get_exchange_status_context())
+
+
+def background_job_status(request: HttpRequest, job_id: int) -> JsonResponse:
+    """
+    Returns the status of a background job enqueued by the requesting user.
+
+    Polled by the analysis and hunters pages after a refresh was enqueued, see
+    `static/js/jobs.js`.
+    Guests only see jobs enqueued by guests.
+
+    Args:
+        request (HttpRequest): The request object.
+        job_id (int): The job id.
+
+    Returns:
+        JsonResponse: The job status, see `get_job_status`, or an error with status 404.
+    """
+    user = request.user if request.user.is_authenticated else None
+    job = BackgroundJob.objects.filter(id=job_id, user=user).first()
+    if job is None:
+        return JsonResponse({"error": "Job not found."}, status=404)
+    return JsonResponse(get_job_status(job))
@@ -10,9 +10,88 @@ objects through the admin interface.
 
 Model:
     TechnicalAnalysisHunter: A model that stores settings related to technical analysis hunter for the application.
+    HunterSignalState: A model that stores the persistent signal state of each hunter.
+    HunterRunTelemetry: A model that stores the stage timings of each hunter run. Its change
+        list shows p50/p95 per stage and the slowest hunters of the filtered rows, which can
+        be exported as CSV.
 """
 
 from django.contrib import admin
-from .models import TechnicalAnalysisHunter
+from django.http import HttpResponse
+from django.urls import path
+from .models import TechnicalAnalysisHunter, HunterSignalState, HunterRunTelemetry
+from .utils.telemetry_utils import (
+    calculate_stage_percentiles,
+    get_slowest_hunters,
+    write_telemetry_summary_csv,
+)
 
 admin.site.register(TechnicalAnalysisHunter)
+
+
+@admin.register(HunterSignalState)
+class HunterSignalStateAdmin(admin.ModelAdmin):
+    list_display = (
+        "hunter",
+        "state",
+        "state_since",
+        "active_candles",
+        "last_notified_signal",
+        "last_notified_time",
+        "notified_count",
+        "suppressed_count",
+    )
+    list_filter = ("state", "last_notified_signal")
+    readonly_fields = ("updated_at",)
+    ordering = ("-state_since",)
+
+
+@admin.register(HunterRunTelemetry)
+class HunterRunTelemetryAdmin(admin.ModelAdmin):
+    list_display = (
+        "hunter",
+        "created_at",
+        "candle_time",
+        "result",
+        "notified",
+        "fetch_ms",
+        "compute_ms",
+        "notify_ms",
+        "save_ms",
+        "total_ms",
+        "lag_ms",
+    )
+    list_filter = ("result", "notified", "hunter__interval", "created_at")
+    list_select_related = ("hunter",)
+    date_hierarchy = "created_at"
+    ordering = ("-created_at",)
+
+    def get_filtered_queryset(self, request):
+        return self.get_changelist_instance(request).get_queryset(request)
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = extra_context or {}
+        try:
+            queryset = self.get_filtered_queryset(request)
+        except Exception:
+            queryset = self.get_queryset(request)
+        extra_context["stage_percentiles"] = calculate_stage_percentiles(queryset)
+        extra_context["slowest_hunters"] = get_slowest_hunters(queryset)
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def get_urls(self):
+        return [
+            path(
+                "summary.csv",
+                self.admin_site.admin_view(self.export_summary_view),
+                name="hunter_hunterruntelemetry_summary",
+            )
+        ] + super().get_urls()
+
+    def export_summary_view(self, request):
+        response = HttpResponse(content_type="text/csv")
+        response["Content-Disposition"] = (
+            'attachment; filename="hunter_telemetry_summary.csv"'
+        )
+        write_telemetry_summary_csv(self.get_filtered_queryset(request), response)
+        return response
@@ -89,6 +89,9 @@ class TechnicalAnalysisHunterForm(forms.ModelForm):
         ma50_signals (bool): Whether to use the 50-period moving average signals.
         ma200_signals (bool): Whether to use the 200-period moving average signals.
         ma_cross_signals (bool): Whether to use moving average crossover signals.
+        signal_edge_trigger (bool): Whether to notify only when the signal state changes.
+        signal_cooldown_candles (int): Minimum candles between two notifications of a signal.
+        signal_hysteresis_candles (int): Candles without the signal needed to re-arm it.
         note (str): A note or additional comment for the configuration.
 
     The form uses Django's ModelForm to create and manage instances of
@@ -174,6 +177,9 @@ class TechnicalAnalysisHunterForm(forms.ModelForm):
             "ma50_signals",
             "ma200_signals",
             "ma_cross_signals",
+            "signal_edge_trigger",
+            "signal_cooldown_candles",
+            "signal_hysteresis_candles",
             "note",
         ]
 
@@ -274,5 +280,12 @@ class TechnicalAnalysisHunterForm(forms.ModelForm):
         "ma50_signals": forms.CheckboxInput(attrs={"class": "form-check-input"}),
         "ma200_signals": forms.CheckboxInput(attrs={"class": "form-check-input"}),
         "ma_cross_signals": forms.CheckboxInput(attrs={"class": "form-check-input"}),
+        "signal_edge_trigger": forms.CheckboxInput(attrs={"class": "form-check-input"}),
+        "signal_cooldown_candles": forms.NumberInput(
+            attrs={"class": "form-control w-100"}
+        ),
+        "signal_hysteresis_candles": forms.NumberInput(
+            attrs={"class": "form-control w-100"}
+        ),
         "note": forms.Textarea(attrs={"class": "form-control w-100", "rows": 3}),
     }
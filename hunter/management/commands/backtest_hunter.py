@@ -0,0 +1,62 @@
+"""
+Management command backtesting a hunter configuration on historical klines.
+
+Usage:
+    python manage.py backtest_hunter <hunter_id> --start 2024-01-01 [--end 2025-01-01]
+                                     [--horizons 1 4 24] [--signals]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from hunter.models import TechnicalAnalysisHunter
+from hunter.utils.backtest_utils import (
+    DEFAULT_BACKTEST_HORIZONS,
+    run_hunter_backtest,
+)
+
+
+class Command(BaseCommand):
+    help = "Backtests a hunter configuration over a historical kline range."
+
+    def add_arguments(self, parser):
+        parser.add_argument("hunter_id", type=int)
+        parser.add_argument(
+            "--start", required=True, help="Range start, e.g. 2024-01-01."
+        )
+        parser.add_argument("--end", default=None, help="Range end. Defaults to now.")
+        parser.add_argument(
+            "--horizons",
+            type=int,
+            nargs="+",
+            default=list(DEFAULT_BACKTEST_HORIZONS),
+            help="Forward horizons in candles.",
+        )
+        parser.add_argument(
+            "--signals", action="store_true", help="Print every signal as well."
+        )
+
+    def handle(self, *args, **options):
+        if any(horizon <= 0 for horizon in options["horizons"]):
+            raise CommandError("Horizons must be positive numbers of candles.")
+
+        hunter = TechnicalAnalysisHunter.objects.filter(id=options["hunter_id"]).first()
+        if not hunter:
+            raise CommandError(f"Hunter {options['hunter_id']} not found.")
+
+        result = run_hunter_backtest(
+            hunter,
+            start_str=options["start"],
+            end_str=options["end"],
+            horizons=options["horizons"],
+        )
+        if not result:
+            raise CommandError("Backtest failed. Check the logs for details.")
+
+        self.stdout.write(
+            f"Hunter {hunter.id} {hunter.symbol} {hunter.interval} backtest "
+            f"{options['start']} - {options['end'] or 'now'}"
+        )
+        for name, value in result["stats"].items():
+            self.stdout.write(f"{name}: {value}")
+
+        if options["signals"]:
+            self.stdout.write(result["signals"].to_string(index=False))
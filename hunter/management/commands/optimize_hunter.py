@@ -0,0 +1,221 @@
+"""
+Management command sweeping hunter parameters against historical klines.
+
+Usage:
+    python manage.py optimize_hunter <hunter_id> --start 2024-01-01 [--end 2025-01-01]
+        --param rsi_buy=20:40:5 --param avg_rsi_period=1,3,5 [--samples 500] [--seed 1]
+        [--metric buy_avg_return_24 --metric buy_hit_rate_24] [--min-signals 5]
+        [--processes 8] [--top 10] [--save | --noinput]
+        [--train-candles 2000 --test-candles 500 [--step-candles 500]]
+
+With --train-candles and --test-candles the variants are re-optimised on every train
+slice of a rolling walk-forward and the winner is scored on the following test slice.
+"""
+
+import sys
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from hunter.models import TechnicalAnalysisHunter
+from hunter.utils.backtest_utils import DEFAULT_BACKTEST_HORIZONS, fetch_backtest_data
+from hunter.utils.optimizer_utils import (
+    DEFAULT_SWEEP_METRICS,
+    parse_parameter_space,
+    generate_parameter_grid,
+    sample_parameter_space,
+    run_parameter_sweep,
+    run_walk_forward,
+    summarize_walk_forward,
+    rank_sweep_results,
+    save_sweep_winner_as_hunter,
+)
+
+
+class Command(BaseCommand):
+    help = "Sweeps hunter parameters over historical klines and ranks the variants."
+
+    def add_arguments(self, parser):
+        parser.add_argument("hunter_id", type=int)
+        parser.add_argument(
+            "--start", required=True, help="Range start, e.g. 2024-01-01."
+        )
+        parser.add_argument("--end", default=None, help="Range end. Defaults to now.")
+        parser.add_argument(
+            "--param",
+            action="append",
+            required=True,
+            help="Values to sweep, e.g. rsi_buy=20,25,30 or rsi_buy=20:40:5.",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=None,
+            help="Evaluate this many random variants instead of the full grid.",
+        )
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument(
+            "--metric",
+            action="append",
+            default=None,
+            help="Ranking metric, repeatable. Prefix with '-' to rank ascending.",
+        )
+        parser.add_argument("--signal", choices=["buy", "sell"], default="buy")
+        parser.add_argument("--min-signals", type=int, default=1)
+        parser.add_argument(
+            "--horizons",
+            type=int,
+            nargs="+",
+            default=list(DEFAULT_BACKTEST_HORIZONS),
+            help="Forward horizons in candles.",
+        )
+        parser.add_argument("--processes", type=int, default=None)
+        parser.add_argument("--top", type=int, default=10)
+        parser.add_argument(
+            "--save", action="store_true", help="Save the winner as a new hunter."
+        )
+        parser.add_argument(
+            "--train-candles",
+            type=int,
+            default=None,
+            help="Walk-forward train slice length. Enables the walk-forward mode.",
+        )
+        parser.add_argument(
+            "--test-candles",
+            type=int,
+            default=None,
+            help="Walk-forward test slice length.",
+        )
+        parser.add_argument(
+            "--step-candles",
+            type=int,
+            default=None,
+            help="Candles between walk-forward folds. Defaults to the test length.",
+        )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Do not offer to save the winner.",
+        )
+
+    def handle(self, *args, **options):
+        if any(horizon <= 0 for horizon in options["horizons"]):
+            raise CommandError("Horizons must be positive numbers of candles.")
+
+        hunter = TechnicalAnalysisHunter.objects.filter(id=options["hunter_id"]).first()
+        if not hunter:
+            raise CommandError(f"Hunter {options['hunter_id']} not found.")
+
+        try:
+            space = parse_parameter_space(options["param"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options["samples"]:
+            variants = sample_parameter_space(
+                space, options["samples"], options["seed"]
+            )
+        else:
+            variants = generate_parameter_grid(space)
+
+        klines = fetch_backtest_data(hunter, options["start"], options["end"])
+        if klines is None or klines.empty:
+            raise CommandError("No klines fetched. Check the logs for details.")
+
+        metrics = options["metric"] or list(DEFAULT_SWEEP_METRICS)
+
+        if options["train_candles"]:
+            self.handle_walk_forward(hunter, klines, variants, space, metrics, options)
+            return
+
+        self.stdout.write(
+            f"Evaluating {len(variants)} variants of hunter {hunter.id} "
+            f"on {len(klines)} candles..."
+        )
+        results = run_parameter_sweep(
+            hunter,
+            klines,
+            variants,
+            horizons=options["horizons"],
+            processes=options["processes"],
+            start=options["start"],
+            end=options["end"],
+        )
+        if results is None or results.empty:
+            raise CommandError("Parameter sweep failed. Check the logs for details.")
+
+        try:
+            ranked = rank_sweep_results(
+                results, metrics, options["min_signals"], options["signal"]
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if ranked.empty:
+            self.stdout.write("No variant produced enough signals.")
+            return
+
+        columns = (
+            list(space)
+            + [f"{options['signal']}_count"]
+            + [metric.lstrip("-") for metric in metrics]
+        )
+        self.stdout.write(ranked[columns].head(options["top"]).to_string(index=False))
+
+        winner = {name: ranked.iloc[0][name] for name in space}
+        winner = {
+            name: value.item() if isinstance(value, np.generic) else value
+            for name, value in winner.items()
+        }
+        self.stdout.write(f"Best variant: {winner}")
+
+        save = options["save"]
+        if not save and options["interactive"] and sys.stdin.isatty():
+            save = input("Save the best variant as a new hunter? [y/N] ").lower() == "y"
+
+        if save:
+            new_hunter = save_sweep_winner_as_hunter(hunter, winner)
+            if new_hunter:
+                self.stdout.write(f"Saved as hunter {new_hunter.id} (sleeping).")
+
+    def handle_walk_forward(self, hunter, klines, variants, space, metrics, options):
+        if not options["test_candles"]:
+            raise CommandError("--test-candles is required with --train-candles.")
+
+        self.stdout.write(
+            f"Walk-forward of {len(variants)} variants of hunter {hunter.id} "
+            f"on {len(klines)} candles..."
+        )
+        try:
+            folds = run_walk_forward(
+                hunter,
+                klines,
+                variants,
+                options["train_candles"],
+                options["test_candles"],
+                step_candles=options["step_candles"],
+                metrics=metrics,
+                min_signals=options["min_signals"],
+                signal=options["signal"],
+                horizons=options["horizons"],
+                processes=options["processes"],
+                start=options["start"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if folds is None or folds.empty:
+            raise CommandError("No walk-forward fold fits in the fetched range.")
+
+        test_metrics = [f"test_{metric.lstrip('-')}" for metric in metrics]
+        columns = ["fold", "test_start", "test_end"] + [
+            column
+            for column in list(space)
+            + [f"test_{options['signal']}_count"]
+            + test_metrics
+            if column in folds
+        ]
+        self.stdout.write(folds[columns].to_string(index=False))
+
+        for name, value in summarize_walk_forward(folds, metrics).items():
+            self.stdout.write(f"{name}: {value}")
@@ -90,6 +90,13 @@ Attributes:
     stoch_sell (int): The Stochastic value indicating a sell signal. Default is 80.
     atr_buy_threshold (float): The threshold for ATR indicating a buy signal. Default is 0.005.
 
+    signal_edge_trigger (bool): Notify only when the signal state changes, not on every candle
+        the conditions hold. Default is True.
+    signal_cooldown_candles (int): Minimum number of candles between two notifications of the
+        same signal. Default is 0.
+    signal_hysteresis_candles (int): Number of consecutive candles without the signal needed
+        before the signal state resets and can fire again. Default is 1.
+
     df (JSONField): The JSON data containing market data for technical analysis.
     df_last_fetch_time (DateTimeField): The timestamp of the last data fetch.
 
@@ -195,6 +202,10 @@ class TechnicalAnalysisHunter(models.Model):
     stoch_sell: models.IntegerField = models.IntegerField(default=80)
     atr_buy_threshold: models.FloatField = models.FloatField(default=0.005)
 
+    signal_edge_trigger: models.BooleanField = models.BooleanField(default=True)
+    signal_cooldown_candles: models.IntegerField = models.IntegerField(default=0)
+    signal_hysteresis_candles: models.IntegerField = models.IntegerField(default=1)
+
     df: models.JSONField = models.JSONField(default=default_df)
     df_last_fetch_time: models.DateTimeField = models.DateTimeField(
         default=timezone.now
@@ -202,3 +213,116 @@ class TechnicalAnalysisHunter(models.Model):
 
     def __str__(self) -> str:
         return f"Hunter settings for {self.user.username}"
+
+
+class HunterSignalState(models.Model):
+    """
+    Model storing the persistent signal state of a 'TechnicalAnalysisHunter'.
+
+    The state is updated on every candle the hunter evaluates and decides whether a
+    signal is a transition worth notifying, see `hunter.utils.signal_state_utils`.
+
+    Attributes:
+        hunter (OneToOneField): The hunter the state belongs to.
+        state (str): The active signal ('buy', 'sell') or 'none'. Default is 'none'.
+        state_since (DateTimeField): When the current state was entered.
+        active_candles (int): Consecutive candles the active signal held. Default is 0.
+        clear_candles (int): Consecutive candles without the active signal. Default is 0.
+        last_signal_time (DateTimeField): When the conditions last held.
+        last_notified_signal (str): The last notified signal. Default is an empty string.
+        last_notified_time (DateTimeField): When a signal was last notified.
+        notified_count (int): The number of notified signals. Default is 0.
+        suppressed_count (int): The number of signals not notified. Default is 0.
+        updated_at (DateTimeField): The time of the last update.
+
+    Methods:
+        __str__: Returns a string representation in the format "Hunter {id} {state}".
+    """
+
+    STATE_CHOICES = [("none", "None"), ("buy", "Buy"), ("sell", "Sell")]
+
+    hunter: models.OneToOneField = models.OneToOneField(
+        TechnicalAnalysisHunter, on_delete=models.CASCADE, related_name="signal_state"
+    )
+    state: models.CharField = models.CharField(
+        max_length=4, choices=STATE_CHOICES, default="none"
+    )
+    state_since: models.DateTimeField = models.DateTimeField(default=timezone.now)
+    active_candles: models.IntegerField = models.IntegerField(default=0)
+    clear_candles: models.IntegerField = models.IntegerField(default=0)
+    last_signal_time: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+    last_notified_signal: models.CharField = models.CharField(
+        max_length=4, default="", blank=True
+    )
+    last_notified_time: models.DateTimeField = models.DateTimeField(
+        null=True, blank=True
+    )
+    notified_count: models.IntegerField = models.IntegerField(default=0)
+    suppressed_count: models.IntegerField = models.IntegerField(default=0)
+    updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Hunter {self.hunter_id} {self.state}"
+
+
+class HunterRunTelemetry(models.Model):
+    """
+    Model storing the stage timings and result of a single hunter run.
+
+    One compact row is written per hunter and evaluated candle, and rows older than
+    `settings.HUNTER_TELEMETRY_RETENTION_DAYS` are purged daily, see
+    `hunter.utils.telemetry_utils`. Timings are in milliseconds; work shared by several
+    hunters (a fetch of the same market, a matrix evaluation) is split evenly between them.
+
+    Attributes:
+        hunter (ForeignKey): The hunter that ran.
+        created_at (DateTimeField): When the run finished.
+        candle_time (DateTimeField): The open time of the evaluated candle.
+        result (str): 'buy', 'sell', 'none' or 'sleeping'.
+        notified (bool): Whether a signal was sent.
+        fetch_ms (float): Fetching the klines.
+        compute_ms (float): Calculating the indicators.
+        averages_ms (float): Calculating the indicator averages.
+        trend_ms (float): Checking the trend.
+        signal_ms (float): Evaluating the buy and sell conditions.
+        notify_ms (float): Updating the signal state and sending the notifications.
+        save_ms (float): Saving the hunter data to the database.
+        total_ms (float): The sum of all stages.
+        lag_ms (float): The time from the candle close until the run finished, if known.
+
+    Methods:
+        __str__: Returns a string representation in the format "Hunter {id} {result} {total} ms".
+    """
+
+    RESULT_CHOICES = [
+        ("buy", "Buy"),
+        ("sell", "Sell"),
+        ("none", "None"),
+        ("sleeping", "Sleeping"),
+    ]
+
+    hunter: models.ForeignKey = models.ForeignKey(
+        TechnicalAnalysisHunter, on_delete=models.CASCADE, related_name="telemetry"
+    )
+    created_at: models.DateTimeField = models.DateTimeField(
+        default=timezone.now, db_index=True
+    )
+    candle_time: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+    result: models.CharField = models.CharField(max_length=8, choices=RESULT_CHOICES)
+    notified: models.BooleanField = models.BooleanField(default=False)
+    fetch_ms: models.FloatField = models.FloatField(default=0)
+    compute_ms: models.FloatField = models.FloatField(default=0)
+    averages_ms: models.FloatField = models.FloatField(default=0)
+    trend_ms: models.FloatField = models.FloatField(default=0)
+    signal_ms: models.FloatField = models.FloatField(default=0)
+    notify_ms: models.FloatField = models.FloatField(default=0)
+    save_ms: models.FloatField = models.FloatField(default=0)
+    total_ms: models.FloatField = models.FloatField(default=0)
+    lag_ms: models.FloatField = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["hunter", "created_at"])]
+        verbose_name_plural = "hunter run telemetry"
+
+    def __str__(self) -> str:
+        return f"Hunter {self.hunter_id} {self.result} {self.total_ms:.0f} ms"
@@ -0,0 +1,111 @@
+import unittest
+import numpy as np
+import pandas as pd
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from hunter.models import TechnicalAnalysisHunter
+from hunter.utils.backtest_utils import (
+    hunter_settings_snapshot,
+    calculate_forward_returns,
+    calculate_forward_extremes,
+    calculate_signal_statistics,
+    run_hunter_backtest,
+)
+from hunter.utils.vectorized_signals import calculate_ta_signal_masks
+from analysis.utils.calc_utils import calculate_ta_indicators
+from hunter.tests.test_vectorized_signals import make_klines, make_settings
+
+
+class TestBacktest(unittest.TestCase):
+
+    def test_hunter_settings_snapshot(self):
+        hunter = TechnicalAnalysisHunter(symbol="ETHUSDC", rsi_buy=25, df="[]")
+
+        snapshot = hunter_settings_snapshot(hunter, rsi_sell=75)
+
+        self.assertEqual(snapshot.symbol, "ETHUSDC")
+        self.assertEqual(snapshot.rsi_buy, 25)
+        self.assertEqual(snapshot.rsi_sell, 75)
+        self.assertFalse(hasattr(snapshot, "df"))
+        self.assertFalse(hasattr(snapshot, "user"))
+
+    def test_calculate_forward_returns(self):
+        close = np.array([100.0, 110.0, 99.0, 121.0])
+
+        returns = calculate_forward_returns(close, 2)
+
+        np.testing.assert_allclose(returns[:2], [-0.01, 0.1])
+        self.assertTrue(np.isnan(returns[2:]).all())
+
+    def test_calculate_forward_extremes(self):
+        low = np.array([5.0, 4.0, 6.0, 3.0, 7.0])
+
+        lows = calculate_forward_extremes(low, 2, np.min)
+
+        np.testing.assert_allclose(lows[:3], [4.0, 3.0, 3.0])
+        self.assertTrue(np.isnan(lows[3:]).all())
+
+    def test_calculate_signal_statistics(self):
+        df = pd.DataFrame(
+            {
+                "close": [100.0, 110.0, 99.0, 121.0],
+                "high": [101.0, 111.0, 100.0, 122.0],
+                "low": [95.0, 90.0, 98.0, 120.0],
+            }
+        )
+        signals = np.array([True, True, False, False])
+
+        stats = calculate_signal_statistics(df, signals, 1, [1], "buy")
+
+        self.assertEqual(stats["buy_count"], 2)
+        self.assertAlmostEqual(stats["buy_hit_rate_1"], 0.5)
+        self.assertAlmostEqual(stats["buy_avg_return_1"], (0.1 - 0.1) / 2)
+        self.assertAlmostEqual(stats["buy_max_drawdown_1"], 98.0 / 110.0 - 1)
+
+    def test_run_hunter_backtest_with_given_klines(self):
+        settings = make_settings(
+            symbol="BTCUSDC", rsi_buy=55, rsi_sell=45, macd_cross_signals=False
+        )
+        klines = make_klines()
+
+        result = run_hunter_backtest(settings, df=klines, horizons=[1, 4])
+
+        masks = calculate_ta_signal_masks(
+            calculate_ta_indicators(klines.copy(), settings), settings
+        )
+        self.assertEqual(result["stats"]["candles"], len(klines))
+        self.assertEqual(result["stats"]["buy_count"], int(masks["buy"].sum()))
+        self.assertEqual(result["stats"]["sell_count"], int(masks["sell"].sum()))
+        self.assertEqual(
+            len(result["signals"]),
+            result["stats"]["buy_count"] + result["stats"]["sell_count"],
+        )
+        self.assertIn("buy_hit_rate_4", result["stats"])
+
+    def test_run_hunter_backtest_reports_only_requested_range(self):
+        settings = make_settings(symbol="BTCUSDC", rsi_buy=55, macd_cross_signals=False)
+        klines = make_klines()
+        start = pd.to_datetime(klines["open_time"].iloc[100], unit="ms")
+
+        result = run_hunter_backtest(settings, start_str=str(start), df=klines)
+
+        self.assertEqual(result["stats"]["candles"], len(klines) - 100)
+        self.assertTrue((result["signals"]["open_time"] >= start).all())
+
+    def test_backtest_command_rejects_non_positive_horizons(self):
+        for horizon in ("0", "-4"):
+            with self.subTest(horizon=horizon):
+                with self.assertRaisesRegex(CommandError, "Horizons must be positive"):
+                    call_command(
+                        "backtest_hunter",
+                        "1",
+                        "--start",
+                        "2024-01-01",
+                        "--horizons",
+                        "1",
+                        horizon,
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
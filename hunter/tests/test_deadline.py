@@ -0,0 +1,126 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+import pandas as pd
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from hunter.models import TechnicalAnalysisHunter
+from hunter.utils.deadline_utils import (
+    PRIORITY_NOTIFYING,
+    PRIORITY_RUNNING,
+    PRIORITY_SLEEPING,
+    TickDeadline,
+    get_hunter_priority,
+    sort_hunters_by_priority,
+)
+from hunter.utils.hunter_logic import (
+    handle_hunter_tick_result,
+    run_selected_intervals_hunters,
+)
+from hunter.tests.test_vectorized_signals import make_klines
+
+
+def make_hunter(hunter_id, running=True, interval="1h", telegram=False):
+    user = SimpleNamespace(
+        telegram_signals_receiver=telegram,
+        telegram_chat_id="1" if telegram else "",
+        email_signals_receiver=False,
+        email="",
+    )
+    return SimpleNamespace(id=hunter_id, running=running, interval=interval, user=user)
+
+
+class DeadlineTestCase(TestCase):
+
+    def test_priorities(self):
+        notifying = make_hunter(3, telegram=True)
+        running_1d = make_hunter(1, interval="1d")
+        running_1h = make_hunter(4)
+        sleeping = make_hunter(2, running=False, telegram=True)
+
+        self.assertEqual(get_hunter_priority(notifying), PRIORITY_NOTIFYING)
+        self.assertEqual(get_hunter_priority(running_1h), PRIORITY_RUNNING)
+        self.assertEqual(get_hunter_priority(sleeping), PRIORITY_SLEEPING)
+        self.assertEqual(
+            [
+                h.id
+                for h in sort_hunters_by_priority(
+                    [sleeping, running_1d, notifying, running_1h]
+                )
+            ],
+            [3, 4, 1, 2],
+        )
+
+    def test_projection_sheds_when_deadline_at_risk(self):
+        close = timezone.now()
+        deadline = TickDeadline(close, total=10, deadline_seconds=50)
+        deadline.started = close
+
+        self.assertFalse(deadline.should_shed(close + timedelta(seconds=1)))
+
+        deadline.hunter_done(now=close + timedelta(seconds=2))
+        deadline.hunter_done(now=close + timedelta(seconds=4))
+        # 2 hunters in 4 seconds, 8 remaining: finishes at 20 seconds.
+        self.assertFalse(deadline.should_shed(close + timedelta(seconds=4)))
+        # 2 hunters in 12 seconds, 8 remaining: finishes at 60 seconds.
+        self.assertTrue(deadline.should_shed(close + timedelta(seconds=12)))
+        self.assertTrue(deadline.should_shed(close + timedelta(seconds=51)))
+        self.assertEqual(deadline.max_lag, 4.0)
+
+    @patch("hunter.utils.hunter_logic.record_hunter_run")
+    @patch("hunter.utils.hunter_logic.save_hunter_dfs")
+    @patch("hunter.utils.hunter_logic.process_hunter_signal_state", return_value=False)
+    @patch("hunter.utils.hunter_logic.fetch_data")
+    def test_tick_skips_sleeping_hunters_and_records_lag(
+        self, mock_fetch_data, _, mock_save, mock_record
+    ):
+        mock_fetch_data.side_effect = lambda **kwargs: make_klines()
+        with patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        ):
+            user = get_user_model().objects.create_user(
+                username="testuser", password="testpassword"
+            )
+            running = TechnicalAnalysisHunter.objects.create(
+                user=user, df="[]", running=True, symbol="BTCUSDT"
+            )
+            TechnicalAnalysisHunter.objects.create(
+                user=user, df="[]", running=False, symbol="BTCUSDT"
+            )
+            TechnicalAnalysisHunter.objects.create(
+                user=user, df="[]", running=False, symbol="ETHUSDT"
+            )
+
+        run_selected_intervals_hunters(["1h"], timezone.now() - timedelta(minutes=2))
+
+        self.assertEqual(
+            [call.kwargs["symbol"] for call in mock_fetch_data.call_args_list],
+            ["BTCUSDT"],
+        )
+        self.assertEqual(
+            [call.args[0].id for call in mock_save.call_args_list], [running.id]
+        )
+        self.assertEqual(mock_record.call_count, 1)
+        self.assertGreater(mock_record.call_args_list[0].args[5], 120)
+
+    @patch("hunter.utils.hunter_logic.record_hunter_run")
+    @patch("hunter.utils.hunter_logic.fetch_and_save_df")
+    def test_late_tick_sheds_user_settings_refresh(self, mock_fetch_and_save, _):
+        hunter = make_hunter(1, running=False)
+        hunter.symbol, hunter.lookback, hunter.comment = "BTCUSDT", "1d", ""
+        hunter.user.username = "testuser"
+        deadline = TickDeadline(timezone.now() - timedelta(minutes=2), total=1)
+
+        handle_hunter_tick_result(
+            hunter,
+            make_klines(),
+            None,
+            None,
+            hunter.id,
+            deadline=deadline,
+            df_json="[]",
+        )
+
+        mock_fetch_and_save.assert_called_once_with(hunter, "[]", save=True)
+        self.assertEqual((deadline.done, deadline.shed), (1, 1))
@@ -1,44 +1,71 @@
 import unittest
-from unittest.mock import patch, MagicMock
-from datetime import datetime as dt
-from hunter.utils.hunter_logic import run_single_hunter_logic
+from datetime import datetime, timezone
+from unittest.mock import patch
+import pandas as pd
+from hunter.utils.hunter_logic import (
+    compute_market_signals,
+    fetch_market_klines,
+    handle_hunter_tick_result,
+)
+from hunter.utils.telemetry_utils import get_candle_time
+from hunter.tests.test_vectorized_signals import make_klines, make_settings
 
 
 class TestHunterLogic(unittest.TestCase):
 
-    @patch("hunter.utils.fetch_data")
-    @patch("hunter.utils.calculate_ta_indicators")
-    @patch("hunter.utils.check_ta_trend")
-    @patch("hunter.utils.check_classic_ta_buy_signal")
-    @patch("hunter.utils.check_classic_ta_sell_signal")
-    @patch("hunter.utils.send_email")
-    @patch("hunter.utils.fetch_and_save_df")
-    def test_run_single_hunter_logic(
+    @patch("hunter.utils.hunter_logic.record_hunter_run")
+    @patch("hunter.utils.hunter_logic.save_hunter_dfs")
+    @patch("hunter.utils.hunter_logic.notify_hunter_signal")
+    @patch("hunter.utils.hunter_logic.process_hunter_signal_state", return_value=True)
+    @patch("hunter.utils.hunter_logic.evaluate_hunters_matrix")
+    @patch("hunter.utils.hunter_logic.cache_market_klines")
+    def test_buy_signal_is_notified_and_df_saved(
         self,
-        mock_fetch_and_save_df,
-        mock_send_email,
-        mock_sell_signal,
-        mock_buy_signal,
-        mock_check_trend,
-        mock_calculate_indicators,
-        mock_fetch_data,
+        mock_cache,
+        mock_evaluate,
+        mock_state,
+        mock_notify,
+        mock_save,
+        mock_record,
     ):
-        hunter = MagicMock()
-        hunter.symbol = "BTCUSDC"
-        hunter.interval = "1h"
-        hunter.running = True
-        hunter.user.email = "testuser@example.com"
-
-        mock_fetch_data.return_value = MagicMock()
-        mock_calculate_indicators.return_value = MagicMock()
-        mock_check_trend.return_value = MagicMock()
-        mock_buy_signal.return_value = True
-        mock_sell_signal.return_value = False
-        mock_send_email.return_value = None
-
-        run_single_hunter_logic(hunter)
-
-        mock_send_email.assert_called_once()
-        mock_fetch_and_save_df.assert_called()
-        mock_buy_signal.assert_called()
-        mock_sell_signal.assert_not_called()
+        hunter = make_settings(id=1, symbol="BTCUSDC", interval="1h", running=True)
+        mock_evaluate.return_value = pd.DataFrame(
+            {"trend": ["up"], "buy": [True], "sell": [False]}, index=[1]
+        )
+
+        (result,) = compute_market_signals([hunter], make_klines())
+        hunter, df_calculated, signal, trend, timer, df_json = result
+        handle_hunter_tick_result(
+            hunter, df_calculated, signal, trend, 1, timer, None, df_json
+        )
+
+        self.assertEqual((signal, trend), ("buy", "up"))
+        mock_notify.assert_called_once()
+        self.assertEqual(mock_notify.call_args[0][0], "buy")
+        mock_save.assert_called_once_with(hunter, 1, df_json, None, False)
+        mock_record.assert_called_once()
+
+    @patch("hunter.utils.hunter_logic.fetch_data")
+    def test_candle_opened_at_the_boundary_is_not_evaluated(self, mock_fetch_data):
+        klines = make_klines()
+        mock_fetch_data.return_value = klines.copy()
+        candle_close = datetime.fromtimestamp(
+            klines["open_time"].iloc[-1] / 1000, tz=timezone.utc
+        )
+
+        df_fetched = fetch_market_klines(("BTCUSDC", "1h", "11d"), candle_close)
+
+        self.assertEqual(len(df_fetched), len(klines) - 1)
+        self.assertEqual(
+            df_fetched["close_time"].iloc[-1], klines["close_time"].iloc[-2]
+        )
+        self.assertEqual(
+            get_candle_time(df_fetched),
+            datetime.fromtimestamp(
+                klines["open_time"].iloc[-2] / 1000, tz=timezone.utc
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
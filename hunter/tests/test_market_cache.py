@@ -0,0 +1,93 @@
+from datetime import timedelta
+from unittest.mock import patch
+import pandas as pd
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils import timezone
+from hunter.models import TechnicalAnalysisHunter
+from hunter.utils.market_cache_utils import (
+    cache_market_klines,
+    get_market_key,
+    has_stale_sleeping_hunters,
+    refresh_sleeping_hunter_dfs,
+)
+from fomo_sapiens.utils.job_utils import enqueue_job, run_job
+from hunter.tests.test_vectorized_signals import make_klines
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "market-cache-tests",
+    },
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class MarketCacheTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(caches["shared"].clear)
+        self.user = get_user_model().objects.create_user(
+            username="testuser", password="testpassword"
+        )
+        stale = timezone.now() - timedelta(hours=2)
+        self.sleeping = [
+            TechnicalAnalysisHunter.objects.create(
+                user=self.user, df="[]", running=False, symbol=symbol
+            )
+            for symbol in ("BTCUSDT", "BTCUSDT", "ETHUSDT")
+        ]
+        TechnicalAnalysisHunter.objects.filter(running=False).update(
+            df_last_fetch_time=stale
+        )
+        self.running = TechnicalAnalysisHunter.objects.create(
+            user=self.user, df="[]", running=True, symbol="ETHUSDT"
+        )
+
+    @patch("hunter.utils.market_cache_utils.fetch_data")
+    def test_refresh_serves_cached_klines_only(self, mock_fetch_data):
+        fetched_at = timezone.now() - timedelta(minutes=5)
+        cache_market_klines(
+            get_market_key(self.sleeping[0]), '[{"close": 1}]', fetched_at
+        )
+        hunters = list(TechnicalAnalysisHunter.objects.filter(user=self.user))
+
+        refreshed = refresh_sleeping_hunter_dfs(hunters)
+
+        self.assertEqual(refreshed, 2)
+        mock_fetch_data.assert_not_called()
+        hunters = TechnicalAnalysisHunter.objects.in_bulk()
+        for hunter in self.sleeping[:2]:
+            self.assertEqual(hunters[hunter.id].df, '[{"close": 1}]')
+            self.assertEqual(hunters[hunter.id].df_last_fetch_time, fetched_at)
+        self.assertEqual(hunters[self.sleeping[2].id].df, "[]")
+        self.assertEqual(hunters[self.running.id].df, "[]")
+        self.assertTrue(has_stale_sleeping_hunters(hunters.values()))
+
+    @patch("hunter.utils.market_cache_utils.fetch_data")
+    def test_background_job_fetches_missing_markets_once(self, mock_fetch_data):
+        mock_fetch_data.side_effect = lambda **kwargs: make_klines()
+        job = enqueue_job("hunter_dfs", self.user)
+
+        run_job(job)
+
+        self.assertEqual(job.status, "done")
+        self.assertEqual(
+            sorted(call.kwargs["symbol"] for call in mock_fetch_data.call_args_list),
+            ["BTCUSDT", "ETHUSDT"],
+        )
+        hunters = TechnicalAnalysisHunter.objects.filter(user=self.user)
+        self.assertFalse(has_stale_sleeping_hunters(hunters))
+        self.assertEqual(
+            TechnicalAnalysisHunter.objects.get(id=self.running.id).df, "[]"
+        )
+
+        # Fresh dfs are not refreshed again.
+        self.assertEqual(refresh_sleeping_hunter_dfs(hunters, fetch_missing=True), 0)
@@ -0,0 +1,141 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from analysis.utils.calc_utils import (
+    calculate_ta_indicators,
+    calculate_ta_averages,
+    check_ta_trend,
+)
+from hunter.utils.buy_signals import check_classic_ta_buy_signal
+from hunter.utils.sell_signals import check_classic_ta_sell_signal
+from hunter.utils.hunter_logic import (
+    compute_market_signals,
+    run_closing_interval_hunters,
+)
+from hunter.utils.matrix_signals import (
+    tail_nanmeans,
+    evaluate_hunters_matrix,
+    get_fired_hunter_signals,
+)
+from hunter.tests.test_vectorized_signals import make_klines, make_settings
+
+
+def make_hunters(count=40, seed=11):
+    rng = np.random.default_rng(seed)
+    return [
+        make_settings(
+            id=hunter_id,
+            symbol="BTCUSDC" if hunter_id % 2 else "ETHUSDC",
+            interval="1h",
+            lookback="3d",
+            rsi_timeperiod=int(rng.choice([10, 14])),
+            rsi_buy=int(rng.integers(30, 60)),
+            rsi_sell=int(rng.integers(40, 70)),
+            avg_rsi_period=int(rng.integers(1, 10)),
+            avg_adx_period=int(rng.integers(1, 10)),
+            avg_di_period=int(rng.integers(1, 10)),
+            macd_cross_signals=bool(rng.integers(0, 2)),
+            bollinger_signals=bool(rng.integers(0, 2)),
+            stoch_signals=bool(rng.integers(0, 2)),
+            rsi_divergence_signals=bool(rng.integers(0, 2)),
+        )
+        for hunter_id in range(1, count + 1)
+    ]
+
+
+class TestMatrixSignals(unittest.TestCase):
+
+    def test_tail_nanmeans(self):
+        values = pd.Series([1.0, np.nan, 3.0, 4.0, np.nan, 6.0])
+
+        means = tail_nanmeans(values, [1, 2, 3, 10, 0])
+
+        expected = [values.iloc[-p:].mean() for p in (1, 2, 3, 10, 1)]
+        np.testing.assert_allclose(means, expected)
+        self.assertTrue(np.isnan(tail_nanmeans([np.nan, np.nan], [2])[0]))
+
+    def test_matrix_matches_scalar_checks(self):
+        hunters = make_hunters()
+        markets = {"BTCUSDC": make_klines(seed=1), "ETHUSDC": make_klines(seed=2)}
+        frames = {}
+        for hunter in hunters:
+            key = (hunter.symbol, hunter.rsi_timeperiod)
+            if key not in frames:
+                frames[key] = calculate_ta_indicators(
+                    markets[hunter.symbol].copy(), hunter
+                )
+
+        hunter_frames = [frames[(h.symbol, h.rsi_timeperiod)] for h in hunters]
+        signals = evaluate_hunters_matrix(hunters, hunter_frames)
+
+        for hunter, df in zip(hunters, hunter_frames):
+            trend = check_ta_trend(df, hunter)
+            averages = calculate_ta_averages(df, hunter)
+            self.assertEqual(
+                signals.loc[hunter.id, "buy"],
+                check_classic_ta_buy_signal(df, hunter, trend, averages),
+                f"buy mismatch for hunter {hunter.id}",
+            )
+            self.assertEqual(
+                signals.loc[hunter.id, "sell"],
+                check_classic_ta_sell_signal(df, hunter, trend, averages),
+                f"sell mismatch for hunter {hunter.id}",
+            )
+        self.assertTrue(signals["buy"].any() or signals["sell"].any())
+
+    def test_matrix_skips_short_frames(self):
+        hunters = make_hunters(count=2)
+        df = calculate_ta_indicators(make_klines(), hunters[0])
+
+        signals = evaluate_hunters_matrix(hunters, [df, df.iloc[:1]])
+
+        self.assertEqual(list(signals.index), [1])
+
+    def test_get_fired_hunter_signals(self):
+        signals = pd.DataFrame(
+            {
+                "trend": ["none"] * 3,
+                "buy": [True, False, True],
+                "sell": [False, True, True],
+            },
+            index=[4, 5, 6],
+        )
+
+        self.assertEqual(
+            get_fired_hunter_signals(signals), {4: "buy", 5: "sell", 6: "buy"}
+        )
+        self.assertEqual(get_fired_hunter_signals(None), {})
+
+    @patch("hunter.utils.hunter_logic.cache_market_klines")
+    @patch(
+        "hunter.utils.hunter_logic.calculate_ta_indicators",
+        wraps=calculate_ta_indicators,
+    )
+    def test_compute_market_signals_shares_frames(self, mock_calculate, mock_cache):
+        hunters = [
+            hunter for hunter in make_hunters(count=8) if hunter.symbol == "BTCUSDC"
+        ]
+
+        results = compute_market_signals(hunters, make_klines())
+
+        self.assertEqual([result[0].id for result in results], [h.id for h in hunters])
+        distinct_frames = {id(result[1]) for result in results}
+        distinct_keys = {hunter.rsi_timeperiod for hunter in hunters}
+        self.assertEqual(len(distinct_frames), len(distinct_keys))
+        self.assertEqual(mock_calculate.call_count, len(distinct_keys))
+        mock_cache.assert_called_once()
+
+    @patch("hunter.utils.hunter_logic.run_selected_intervals_hunters")
+    def test_run_closing_interval_hunters_batches_intervals(self, mock_run):
+        run_closing_interval_hunters(datetime(2024, 1, 2, 4, 0, 3))
+
+        mock_run.assert_called_once_with(
+            ["1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h"],
+            datetime(2024, 1, 2, 4, 0),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
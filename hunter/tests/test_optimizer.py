@@ -0,0 +1,244 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from hunter.utils.backtest_utils import evaluate_backtest, calculate_window_statistics
+from hunter.utils.vectorized_signals import calculate_ta_signal_masks
+from hunter.utils.optimizer_utils import (
+    IndicatorCache,
+    parse_parameter_space,
+    generate_parameter_grid,
+    sample_parameter_space,
+    group_variants_by_indicators,
+    run_parameter_sweep,
+    rank_sweep_results,
+    generate_walk_forward_folds,
+    run_walk_forward,
+    summarize_walk_forward,
+)
+from analysis.utils.calc_utils import calculate_ta_indicators
+from hunter.tests.test_vectorized_signals import make_klines, make_settings
+
+
+class TestOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.klines = make_klines(rows=400)
+        self.settings = make_settings(id=1, symbol="BTCUSDC", interval="1h")
+        self.variants = generate_parameter_grid(
+            {"rsi_timeperiod": [10, 14], "rsi_buy": [35, 45, 55]}
+        )
+
+    def test_parse_parameter_space(self):
+        space = parse_parameter_space(
+            ["rsi_buy=20:30:5", "psar_acceleration=0.01,0.02", "rsi_signals=true,false"]
+        )
+
+        self.assertEqual(space["rsi_buy"], [20, 25, 30])
+        self.assertEqual(space["psar_acceleration"], [0.01, 0.02])
+        self.assertEqual(space["rsi_signals"], [True, False])
+
+    def test_parse_parameter_space_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_parameter_space(["no_such_field=1,2"])
+        with self.assertRaises(ValueError):
+            parse_parameter_space(["rsi_buy"])
+
+    def test_sample_parameter_space(self):
+        space = {"rsi_buy": list(range(20, 40)), "rsi_sell": list(range(60, 80))}
+
+        samples = sample_parameter_space(space, 50, seed=3)
+
+        self.assertEqual(len(samples), 50)
+        self.assertEqual(len({tuple(s.items()) for s in samples}), 50)
+        self.assertEqual(samples, sample_parameter_space(space, 50, seed=3))
+        self.assertEqual(len(sample_parameter_space({"rsi_buy": [1, 2]}, 10)), 2)
+
+    def test_group_variants_by_indicators(self):
+        batches = group_variants_by_indicators(self.settings, self.variants)
+
+        self.assertEqual(len(batches), 2)
+        for batch in batches:
+            self.assertEqual(len({v["rsi_timeperiod"] for v in batch}), 1)
+
+    def test_sweep_matches_single_backtests(self):
+        results = run_parameter_sweep(
+            self.settings, self.klines, self.variants, horizons=(1, 4), processes=1
+        )
+
+        self.assertEqual(len(results), len(self.variants))
+        for row, variant in zip(results.to_dict("records"), self.variants):
+            settings = make_settings(**{**vars(self.settings), **variant})
+            df = calculate_ta_indicators(self.klines.copy(), settings)
+            stats = evaluate_backtest(df, settings, horizons=(1, 4))["stats"]
+            self.assertEqual(row["buy_count"], stats["buy_count"])
+            self.assertEqual(row["sell_count"], stats["sell_count"])
+
+    def test_sweep_calculates_indicators_once_per_parameter_set(self):
+        with patch(
+            "hunter.utils.optimizer_utils.calculate_ta_indicators",
+            side_effect=calculate_ta_indicators,
+        ) as mock_calculate:
+            run_parameter_sweep(
+                self.settings, self.klines, self.variants, horizons=(1,), processes=1
+            )
+
+        self.assertEqual(mock_calculate.call_count, 2)
+
+    def test_sweep_in_process_pool_matches_inline(self):
+        inline = run_parameter_sweep(
+            self.settings, self.klines, self.variants, horizons=(1,), processes=1
+        )
+        pooled = run_parameter_sweep(
+            self.settings, self.klines, self.variants, horizons=(1,), processes=2
+        )
+
+        key = ["rsi_timeperiod", "rsi_buy"]
+        pd.testing.assert_frame_equal(
+            inline.sort_values(key).reset_index(drop=True),
+            pooled.sort_values(key).reset_index(drop=True),
+        )
+
+    def test_indicator_cache_reuses_frames(self):
+        cache = IndicatorCache(self.klines)
+
+        first = cache.get(make_settings(rsi_buy=30))
+        second = cache.get(make_settings(rsi_buy=50))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, cache.get(make_settings(rsi_timeperiod=7)))
+
+    def test_rank_sweep_results(self):
+        results = pd.DataFrame(
+            {
+                "rsi_buy": [20, 30, 40],
+                "buy_count": [1, 10, 10],
+                "buy_avg_return_24": [0.5, 0.01, 0.02],
+                "buy_max_drawdown_24": [-0.1, -0.2, -0.3],
+            }
+        )
+
+        ranked = rank_sweep_results(results, ["buy_avg_return_24"], min_signals=5)
+        self.assertEqual(list(ranked["rsi_buy"]), [40, 30])
+
+        ranked = rank_sweep_results(results, ["-buy_max_drawdown_24"])
+        self.assertEqual(list(ranked["rsi_buy"]), [40, 30, 20])
+
+        with self.assertRaises(ValueError):
+            rank_sweep_results(results, ["unknown_metric"])
+
+    def test_generate_walk_forward_folds(self):
+        folds = generate_walk_forward_folds(100, 10, 40, 20)
+
+        self.assertEqual(folds, [(10, 49, 50, 69), (30, 69, 70, 89)])
+        self.assertEqual(len(generate_walk_forward_folds(100, 10, 40, 20, 5)), 7)
+        self.assertEqual(generate_walk_forward_folds(50, 10, 40, 20), [])
+        with self.assertRaises(ValueError):
+            generate_walk_forward_folds(100, 0, 0, 20)
+
+    def test_window_statistics_do_not_look_past_the_window(self):
+        settings = make_settings(
+            rsi_buy=55,
+            macd_cross_signals=False,
+            bollinger_signals=False,
+            stoch_signals=False,
+        )
+        df = calculate_ta_indicators(self.klines.copy(), settings)
+        masks = calculate_ta_signal_masks(df, settings)
+
+        stats = calculate_window_statistics(df, masks, 200, 299, horizons=(24,))
+        truncated = df.iloc[:300]
+        expected = evaluate_backtest(
+            truncated,
+            settings,
+            horizons=(24,),
+            start=df["open_time"].iloc[200],
+        )["stats"]
+
+        self.assertEqual(stats["candles"], 100)
+        self.assertGreater(stats["buy_count"], 0)
+        self.assertEqual(stats["buy_count"], expected["buy_count"])
+        self.assertEqual(stats["buy_avg_return_24"], expected["buy_avg_return_24"])
+
+    def test_walk_forward_reports_each_fold(self):
+        variants = generate_parameter_grid(
+            {"rsi_timeperiod": [10, 14], "rsi_buy": [45, 55]}
+        )
+        with patch(
+            "hunter.utils.optimizer_utils.calculate_ta_indicators",
+            side_effect=calculate_ta_indicators,
+        ) as mock_calculate:
+            folds = run_walk_forward(
+                make_settings(
+                    macd_cross_signals=False,
+                    bollinger_signals=False,
+                    stoch_signals=False,
+                ),
+                self.klines,
+                variants,
+                train_candles=100,
+                test_candles=50,
+                metrics=["buy_avg_return_4"],
+                horizons=(4,),
+                processes=1,
+            )
+
+        self.assertEqual(mock_calculate.call_count, 2)
+        self.assertEqual(list(folds["fold"]), [0, 1])
+        self.assertTrue((folds["test_start"] > folds["train_end"]).all())
+        self.assertIn("test_buy_avg_return_4", folds)
+        self.assertIn("train_buy_avg_return_4", folds)
+
+        summary = summarize_walk_forward(folds, ["buy_avg_return_4"])
+        self.assertEqual(summary["folds"], 2)
+        self.assertIn("test_buy_avg_return_4_mean", summary)
+
+    def test_optimize_command_rejects_non_positive_horizons(self):
+        for horizon in ("0", "-4"):
+            with self.subTest(horizon=horizon):
+                with self.assertRaisesRegex(CommandError, "Horizons must be positive"):
+                    call_command(
+                        "optimize_hunter",
+                        "1",
+                        "--start",
+                        "2024-01-01",
+                        "--param",
+                        "rsi_buy=20,30",
+                        "--horizons",
+                        "1",
+                        horizon,
+                    )
+
+    @patch("hunter.management.commands.optimize_hunter.fetch_backtest_data")
+    @patch("hunter.management.commands.optimize_hunter.TechnicalAnalysisHunter")
+    def test_optimize_command_reports_invalid_walk_forward(
+        self, mock_model, mock_fetch
+    ):
+        mock_model.objects.filter.return_value.first.return_value = make_settings(
+            id=1, macd_cross_signals=False, bollinger_signals=False, stoch_signals=False
+        )
+        mock_fetch.return_value = self.klines
+        arguments = [
+            "optimize_hunter",
+            "1",
+            "--start",
+            "2023-11-01",
+            "--param",
+            "rsi_buy=45,55",
+            "--horizons",
+            "4",
+            "--processes",
+            "1",
+            "--test-candles",
+            "50",
+        ]
+
+        with self.assertRaisesRegex(CommandError, "window sizes must be positive"):
+            call_command(*arguments, "--train-candles", "-100")
+        with self.assertRaisesRegex(CommandError, "Unknown sweep metrics: nope"):
+            call_command(*arguments, "--train-candles", "100", "--metric", "nope")
+
+
+if __name__ == "__main__":
+    unittest.main()
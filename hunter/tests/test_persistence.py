@@ -0,0 +1,68 @@
+from unittest.mock import patch
+import pandas as pd
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from analysis.utils.fetch_utils import DF_UPDATE_FIELDS, fetch_and_save_df
+from hunter.models import TechnicalAnalysisHunter, HunterRunTelemetry
+from hunter.utils.persistence_utils import BulkUpdateBuffer
+from hunter.utils.telemetry_utils import RunTimer, record_hunter_run
+
+
+class BulkUpdateBufferTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = get_user_model().objects.create_superuser(
+            username="admin", password="testpassword", email="admin@example.com"
+        )
+        self.hunters = [
+            TechnicalAnalysisHunter.objects.create(user=self.user, df="[]")
+            for _ in range(3)
+        ]
+
+    def test_flush_writes_only_changed_fields_in_bulk(self):
+        buffer = BulkUpdateBuffer()
+        for hunter in self.hunters:
+            fetch_and_save_df(hunter, '[{"close": 1}]', save=False)
+            buffer.update(hunter, DF_UPDATE_FIELDS)
+            record_hunter_run(hunter, RunTimer(), "none", buffer=buffer)
+        # Concurrent edit of another field must survive the bulk update.
+        TechnicalAnalysisHunter.objects.filter(id=self.hunters[0].id).update(
+            comment="edited"
+        )
+        self.assertEqual(len(buffer), 6)
+
+        with CaptureQueriesContext(connection) as queries:
+            written = buffer.flush()
+
+        self.assertEqual(written, 6)
+        self.assertEqual(len(buffer), 0)
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"comment"', updates[0])
+        self.assertEqual(HunterRunTelemetry.objects.count(), 3)
+        first = TechnicalAnalysisHunter.objects.get(id=self.hunters[0].id)
+        self.assertEqual(first.df, '[{"close": 1}]')
+        self.assertEqual(first.comment, "edited")
+
+    def test_updates_of_the_same_row_are_merged(self):
+        buffer = BulkUpdateBuffer()
+        hunter = self.hunters[0]
+        hunter.df = '[{"close": 2}]'
+        buffer.update(hunter, ["df"])
+        hunter.running = True
+        buffer.update(hunter, ["running"])
+        self.assertEqual(len(buffer), 1)
+
+        buffer.flush()
+
+        hunter.refresh_from_db()
+        self.assertEqual(hunter.df, '[{"close": 2}]')
+        self.assertTrue(hunter.running)
+        self.assertEqual(buffer.flush(), 0)
@@ -0,0 +1,139 @@
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from hunter.utils.hunter_logic import compute_market_signals
+from hunter.utils.pipeline_utils import run_hunter_pipeline
+from hunter.tests.test_vectorized_signals import make_klines, make_settings
+
+
+class TestHunterPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def fetch(self, key):
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return None if key == "broken" else key
+
+    def compute(self, hunters, df):
+        time.sleep(0.02)
+        return [(hunter, df) for hunter in hunters]
+
+    def handle(self, hunter, df):
+        time.sleep(0.01)
+        with self.lock:
+            self.handled.append((hunter.id, df))
+
+    def handle_market(self, hunter, df):
+        self.handle(hunter, df)
+        if hunter.last:
+            with self.lock:
+                self.in_flight -= 1
+
+    def test_pipeline_handles_all_results(self):
+        self.handled = []
+        markets = [
+            (
+                f"market-{index}",
+                [SimpleNamespace(id=index * 2 + offset) for offset in range(2)],
+            )
+            for index in range(12)
+        ]
+        markets.append(("broken", [SimpleNamespace(id=99)]))
+
+        stats = run_hunter_pipeline(
+            markets,
+            self.fetch,
+            self.compute,
+            self.handle,
+            fetch_workers=4,
+            compute_workers=2,
+            notify_workers=2,
+            queue_size=2,
+        )
+
+        self.assertEqual(len(self.handled), 24)
+        self.assertEqual(sorted(self.handled)[:2], [(0, "market-0"), (1, "market-0")])
+        self.assertEqual(stats.items, {"fetch": 13, "compute": 12, "notify": 12})
+        sequential = sum(stats.busy.values())
+        self.assertLess(stats.wall, sequential)
+
+    def test_pipeline_bounds_markets_in_flight(self):
+        self.handled = []
+        markets = [
+            (f"market-{index}", [SimpleNamespace(id=index, last=True)])
+            for index in range(30)
+        ]
+
+        def slow_handle(hunter, df):
+            time.sleep(0.02)
+            self.handle_market(hunter, df)
+
+        run_hunter_pipeline(
+            markets,
+            self.fetch,
+            self.compute,
+            slow_handle,
+            fetch_workers=2,
+            compute_workers=1,
+            notify_workers=1,
+            queue_size=1,
+        )
+
+        self.assertEqual(len(self.handled), 30)
+        # Workers of every stage plus one queued item between stages.
+        self.assertLessEqual(self.max_in_flight, 2 + 1 + 1 + 1 + 1)
+
+    def test_pipeline_survives_stage_errors(self):
+        self.handled = []
+        failed = []
+
+        def failing_compute(hunters, df):
+            if df == "market-1":
+                raise ValueError("broken indicators")
+            return self.compute(hunters, df)
+
+        def failing_handle(hunter, df):
+            if hunter.id == 2:
+                raise ValueError("broken notification")
+            self.handle(hunter, df)
+
+        markets = [
+            (f"market-{index}", [SimpleNamespace(id=index)]) for index in range(4)
+        ]
+        markets.append(("broken", [SimpleNamespace(id=98), SimpleNamespace(id=99)]))
+
+        run_hunter_pipeline(
+            markets,
+            self.fetch,
+            failing_compute,
+            failing_handle,
+            on_failure=lambda hunters: failed.extend(hunter.id for hunter in hunters),
+        )
+
+        self.assertEqual(sorted(self.handled), [(0, "market-0"), (3, "market-3")])
+        self.assertEqual(sorted(failed), [1, 98, 99])
+
+    def test_compute_market_signals(self):
+        klines = make_klines()
+        hunters = [
+            make_settings(id=1, macd_cross_signals=False, bollinger_signals=False),
+            make_settings(id=2, running=False),
+        ]
+
+        results = compute_market_signals(hunters, klines)
+
+        self.assertEqual([result[0].id for result in results], [1, 2])
+        self.assertIsNotNone(results[0][1])
+        self.assertIsNone(results[1][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
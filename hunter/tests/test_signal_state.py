@@ -0,0 +1,93 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+import pandas as pd
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from hunter.models import TechnicalAnalysisHunter, HunterSignalState
+from hunter.utils.signal_state_utils import (
+    update_signal_state,
+    process_hunter_signal_state,
+)
+
+
+def make_hunter(**overrides):
+    fields = {
+        "interval": "1h",
+        "signal_edge_trigger": True,
+        "signal_cooldown_candles": 0,
+        "signal_hysteresis_candles": 1,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class SignalStateTestCase(TestCase):
+
+    def setUp(self):
+        self.now = timezone.now()
+
+    def run_candles(self, hunter, signals):
+        state = HunterSignalState()
+        notified = []
+        for candle, signal in enumerate(signals):
+            now = self.now + timedelta(hours=candle)
+            notified.append(update_signal_state(state, signal, hunter, now))
+        return state, notified
+
+    def test_edge_trigger_notifies_transitions_only(self):
+        state, notified = self.run_candles(
+            make_hunter(), ["buy", "buy", "buy", None, "buy", "sell", "sell"]
+        )
+
+        self.assertEqual(notified, [True, False, False, False, True, True, False])
+        self.assertEqual(state.state, "sell")
+        self.assertEqual(state.active_candles, 2)
+        self.assertEqual(state.notified_count, 3)
+        self.assertEqual(state.suppressed_count, 3)
+
+    def test_level_trigger_notifies_every_signal(self):
+        _, notified = self.run_candles(
+            make_hunter(signal_edge_trigger=False), ["buy", "buy", None, "buy"]
+        )
+
+        self.assertEqual(notified, [True, True, False, True])
+
+    def test_hysteresis_requires_consecutive_clear_candles(self):
+        state, notified = self.run_candles(
+            make_hunter(signal_hysteresis_candles=3),
+            ["buy", None, None, "buy", None, None, None, "buy"],
+        )
+
+        self.assertEqual(
+            notified, [True, False, False, False, False, False, False, True]
+        )
+        self.assertEqual(state.state, "buy")
+
+    def test_cooldown_delays_repeated_signal(self):
+        _, notified = self.run_candles(
+            make_hunter(signal_cooldown_candles=4),
+            ["buy", None, "buy", None, "buy", "sell"],
+        )
+
+        self.assertEqual(notified, [True, False, False, False, True, True])
+
+    @patch("analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([]))
+    def test_process_hunter_signal_state_persists_state(self, _):
+        user = get_user_model().objects.create_user(
+            username="testuser", password="testpassword"
+        )
+        hunter = TechnicalAnalysisHunter.objects.create(user=user, df="[]")
+
+        self.assertTrue(process_hunter_signal_state(hunter, "buy"))
+        hunter = TechnicalAnalysisHunter.objects.select_related("signal_state").get(
+            pk=hunter.pk
+        )
+        self.assertFalse(process_hunter_signal_state(hunter, "buy"))
+
+        state = HunterSignalState.objects.get(hunter=hunter)
+        self.assertEqual(state.state, "buy")
+        self.assertEqual(state.active_candles, 2)
+        self.assertEqual(state.last_notified_signal, "buy")
+        self.assertEqual(state.suppressed_count, 1)
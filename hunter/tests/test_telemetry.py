@@ -0,0 +1,106 @@
+from datetime import timedelta
+from unittest.mock import patch
+import pandas as pd
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from hunter.models import TechnicalAnalysisHunter, HunterRunTelemetry
+from hunter.utils.hunter_logic import compute_market_signals
+from hunter.utils.telemetry_utils import (
+    RunTimer,
+    calculate_stage_percentiles,
+    get_candle_time,
+    get_slowest_hunters,
+    purge_hunter_telemetry,
+    record_hunter_run,
+)
+from hunter.tests.test_vectorized_signals import make_klines, make_settings
+
+
+class TelemetryTestCase(TestCase):
+
+    def setUp(self):
+        patcher = patch(
+            "analysis.utils.fetch_utils.fetch_data", return_value=pd.DataFrame([])
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = get_user_model().objects.create_superuser(
+            username="admin", password="testpassword", email="admin@example.com"
+        )
+
+    def create_runs(self, hunter, totals):
+        for total in totals:
+            timer = RunTimer()
+            timer.add("fetch", total * 0.8 / 1000)
+            timer.add("save", total * 0.2 / 1000)
+            record_hunter_run(hunter, timer, "none")
+
+    def test_percentiles_and_slowest_hunters(self):
+        fast = TechnicalAnalysisHunter.objects.create(user=self.user, df="[]")
+        slow = TechnicalAnalysisHunter.objects.create(
+            user=self.user, df="[]", symbol="ETHUSDT"
+        )
+        self.create_runs(fast, [10, 20, 30])
+        self.create_runs(slow, [100, 200, 300])
+
+        percentiles = {
+            row["stage"]: row
+            for row in calculate_stage_percentiles(HunterRunTelemetry.objects.all())
+        }
+        self.assertEqual(percentiles["total"]["runs"], 6)
+        self.assertAlmostEqual(percentiles["total"]["p50"], 65.0)
+        self.assertAlmostEqual(percentiles["fetch"]["max"], 240.0)
+        self.assertEqual(percentiles["notify"]["p95"], 0.0)
+
+        slowest = get_slowest_hunters(HunterRunTelemetry.objects.all())
+        self.assertEqual([row["hunter_id"] for row in slowest], [slow.id, fast.id])
+        self.assertEqual(slowest[0]["symbol"], "ETHUSDT")
+        self.assertEqual(slowest[0]["slowest_stage"], "fetch")
+        self.assertAlmostEqual(slowest[0]["p50"], 200.0)
+
+    def test_purge_respects_retention(self):
+        hunter = TechnicalAnalysisHunter.objects.create(user=self.user, df="[]")
+        self.create_runs(hunter, [10, 20])
+        HunterRunTelemetry.objects.filter(total_ms=10).update(
+            created_at=timezone.now() - timedelta(days=15)
+        )
+
+        self.assertEqual(purge_hunter_telemetry(14), 1)
+        self.assertEqual(HunterRunTelemetry.objects.count(), 1)
+
+    def test_admin_summary_and_export(self):
+        hunter = TechnicalAnalysisHunter.objects.create(user=self.user, df="[]")
+        self.create_runs(hunter, [10, 20])
+        with patch("django.contrib.auth.user_logged_in"):
+            self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse("admin:hunter_hunterruntelemetry_changelist")
+        )
+        self.assertContains(response, "Slowest hunters")
+
+        response = self.client.get(
+            reverse("admin:hunter_hunterruntelemetry_summary") + "?result=none"
+        )
+        content = response.content.decode()
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("total,2,15.0", content)
+        self.assertIn(f"{hunter.id},{hunter.symbol},{hunter.interval},2", content)
+
+    def test_compute_market_signals_shares_timings(self):
+        klines = make_klines()
+        klines.attrs["fetch_seconds"] = 0.4
+        hunters = [make_settings(id=1, running=True), make_settings(id=2, running=True)]
+
+        results = compute_market_signals(hunters, klines)
+
+        timers = [result[4] for result in results]
+        self.assertEqual([timer.timings["fetch"] for timer in timers], [0.2, 0.2])
+        self.assertGreater(timers[0].timings["compute"], 0)
+        self.assertEqual(timers[0].timings["compute"], timers[1].timings["compute"])
+        self.assertGreater(timers[0].timings["signal"], 0)
+
+        candle_time = get_candle_time(results[0][1])
+        self.assertIsNotNone(candle_time.tzinfo)
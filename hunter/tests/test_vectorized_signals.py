@@ -0,0 +1,137 @@
+import unittest
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+from hunter.models import TechnicalAnalysisHunter
+from analysis.utils.calc_utils import (
+    calculate_ta_indicators,
+    calculate_ta_averages,
+    check_ta_trend,
+)
+from hunter.utils.buy_signals import check_classic_ta_buy_signal
+from hunter.utils.sell_signals import check_classic_ta_sell_signal
+from hunter.utils.vectorized_signals import (
+    calculate_ta_signal_masks,
+    count_ta_signal_conditions,
+)
+
+
+def make_settings(**overrides):
+    fields = {
+        field.name: field.default
+        for field in TechnicalAnalysisHunter._meta.fields
+        if field.has_default() and not callable(field.default)
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def make_klines(rows=260, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    open_time = 1_700_000_000_000 + np.arange(rows) * 3_600_000
+    return pd.DataFrame(
+        {
+            "open_time": open_time,
+            "open": close + rng.normal(0, 0.3, rows),
+            "high": close + rng.uniform(0.1, 2, rows),
+            "low": close - rng.uniform(0.1, 2, rows),
+            "close": close,
+            "volume": rng.uniform(10, 100, rows),
+            "close_time": open_time + 3_599_999,
+        }
+    )
+
+
+class TestVectorizedSignals(unittest.TestCase):
+
+    def assert_masks_match_scalar_checks(self, settings):
+        df = calculate_ta_indicators(make_klines(), settings)
+        masks = calculate_ta_signal_masks(df, settings)
+
+        for row in range(1, len(df)):
+            window = df.iloc[: row + 1]
+            trend = check_ta_trend(window, settings)
+            averages = calculate_ta_averages(window, settings)
+            self.assertEqual(
+                masks["buy"].iloc[row],
+                check_classic_ta_buy_signal(window, settings, trend, averages),
+                f"buy mismatch at row {row}",
+            )
+            self.assertEqual(
+                masks["sell"].iloc[row],
+                check_classic_ta_sell_signal(window, settings, trend, averages),
+                f"sell mismatch at row {row}",
+            )
+        return masks
+
+    def test_masks_match_scalar_checks_with_default_settings(self):
+        self.assert_masks_match_scalar_checks(make_settings())
+
+    def test_masks_match_scalar_checks_with_loose_settings(self):
+        settings = make_settings(
+            rsi_buy=55,
+            rsi_sell=45,
+            macd_cross_signals=False,
+            bollinger_signals=False,
+            stoch_signals=False,
+            rsi_divergence_signals=True,
+            ema_fast_signals=True,
+            atr_signals=True,
+            atr_buy_threshold=0.001,
+        )
+        masks = self.assert_masks_match_scalar_checks(settings)
+        self.assertTrue(masks["buy"].any())
+
+    def test_masks_match_scalar_checks_with_loose_sell_settings(self):
+        settings = make_settings(
+            rsi_sell=45,
+            macd_cross_signals=False,
+            bollinger_signals=False,
+            stoch_signals=False,
+            rsi_divergence_signals=True,
+        )
+        masks = self.assert_masks_match_scalar_checks(settings)
+        self.assertTrue(masks["sell"].any())
+
+    def test_masks_match_scalar_checks_with_all_signals(self):
+        flags = [
+            field.name
+            for field in TechnicalAnalysisHunter._meta.fields
+            if field.name.endswith("_signals")
+        ]
+        self.assert_masks_match_scalar_checks(
+            make_settings(**{flag: True for flag in flags})
+        )
+
+    def test_first_row_never_signals(self):
+        settings = make_settings(
+            rsi_signals=False,
+            vol_signals=False,
+            macd_cross_signals=False,
+            bollinger_signals=False,
+            stoch_signals=False,
+        )
+        df = calculate_ta_indicators(make_klines(), settings)
+        masks = calculate_ta_signal_masks(df, settings)
+
+        self.assertFalse(masks["buy"].iloc[0])
+        self.assertFalse(masks["sell"].iloc[0])
+        self.assertTrue(masks["sell"].iloc[1:].all())
+
+    def test_count_ta_signal_conditions(self):
+        settings = make_settings(rsi_buy=55, macd_cross_signals=False)
+        df = calculate_ta_indicators(make_klines(), settings)
+
+        counts = count_ta_signal_conditions(df, settings)
+        masks = calculate_ta_signal_masks(df, settings)
+
+        self.assertEqual(counts["buy"], int(masks["buy"].sum()))
+        self.assertEqual(counts["sell"], int(masks["sell"].sum()))
+        self.assertIn("rsi_signals", counts["buy_conditions"])
+        self.assertNotIn("macd_cross_signals", counts["buy_conditions"])
+        self.assertGreaterEqual(counts["buy_conditions"]["rsi_signals"], counts["buy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,303 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Sequence, Union
+from numpy.lib.stride_tricks import sliding_window_view
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from analysis.utils.calc_utils import is_df_valid, calculate_ta_indicators
+from analysis.utils.fetch_utils import fetch_data, interval_to_timedelta
+from hunter.utils.vectorized_signals import calculate_ta_signal_masks
+
+DEFAULT_BACKTEST_HORIZONS = (1, 4, 24)
+BACKTEST_WARMUP_CANDLES = 200
+SNAPSHOT_EXCLUDED_FIELDS = ("id", "user", "df", "df_last_fetch_time")
+
+
+def hunter_settings_snapshot(hunter: object, **overrides: Any) -> SimpleNamespace:
+    """
+    Copies the configuration of a hunter into a plain, picklable namespace.
+
+    The snapshot holds every concrete model field except the user, the stored frame and
+    its fetch time, so it can be sent to worker processes and modified freely without
+    touching the database row.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter to copy.
+        **overrides: Field values replacing the copied ones.
+
+    Returns:
+        SimpleNamespace: The hunter settings.
+    """
+    fields = {
+        field.name: getattr(hunter, field.name)
+        for field in hunter._meta.concrete_fields
+        if field.name not in SNAPSHOT_EXCLUDED_FIELDS
+    }
+    fields["id"] = getattr(hunter, "id", None)
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@exception_handler()
+def fetch_backtest_data(
+    hunter: object, start_str: str, end_str: Optional[str] = None
+) -> Union[pd.DataFrame, Optional[int]]:
+    """
+    Fetches historical klines for a backtest, including warmup candles before `start_str`.
+
+    The warmup mirrors the 200 extra units `calculate_lookback_extended` adds for live
+    hunters, so indicators are settled when the backtested range begins.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter providing the symbol and interval.
+        start_str (str): The start of the backtested range (e.g. '2024-01-01').
+        end_str (str, optional): The end of the backtested range. Defaults to now.
+
+    Returns:
+        pd.DataFrame: The raw kline data.
+    """
+    start_time = pd.Timestamp(start_str).to_pydatetime()
+    warmup = interval_to_timedelta(hunter.interval) * BACKTEST_WARMUP_CANDLES
+    end_time = pd.Timestamp(end_str).to_pydatetime() if end_str else datetime.utcnow()
+
+    return fetch_data(
+        symbol=hunter.symbol,
+        interval=hunter.interval,
+        start_str=(start_time - warmup).strftime("%Y-%m-%d %H:%M:%S"),
+        end_str=end_time.strftime("%Y-%m-%d %H:%M:%S"),
+    )
+
+
+def calculate_forward_returns(close: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    Calculates the return from each candle's close to the close `horizon` candles later.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+        horizon (int): The number of candles to look ahead.
+
+    Returns:
+        numpy.ndarray: The forward returns, NaN where the horizon runs past the data.
+    """
+    forward = np.full(len(close), np.nan)
+    if horizon < len(close):
+        forward[:-horizon] = close[horizon:] / close[:-horizon] - 1
+    return forward
+
+
+def calculate_forward_extremes(
+    values: np.ndarray, horizon: int, func: Any
+) -> np.ndarray:
+    """
+    Applies `func` (e.g. `np.min`) to the `horizon` candles following each candle.
+
+    Args:
+        values (numpy.ndarray): The values to scan (e.g. lows or highs).
+        horizon (int): The number of following candles included.
+        func (callable): The reduction applied to each window.
+
+    Returns:
+        numpy.ndarray: The reduced values, NaN where the horizon runs past the data.
+    """
+    extremes = np.full(len(values), np.nan)
+    if horizon < len(values):
+        windows = sliding_window_view(values[1:], horizon)
+        extremes[: len(windows)] = func(windows, axis=1)
+    return extremes
+
+
+def calculate_signal_statistics(
+    df: pd.DataFrame,
+    signals: np.ndarray,
+    direction: int,
+    horizons: Sequence[int],
+    prefix: str,
+) -> Dict[str, float]:
+    """
+    Calculates forward-return statistics for the candles where a signal fired.
+
+    Returns are signed by `direction` (1 for buy, -1 for sell), so a positive value is
+    always a move in the signalled direction. Drawdown is the worst adverse excursion
+    within the horizon: the lowest low after a buy or the highest high after a sell.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame with 'close', 'high' and 'low' columns.
+        signals (numpy.ndarray): True where the signal fired.
+        direction (int): 1 for buy signals, -1 for sell signals.
+        horizons (list): The forward horizons, in candles.
+        prefix (str): The prefix of the returned keys ('buy' or 'sell').
+
+    Returns:
+        dict: '<prefix>_count' and, per horizon, '<prefix>_hit_rate_<h>',
+              '<prefix>_avg_return_<h>', '<prefix>_avg_drawdown_<h>' and
+              '<prefix>_max_drawdown_<h>'.
+    """
+    close = df["close"].to_numpy(dtype=float)
+    high = df["high"].to_numpy(dtype=float)
+    low = df["low"].to_numpy(dtype=float)
+    signals = np.asarray(signals, dtype=bool)
+
+    stats = {f"{prefix}_count": int(signals.sum())}
+
+    for horizon in horizons:
+        returns = direction * calculate_forward_returns(close, horizon)[signals]
+        adverse = calculate_forward_extremes(
+            low if direction > 0 else high, horizon, np.min if direction > 0 else np.max
+        )
+        drawdowns = np.minimum(direction * (adverse / close - 1), 0)[signals]
+
+        returns = returns[~np.isnan(returns)]
+        drawdowns = drawdowns[~np.isnan(drawdowns)]
+
+        stats[f"{prefix}_hit_rate_{horizon}"] = (
+            float(np.mean(returns > 0)) if len(returns) else np.nan
+        )
+        stats[f"{prefix}_avg_return_{horizon}"] = (
+            float(np.mean(returns)) if len(returns) else np.nan
+        )
+        stats[f"{prefix}_avg_drawdown_{horizon}"] = (
+            float(np.mean(drawdowns)) if len(drawdowns) else np.nan
+        )
+        stats[f"{prefix}_max_drawdown_{horizon}"] = (
+            float(np.min(drawdowns)) if len(drawdowns) else np.nan
+        )
+
+    return stats
+
+
+def evaluate_backtest(
+    df: pd.DataFrame,
+    settings: object,
+    horizons: Sequence[int] = DEFAULT_BACKTEST_HORIZONS,
+    start: Optional[Any] = None,
+    end: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Backtests hunter settings on a DataFrame whose indicators are already calculated.
+
+    Signals are evaluated for every candle with `calculate_ta_signal_masks` and only the
+    candles between `start` and `end` are reported. Forward returns may use candles after
+    `end` when they are present in the frame.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+        settings (object): The hunter settings.
+        horizons (list): The forward horizons, in candles.
+        start (datetime, optional): The first reported candle open time.
+        end (datetime, optional): The last reported candle open time.
+
+    Returns:
+        dict: 'signals' (a DataFrame of every buy and sell signal) and 'stats'
+              (a flat dict of the statistics, see `calculate_signal_statistics`).
+    """
+    masks = calculate_ta_signal_masks(df, settings)
+
+    in_range = np.ones(len(df), dtype=bool)
+    if start is not None:
+        in_range &= (df["open_time"] >= pd.Timestamp(start)).to_numpy()
+    if end is not None:
+        in_range &= (df["open_time"] <= pd.Timestamp(end)).to_numpy()
+
+    buy = masks["buy"].to_numpy(dtype=bool) & in_range
+    sell = masks["sell"].to_numpy(dtype=bool) & in_range
+
+    stats = {"candles": int(in_range.sum())}
+    stats.update(calculate_signal_statistics(df, buy, 1, horizons, "buy"))
+    stats.update(calculate_signal_statistics(df, sell, -1, horizons, "sell"))
+
+    fired = buy | sell
+    signals = pd.DataFrame(
+        {
+            "open_time": df["open_time"].to_numpy()[fired],
+            "close": df["close"].to_numpy()[fired],
+            "signal": np.where(buy, "buy", "sell")[fired],
+            "trend": masks["trend"].to_numpy()[fired],
+        }
+    )
+
+    return {"signals": signals, "stats": stats}
+
+
+def calculate_window_statistics(
+    df: pd.DataFrame,
+    masks: pd.DataFrame,
+    first: int,
+    last: int,
+    horizons: Sequence[int] = DEFAULT_BACKTEST_HORIZONS,
+) -> Dict[str, Any]:
+    """
+    Calculates the backtest statistics of the signals within a window of candles.
+
+    Forward returns are cut at the end of the window, so a window never scores itself
+    with candles that come after it. Used to score the train and test slices of a
+    walk-forward fold from masks calculated once over the whole history.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+        masks (pandas.DataFrame): The signal masks of `calculate_ta_signal_masks`.
+        first (int): The position of the first candle of the window.
+        last (int): The position of the last candle of the window, inclusive.
+        horizons (list): The forward horizons, in candles.
+
+    Returns:
+        dict: The statistics, see `calculate_signal_statistics`.
+    """
+    window = df.iloc[: last + 1]
+    in_range = np.zeros(len(window), dtype=bool)
+    in_range[first : last + 1] = True
+
+    buy = masks["buy"].to_numpy(dtype=bool)[: last + 1] & in_range
+    sell = masks["sell"].to_numpy(dtype=bool)[: last + 1] & in_range
+
+    stats = {"candles": int(in_range.sum())}
+    stats.update(calculate_signal_statistics(window, buy, 1, horizons, "buy"))
+    stats.update(calculate_signal_statistics(window, sell, -1, horizons, "sell"))
+    return stats
+
+
+@exception_handler()
+def run_hunter_backtest(
+    hunter: object,
+    start_str: Optional[str] = None,
+    end_str: Optional[str] = None,
+    df: Optional[pd.DataFrame] = None,
+    horizons: Sequence[int] = DEFAULT_BACKTEST_HORIZONS,
+) -> Union[Dict[str, Any], Optional[int]]:
+    """
+    Backtests a hunter configuration over a historical kline range.
+
+    The klines are fetched from Binance (with warmup candles) unless a raw kline
+    DataFrame is given. Indicators are calculated once with the hunter's parameters
+    through `calculate_ta_indicators` and every signal over the range is evaluated in
+    a single vectorised pass, so the live signal semantics are reused exactly.
+
+    Args:
+        hunter (TechnicalAnalysisHunter or SimpleNamespace): The hunter configuration.
+        start_str (str, optional): The start of the backtested range.
+        end_str (str, optional): The end of the backtested range.
+        df (pandas.DataFrame, optional): Raw kline data to use instead of fetching.
+        horizons (list): The forward horizons, in candles.
+
+    Returns:
+        dict: The backtest result, see `evaluate_backtest`.
+    """
+    if df is None:
+        df = fetch_backtest_data(hunter, start_str, end_str)
+
+    if not is_df_valid(df):
+        return None
+
+    df_calculated = calculate_ta_indicators(df.copy(), hunter)
+    result = evaluate_backtest(
+        df_calculated, hunter, horizons=horizons, start=start_str, end=end_str
+    )
+
+    logger.info(
+        f"Backtest hunter {getattr(hunter, 'id', None)} {hunter.symbol} {hunter.interval} "
+        f"{result['stats']['candles']} candles, {result['stats']['buy_count']} buy, "
+        f"{result['stats']['sell_count']} sell signals."
+    )
+
+    return result
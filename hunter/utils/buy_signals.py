@@ -403,7 +403,7 @@ def atr_buy_signal(
         bool: True if the buy signal should be triggered, otherwise False.
     """
     if hunter_settings.atr_signals:
-        atr_buy_level = hunter_settings.atr_buy_treshold * float(latest_data["close"])
+        atr_buy_level = hunter_settings.atr_buy_threshold * float(latest_data["close"])
         return float(latest_data["atr"]) >= float(averages["avg_atr"]) and float(
             latest_data["atr"]
         ) >= float(atr_buy_level)
@@ -0,0 +1,159 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+from django.conf import settings
+from django.utils import timezone
+
+DEFAULT_HUNTER_TICK_DEADLINE_SECONDS = 50
+
+PRIORITY_NOTIFYING = 0
+PRIORITY_RUNNING = 1
+PRIORITY_SLEEPING = 2
+
+
+def get_hunter_priority(hunter: object) -> int:
+    """
+    Returns the scheduling priority of a hunter, lower values run first.
+
+    Running hunters whose user receives signals by telegram or email come first, then
+    the other running hunters, then sleeping hunters, which only refresh their saved df.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter.
+
+    Returns:
+        int: `PRIORITY_NOTIFYING`, `PRIORITY_RUNNING` or `PRIORITY_SLEEPING`.
+    """
+    if not hunter.running:
+        return PRIORITY_SLEEPING
+
+    user = hunter.user
+    if (user.telegram_signals_receiver and user.telegram_chat_id) or (
+        user.email_signals_receiver and user.email
+    ):
+        return PRIORITY_NOTIFYING
+    return PRIORITY_RUNNING
+
+
+def sort_hunters_by_priority(hunters: List[Any]) -> List[Any]:
+    """
+    Sorts hunters by priority, shorter intervals first within a priority.
+
+    Args:
+        hunters (list): The hunters of the tick.
+
+    Returns:
+        list: The sorted hunters.
+    """
+    from analysis.utils.fetch_utils import interval_to_timedelta
+
+    return sorted(
+        hunters,
+        key=lambda hunter: (
+            get_hunter_priority(hunter),
+            interval_to_timedelta(hunter.interval),
+            hunter.id,
+        ),
+    )
+
+
+class TickDeadline:
+    """
+    Tracks the progress of a hunter tick against its deadline.
+
+    The candle close is the minute boundary the tick evaluates. From the hunters handled
+    so far the tick projects its finish time; once the projection passes the deadline,
+    low-priority work is shed so the hunters that notify users finish in time.
+
+    Args:
+        candle_close (datetime): The boundary at which the evaluated candles closed.
+        total (int): The number of hunters of the tick.
+        deadline_seconds (float, optional): Seconds after the candle close by which the
+            tick should finish. Defaults to `settings.HUNTER_TICK_DEADLINE_SECONDS`.
+
+    Attributes:
+        deadline (datetime): The time the tick should be finished by.
+        done (int): Hunters handled or shed so far.
+        shed (int): Hunters whose low-priority work was shed.
+        max_lag (float): The longest lag after the candle close, in seconds.
+    """
+
+    def __init__(
+        self,
+        candle_close: datetime,
+        total: int,
+        deadline_seconds: Optional[float] = None,
+    ) -> None:
+        deadline_seconds = deadline_seconds or getattr(
+            settings,
+            "HUNTER_TICK_DEADLINE_SECONDS",
+            DEFAULT_HUNTER_TICK_DEADLINE_SECONDS,
+        )
+        self.candle_close = candle_close
+        self.deadline = candle_close + timedelta(seconds=deadline_seconds)
+        self.started = timezone.now()
+        self.total = total
+        self.done = 0
+        self.shed = 0
+        self.max_lag = 0.0
+        self._lock = threading.Lock()
+
+    def lag(self, now: Optional[datetime] = None) -> float:
+        """Returns the seconds elapsed since the candle close."""
+        return ((now or timezone.now()) - self.candle_close).total_seconds()
+
+    def hunter_done(self, shed: bool = False, now: Optional[datetime] = None) -> float:
+        """
+        Records a handled hunter.
+
+        Args:
+            shed (bool, optional): Whether its work was shed. Default is False.
+            now (datetime, optional): The current time. Defaults to `timezone.now()`.
+
+        Returns:
+            float: The lag of the hunter after the candle close, in seconds.
+        """
+        lag = self.lag(now)
+        with self._lock:
+            self.done += 1
+            self.shed += int(shed)
+            self.max_lag = max(self.max_lag, lag)
+        return lag
+
+    def projected_finish(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Projects when the tick will finish from the average time per handled hunter.
+
+        Args:
+            now (datetime, optional): The current time. Defaults to `timezone.now()`.
+
+        Returns:
+            datetime: The projected finish time, `now` before any hunter was handled.
+        """
+        now = now or timezone.now()
+        with self._lock:
+            done, remaining = self.done, self.total - self.done
+        if not done:
+            return now
+        return now + (now - self.started) / done * remaining
+
+    def should_shed(self, now: Optional[datetime] = None) -> bool:
+        """
+        Returns True when the deadline passed or is projected to be missed.
+
+        Args:
+            now (datetime, optional): The current time. Defaults to `timezone.now()`.
+
+        Returns:
+            bool: Whether low-priority work should be shed.
+        """
+        now = now or timezone.now()
+        return now >= self.deadline or self.projected_finish(now) > self.deadline
+
+    def summary(self) -> str:
+        """Returns a one-line summary for the logs."""
+        missed = "missed" if timezone.now() > self.deadline else "met"
+        return (
+            f"candle close {self.candle_close:%Y-%m-%d %H:%M} hunters {self.done}/{self.total} "
+            f"shed {self.shed} max lag {self.max_lag:.1f}s deadline {missed}"
+        )
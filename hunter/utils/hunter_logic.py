@@ -1,23 +1,38 @@
 from fomo_sapiens.utils.logging import logger
 from django.apps import apps
 import time
-from typing import Tuple, Any
+from datetime import datetime
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Any
+from django.utils import timezone
 from fomo_sapiens.utils.exception_handlers import exception_handler
-from hunter.utils.sell_signals import check_classic_ta_sell_signal
-from hunter.utils.buy_signals import check_classic_ta_buy_signal
-from hunter.utils.report_utils import generate_hunter_signal_content
-from fomo_sapiens.utils.email_utils import send_email
-from fomo_sapiens.utils.telegram_utils import send_telegram
+from hunter.utils.report_utils import (
+    generate_hunter_signal_content,
+    generate_hunter_signal_summary,
+)
+from hunter.utils.signal_state_utils import process_hunter_signal_state
+from hunter.utils.pipeline_utils import run_hunter_pipeline
+from hunter.utils.telemetry_utils import RunTimer, get_candle_time, record_hunter_run
+from hunter.utils.persistence_utils import BulkUpdateBuffer
+from hunter.utils.deadline_utils import TickDeadline, sort_hunters_by_priority
+from hunter.utils.market_cache_utils import cache_market_klines, get_market_key
+from fomo_sapiens.utils.outbox_utils import queue_notification
+from fomo_sapiens.utils.email_utils import EMAIL_SIGNATURE
+from hunter.utils.matrix_signals import (
+    evaluate_hunters_matrix,
+    get_fired_hunter_signals,
+)
 from analysis.utils.calc_utils import is_df_valid
 from analysis.utils.calc_utils import (
     calculate_ta_indicators,
     calculate_ta_averages,
-    check_ta_trend,
+    indicator_cache_key,
 )
 from analysis.utils.fetch_utils import (
     fetch_data,
-    calculate_lookback_extended,
+    closing_intervals,
     fetch_and_save_df,
+    DF_UPDATE_FIELDS,
 )
 
 
@@ -42,91 +57,327 @@ def run_selected_interval_hunters(interval: str = "1h") -> None:
 
     time.sleep(2)
 
-    from hunter.models import TechnicalAnalysisHunter
+    run_selected_intervals_hunters([interval])
 
-    all_selected_hunters = TechnicalAnalysisHunter.objects.filter(interval=interval)
-    last_hunter = all_selected_hunters.last()
-    last_hunter_id = last_hunter.id if last_hunter else 1
+    logger.info(f"run_selected_interval_hunters interval {interval} completed")
 
-    if not all_selected_hunters:
-        logger.info(
-            f"run_selected_interval_hunters interval {interval}. not all_selected_hunters"
-        )
-        return
 
-    for hunter in all_selected_hunters:
-        try:
-            run_single_hunter_logic(hunter, last_hunter_id)
-        except Exception as e:
-            logger.error(f"Error running hunter {hunter.id}: {e}")
-            continue
+@exception_handler()
+def run_closing_interval_hunters(moment: Optional[datetime] = None) -> None:
+    """
+    Runs the hunters of every Binance interval whose candle closes at this minute.
 
-    logger.info(f"run_selected_interval_hunters interval {interval} completed")
+    Scheduled once a minute, shortly after the boundary. All intervals closing at the
+    same boundary (e.g. 1m, 5m, 15m, 1h, 4h and 1d at 00:00) are evaluated in a single
+    fetch and compute pass, see `run_selected_intervals_hunters`.
+
+    Args:
+        moment (datetime, optional): The tick time. Defaults to now.
+
+    Returns:
+        None
+    """
+    apps.check_apps_ready()
+    candle_close = (moment or timezone.now()).replace(second=0, microsecond=0)
+    intervals = closing_intervals(candle_close)
+    run_selected_intervals_hunters(intervals, candle_close)
 
 
 @exception_handler()
-def run_single_hunter_logic(hunter: object, last_hunter_id: int) -> None:
+def run_selected_intervals_hunters(
+    intervals: List[str], candle_close: Optional[datetime] = None
+) -> None:
     """
-    Runs the trading logic for a single bot based on its settings.
+    Runs the trading logic for all hunters of the given intervals in one pass.
+
+    Klines are fetched once per symbol, interval and lookback, and every such market
+    flows through the fetch, compute and notify stages of `run_hunter_pipeline`, so the
+    network, CPU and database work of different markets overlaps.
+
+    Only running hunters take part, by priority (see `get_hunter_priority`) and against
+    a `TickDeadline`. Sleeping hunters do no work at all during ticks; their saved df is
+    refreshed lazily when they are viewed, see `refresh_sleeping_hunter_dfs`, from the
+    klines each tick leaves in the shared market cache.
 
-    This function fetches market data, validates it, and executes the trading logic based on
-    the bot's current settings and analysis methods. The trading logic includes checking
-    the bot's suspension status, fetching the current price, and managing the trade.
+    The hunters save the klines fetched for their market instead of fetching them
+    again, and all database writes of the tick are collected in a `BulkUpdateBuffer`
+    and flushed in one transaction at the end.
 
     Args:
-        hunter (BotSettings): The settings for the specific bot to run.
+        intervals (list): The intervals whose hunters should run, e.g. ['1h', '4h'].
+        candle_close (datetime, optional): The boundary the candles closed at, lags are
+                                           measured from it and later candles, still
+                                           open, are not evaluated. Defaults to now.
 
     Returns:
         None
     """
+    from hunter.models import TechnicalAnalysisHunter
 
-    if not hunter:
-        logger.info(f"Bot {hunter.id} HunterSettings not found. Cycle skipped.")
+    hunters = list(
+        TechnicalAnalysisHunter.objects.filter(interval__in=intervals, running=True)
+        .select_related("user", "signal_state")
+        .order_by("id")
+    )
+    if not hunters:
         return
 
-    symbol = hunter.symbol
-    interval = hunter.interval
-    signal = None
+    last_hunter_id = hunters[-1].id
+    hunters = sort_hunters_by_priority(hunters)
+    markets = group_hunters_by_market(hunters)
+    candle_close = candle_close or timezone.now()
+    deadline = TickDeadline(candle_close, len(hunters))
+    buffer = BulkUpdateBuffer()
 
-    df_fetched = fetch_data(
-        symbol=symbol, interval=interval, lookback=calculate_lookback_extended(hunter)
+    logger.info(
+        f"Start run_selected_intervals_hunters intervals {' '.join(intervals)} hunters {len(hunters)}"
     )
 
+    def fetch(market_key: Tuple) -> Any:
+        return fetch_market_klines(market_key, candle_close)
+
+    def failed(market_hunters: List[Any]) -> None:
+        for _ in market_hunters:
+            deadline.hunter_done()
+
+    def handle(
+        hunter: object,
+        df_calculated: Any,
+        signal: Any,
+        trend: Any,
+        timer: RunTimer,
+        df_json: str,
+    ) -> None:
+        handle_hunter_tick_result(
+            hunter,
+            df_calculated,
+            signal,
+            trend,
+            last_hunter_id,
+            timer,
+            deadline,
+            df_json,
+            buffer,
+        )
+
+    run_hunter_pipeline(
+        list(markets.items()), fetch, compute_market_signals, handle, failed
+    )
+    buffer.flush()
+
+    log = (
+        logger.warning
+        if deadline.shed or timezone.now() > deadline.deadline
+        else logger.info
+    )
+    log(
+        f"run_selected_intervals_hunters intervals {' '.join(intervals)} completed, {deadline.summary()}"
+    )
+
+
+def group_hunters_by_market(hunters: List[Any]) -> Dict[Tuple, List[Any]]:
+    """
+    Groups hunters by the klines they need: symbol, interval and extended lookback.
+
+    Args:
+        hunters (list): The hunters of the tick.
+
+    Returns:
+        dict: The hunters keyed by (symbol, interval, lookback).
+    """
+    markets = {}
+    for hunter in hunters:
+        markets.setdefault(get_market_key(hunter), []).append(hunter)
+    return markets
+
+
+def fetch_market_klines(
+    market_key: Tuple, candle_close: Optional[datetime] = None
+) -> Any:
+    """
+    Fetches the closed klines of a market.
+
+    Fetched right after a boundary, the klines already include the candle opened at it;
+    it is dropped, so the signals, candle time and dedup key refer to the closed candle.
+    The duration and time of the fetch are stored in the 'fetch_seconds' and
+    'fetched_at' entries of `df.attrs`.
+
+    Args:
+        market_key (tuple): The (symbol, interval, lookback) of the market.
+        candle_close (datetime, optional): The boundary the candles closed at.
+                                           Defaults to now.
+
+    Returns:
+        pandas.DataFrame: The klines, None if no valid df was fetched.
+    """
+    symbol, interval, lookback = market_key
+    started = time.perf_counter()
+    fetched_at = timezone.now()
+    df_fetched = fetch_data(symbol=symbol, interval=interval, lookback=lookback)
+    df_fetched = drop_open_candles(df_fetched, candle_close or timezone.now())
+
     if not is_df_valid(df_fetched):
-        return
+        logger.info(f"Hunters {symbol} {interval} {lookback} no valid df fetched.")
+        return None
+    df_fetched.attrs["fetch_seconds"] = time.perf_counter() - started
+    df_fetched.attrs["fetched_at"] = fetched_at
+    return df_fetched
 
-    df_calculated = calculate_ta_indicators(df_fetched, hunter)
 
-    trend = check_ta_trend(df_calculated, hunter)
+def drop_open_candles(df: Any, candle_close: datetime) -> Any:
+    """
+    Drops the candles of a klines DataFrame still open at `candle_close`.
 
-    averages = calculate_ta_averages(df_calculated, hunter)
+    Args:
+        df (pandas.DataFrame): The klines with a 'close_time' column in milliseconds.
+        candle_close (datetime): The boundary the candles closed at.
 
-    if hunter.running:
+    Returns:
+        pandas.DataFrame: The klines closed by `candle_close`, `df` itself if nothing
+                          was dropped or it is not a klines DataFrame.
+    """
+    if not isinstance(df, pd.DataFrame) or "close_time" not in df:
+        return df
+    close_ms = int(candle_close.timestamp() * 1000)
+    closed = pd.to_numeric(df["close_time"]) < close_ms
+    if closed.all():
+        return df
+    return df[closed].reset_index(drop=True)
+
+
+def calculate_market_frames(
+    hunters: List[Any], df_fetched: Any, timers: Optional[Dict[int, RunTimer]] = None
+) -> Dict[int, Any]:
+    """
+    Calculates indicators once per distinct set of indicator parameters of the hunters.
 
-        buy_singal = check_classic_ta_buy_signal(
-            df_calculated,
-            hunter,
-            trend,
-            averages,
-        )
+    Args:
+        hunters (list): The hunters sharing the klines.
+        df_fetched (pandas.DataFrame): The klines.
+        timers (dict, optional): Run timers keyed by hunter id, the calculation time of
+                                 each frame is split between the hunters sharing it.
 
-        sell_singal = check_classic_ta_sell_signal(
-            df_calculated,
+    Returns:
+        dict: The DataFrame with the calculated technical indicators keyed by hunter id.
+              Hunters with the same indicator parameters get the very same DataFrame.
+    """
+    groups = {}
+    for hunter in hunters:
+        groups.setdefault(indicator_cache_key(hunter), []).append(hunter)
+
+    frames = {}
+    for group in groups.values():
+        started = time.perf_counter()
+        df_calculated = calculate_ta_indicators(df_fetched.copy(), group[0])
+        elapsed = time.perf_counter() - started
+        for hunter in group:
+            frames[hunter.id] = df_calculated
+            if timers:
+                timers[hunter.id].add("compute", elapsed / len(group))
+    return frames
+
+
+@exception_handler(default_return=[])
+def compute_market_signals(hunters: List[Any], df_fetched: Any) -> List[Tuple]:
+    """
+    Calculates the indicators and evaluates the signals of all hunters of one market.
+
+    The klines are also stored in the shared market cache, for sleeping hunters of the
+    same market, see `refresh_sleeping_hunter_dfs`.
+
+    Args:
+        hunters (list): The hunters sharing the klines.
+        df_fetched (pandas.DataFrame): The klines.
+
+    Returns:
+        list: One (hunter, df_calculated, signal, trend, timer, df_json) tuple per hunter,
+              as expected by `handle_hunter_tick_result`. Signal and trend are None unless
+              it fired. The timer holds the hunter's share of the fetch and compute work,
+              df_json the klines as JSON records, serialised once for the whole market.
+    """
+    timers = {hunter.id: RunTimer() for hunter in hunters}
+    fetch_seconds = df_fetched.attrs.get("fetch_seconds", 0.0)
+    started = time.perf_counter()
+    df_json = df_fetched.to_json(orient="records")
+    cache_market_klines(
+        get_market_key(hunters[0]), df_json, df_fetched.attrs.get("fetched_at")
+    )
+    json_seconds = time.perf_counter() - started
+    for timer in timers.values():
+        timer.add("fetch", fetch_seconds / len(hunters))
+        timer.add("save", json_seconds / len(hunters))
+
+    frames = calculate_market_frames(hunters, df_fetched, timers)
+    running_hunters = [hunter for hunter in hunters if hunter.running]
+    timings = {}
+    signals = evaluate_hunters_matrix(
+        running_hunters, [frames[hunter.id] for hunter in running_hunters], timings
+    )
+    fired_signals = get_fired_hunter_signals(signals)
+
+    for hunter in running_hunters:
+        for stage, seconds in timings.items():
+            timers[hunter.id].add(stage, seconds / len(running_hunters))
+
+    return [
+        (
             hunter,
-            trend,
-            averages,
+            frames[hunter.id],
+            fired_signals.get(hunter.id),
+            signals.loc[hunter.id, "trend"] if hunter.id in fired_signals else None,
+            timers[hunter.id],
+            df_json,
         )
+        for hunter in hunters
+    ]
+
+
+@exception_handler()
+def handle_hunter_tick_result(
+    hunter: object,
+    df_calculated: Any,
+    signal: Any,
+    trend: Any,
+    last_hunter_id: int,
+    timer: Optional[RunTimer] = None,
+    deadline: Optional[TickDeadline] = None,
+    df_json: Optional[str] = None,
+    buffer: Optional[BulkUpdateBuffer] = None,
+) -> None:
+    """
+    Notifies, logs and saves the data of a single hunter after a bulk evaluation.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter.
+        df_calculated (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+        signal (str): 'buy', 'sell' or None when the hunter did not fire.
+        trend (str): The trend the signal was evaluated with.
+        last_hunter_id (int): The id of the last hunter of the tick.
+        timer (RunTimer, optional): The timings of the run so far, completed with the
+                                    notify and save stages and recorded as telemetry.
+        deadline (TickDeadline, optional): The deadline of the tick, the lag is recorded
+                                           and low-priority work is shed once the
+                                           deadline is at risk.
+        df_json (str, optional): The klines of the hunter's market as JSON records.
+        buffer (BulkUpdateBuffer, optional): Collects the database writes of the tick.
 
-        if buy_singal or sell_singal:
-            signal = "buy" if buy_singal else "sell"
-            subject, content = generate_hunter_signal_content(
-                signal, hunter, df_calculated, trend, averages
-            )
-            if hunter.user.telegram_signals_receiver and hunter.user.telegram_chat_id:
-                send_telegram(chat_id=hunter.user.telegram_chat_id, msg=content)
-            if hunter.user.email_signals_receiver and hunter.user.email:
-                content += "\n\n-- \n\nFomoSapiensCryptoDipHunter\nhttps://fomo.ropeaccess.pro\n\nStefanCryptoTradingBot\nhttps://stefan.ropeaccess.pro\n\nCodeCave\nhttps://cave.ropeaccess.pro\n"
-                send_email(hunter.user.email, subject, content)
+    Returns:
+        None
+    """
+    if df_calculated is None:
+        if deadline:
+            deadline.hunter_done()
+        return
+
+    timer = timer or RunTimer()
+    notified = False
+
+    if hunter.running:
+        with timer.stage("notify"):
+            if process_hunter_signal_state(hunter, signal, buffer) and signal:
+                averages = calculate_ta_averages(df_calculated, hunter)
+                notify_hunter_signal(signal, hunter, df_calculated, trend, averages)
+                notified = True
 
         logger.info(
             f'Hunter {hunter.id} {hunter.symbol} {hunter.interval} {hunter.lookback} {hunter.comment} {signal.upper() if signal else "NO"} signal.'
@@ -137,17 +388,123 @@ def run_single_hunter_logic(hunter: object, last_hunter_id: int) -> None:
             f"Hunter {hunter.id} {hunter.symbol} {hunter.interval} {hunter.lookback} {hunter.comment} is sleeping."
         )
 
-    fetch_and_save_df(hunter)
+    shed = bool(deadline and deadline.should_shed())
+    with timer.stage("save"):
+        shed = bool(save_hunter_dfs(hunter, last_hunter_id, df_json, buffer, shed))
+
+    record_hunter_run(
+        hunter,
+        timer,
+        (signal or "none") if hunter.running else "sleeping",
+        notified,
+        df_calculated,
+        deadline.hunter_done(shed=shed) if deadline else None,
+        buffer,
+    )
+
+
+@exception_handler()
+def notify_hunter_signal(
+    signal: str, hunter: object, df_calculated: Any, trend: Any, averages: Any
+) -> None:
+    """
+    Queues the signal report of a hunter to its user by telegram and email.
+
+    The messages are appended to the notification outbox and delivered by its dispatcher
+    job, so the hunter tick does not wait for Telegram or SMTP. A signal is queued once
+    per hunter, candle and channel. For users with `signals_digest` the signals of all
+    their hunters closing together are delivered as one digest per channel.
+
+    Args:
+        signal (str): 'buy' or 'sell'.
+        hunter (TechnicalAnalysisHunter): The hunter that fired.
+        df_calculated (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+        trend (str): The market trend.
+        averages (dict): The average values of the indicators.
+
+    Returns:
+        None
+    """
+    user = hunter.user
+    subject, content = generate_hunter_signal_content(
+        signal, hunter, df_calculated, trend, averages
+    )
+    summary = generate_hunter_signal_summary(signal, hunter, df_calculated, trend)
+    candle_time = get_candle_time(df_calculated) or timezone.now()
+    dedup_key = f"signal:{hunter.id}:{signal}:{candle_time.isoformat()}"
+    if user.telegram_signals_receiver and user.telegram_chat_id:
+        queue_notification(
+            "telegram",
+            user.telegram_chat_id,
+            content,
+            user=user,
+            dedup_key=f"{dedup_key}:telegram",
+            summary=summary,
+            digest=user.signals_digest,
+        )
+    if user.email_signals_receiver and user.email:
+        queue_notification(
+            "email",
+            user.email,
+            content if user.signals_digest else content + EMAIL_SIGNATURE,
+            subject=subject,
+            user=user,
+            dedup_key=f"{dedup_key}:email",
+            summary=summary,
+            digest=user.signals_digest,
+        )
+
+
+@exception_handler()
+def save_hunter_dfs(
+    hunter: object,
+    last_hunter_id: int,
+    df_json: Optional[str] = None,
+    buffer: Optional[BulkUpdateBuffer] = None,
+    shed: bool = False,
+) -> bool:
+    """
+    Saves the fresh df of a hunter, and of its user's settings after the last hunter.
+
+    Refreshing the user's settings needs its own klines fetch. When the tick is behind
+    its deadline that fetch is shed; the settings df is refreshed by the user's next
+    technical analysis refresh or a later tick.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter.
+        last_hunter_id (int): The id of the last hunter of the tick.
+        df_json (str, optional): The klines of the hunter's market already fetched this
+                                 tick, as JSON records. Skips fetching them again.
+        buffer (BulkUpdateBuffer, optional): Collects the writes instead of saving now.
+        shed (bool, optional): Whether to shed the user's settings refresh.
+                               Default is False.
+
+    Returns:
+        bool: True if the user's settings refresh was shed.
+    """
+    fetch_and_save_df(hunter, df_json, save=buffer is None)
+    if buffer is not None:
+        buffer.update(hunter, DF_UPDATE_FIELDS)
     logger.info(
         f"Hunter {hunter.id} {hunter.symbol} {hunter.interval} {hunter.lookback} {hunter.comment} df fetched and saved in db."
     )
 
-    if hunter.id == last_hunter_id:
-        user_ta_settings = hunter.user.technicalanalysissettings
-        fetch_and_save_df(user_ta_settings)
-        logger.info(
-            f"User {hunter.user.username} df {user_ta_settings.symbol} {user_ta_settings.interval} {user_ta_settings.lookback} fetched and saved in db."
+    if hunter.id != last_hunter_id:
+        return False
+    if shed:
+        logger.warning(
+            f"User {hunter.user.username} df refresh shed, hunter tick behind its deadline."
         )
+        return True
+
+    user_ta_settings = hunter.user.technicalanalysissettings
+    fetch_and_save_df(user_ta_settings, save=buffer is None)
+    if buffer is not None:
+        buffer.update(user_ta_settings, DF_UPDATE_FIELDS)
+    logger.info(
+        f"User {hunter.user.username} df {user_ta_settings.symbol} {user_ta_settings.interval} {user_ta_settings.lookback} fetched and saved in db."
+    )
+    return False
 
 
 @exception_handler(default_return=(None, None))
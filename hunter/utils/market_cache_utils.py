@@ -0,0 +1,158 @@
+from datetime import datetime
+from typing import Any, Iterable, Optional, Tuple
+from django.core.cache import caches
+from django.utils import timezone
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from analysis.utils.calc_utils import is_df_valid
+from analysis.utils.fetch_utils import (
+    DF_UPDATE_FIELDS,
+    calculate_lookback_extended,
+    fetch_and_save_df,
+    fetch_data,
+    interval_to_timedelta,
+)
+
+MARKET_CACHE_ALIAS = "shared"
+
+
+def get_market_key(settings: Any) -> Tuple[str, str, str]:
+    """
+    Returns the market of a hunter or settings object: symbol, interval and extended lookback.
+
+    Args:
+        settings (TechnicalAnalysisSettings): The hunter or settings object.
+
+    Returns:
+        tuple: The (symbol, interval, lookback) the klines are fetched with.
+    """
+    return (settings.symbol, settings.interval, calculate_lookback_extended(settings))
+
+
+def market_cache_key(market_key: Tuple[str, str, str]) -> str:
+    """Returns the cache key of the klines of a market."""
+    return "market-klines:" + ":".join(market_key)
+
+
+def cache_market_klines(
+    market_key: Tuple[str, str, str],
+    df_json: str,
+    fetched_at: Optional[datetime] = None,
+) -> None:
+    """
+    Stores the klines of a market in the shared cache until its next candle closes.
+
+    The cache is shared between the hunter worker and the web processes, so pages can
+    serve sleeping hunters the klines the last tick fetched for running ones.
+
+    Args:
+        market_key (tuple): The (symbol, interval, lookback) of the market.
+        df_json (str): The klines as JSON records.
+        fetched_at (datetime, optional): When the klines were fetched. Defaults to now.
+
+    Returns:
+        None
+    """
+    timeout = interval_to_timedelta(market_key[1]).total_seconds()
+    caches[MARKET_CACHE_ALIAS].set(
+        market_cache_key(market_key),
+        (df_json, fetched_at or timezone.now()),
+        timeout=timeout,
+    )
+
+
+def get_cached_market_klines(
+    market_key: Tuple[str, str, str],
+) -> Optional[Tuple[str, datetime]]:
+    """
+    Returns the cached klines of a market.
+
+    Args:
+        market_key (tuple): The (symbol, interval, lookback) of the market.
+
+    Returns:
+        tuple: The klines as JSON records and when they were fetched, None if not cached.
+    """
+    return caches[MARKET_CACHE_ALIAS].get(market_cache_key(market_key))
+
+
+def is_df_stale(settings: Any, now: Optional[datetime] = None) -> bool:
+    """
+    Returns True when the saved df is older than one candle of its interval.
+
+    Args:
+        settings (TechnicalAnalysisSettings): The hunter or settings object.
+        now (datetime, optional): The current time. Defaults to `timezone.now()`.
+
+    Returns:
+        bool: Whether the df should be refreshed.
+    """
+    fetched = settings.df_last_fetch_time
+    if not fetched:
+        return True
+    if timezone.is_naive(fetched):
+        fetched = timezone.make_aware(fetched)
+    now = now or timezone.now()
+    return now - fetched >= interval_to_timedelta(settings.interval)
+
+
+def has_stale_sleeping_hunters(hunters: Iterable[Any]) -> bool:
+    """
+    Returns True when any sleeping hunter's df is older than one candle.
+
+    Args:
+        hunters (iterable): The hunters, running ones are ignored.
+
+    Returns:
+        bool: Whether a sleeping hunter needs a refresh.
+    """
+    return any(not hunter.running and is_df_stale(hunter) for hunter in hunters)
+
+
+@exception_handler(default_return=0)
+def refresh_sleeping_hunter_dfs(
+    hunters: Iterable[Any], fetch_missing: bool = False
+) -> int:
+    """
+    Lazily refreshes the saved df of sleeping hunters, which the hunter ticks skip.
+
+    Only hunters whose df is older than one candle are refreshed, from the shared market
+    cache when a tick fetched the same market. Pages only serve cached klines; markets
+    missing from the cache are fetched from Binance, once per market, by the
+    'hunter_dfs' background job. Each df is stamped with the time its klines were
+    fetched.
+
+    Args:
+        hunters (iterable): The hunters about to be shown, running ones are ignored.
+        fetch_missing (bool, optional): Whether to fetch the klines of markets missing
+                                        from the cache. Default is False.
+
+    Returns:
+        int: The number of refreshed hunters.
+    """
+    refreshed = 0
+    for hunter in hunters:
+        if hunter.running or not is_df_stale(hunter):
+            continue
+
+        market_key = get_market_key(hunter)
+        cached = get_cached_market_klines(market_key)
+        if cached is None:
+            if not fetch_missing:
+                continue
+            symbol, interval, lookback = market_key
+            fetched_at = timezone.now()
+            df_fetched = fetch_data(symbol=symbol, interval=interval, lookback=lookback)
+            if not is_df_valid(df_fetched):
+                continue
+            cached = (df_fetched.to_json(orient="records"), fetched_at)
+            cache_market_klines(market_key, *cached)
+
+        df_json, fetched_at = cached
+        fetch_and_save_df(hunter, df_json, save=False, fetched_at=fetched_at)
+        hunter.save(update_fields=DF_UPDATE_FIELDS)
+        refreshed += 1
+
+    if refreshed:
+        logger.info(f"Refreshed the df of {refreshed} sleeping hunters.")
+    return refreshed
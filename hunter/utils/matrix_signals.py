@@ -0,0 +1,211 @@
+import time
+import warnings
+import numpy as np
+import pandas as pd
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Union
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from analysis.utils.calc_utils import (
+    get_ta_average_mappings,
+    check_ta_trend_arrays,
+)
+from hunter.utils.backtest_utils import hunter_settings_snapshot
+from hunter.utils.vectorized_signals import (
+    check_classic_ta_buy_mask,
+    check_classic_ta_sell_mask,
+)
+
+
+def tail_nanmeans(values: Any, periods: Sequence[int]) -> np.ndarray:
+    """
+    Calculates the mean of the last `period` values of an array for many periods at once.
+
+    NaN values are skipped, so each result equals `series.iloc[-period:].mean()`.
+
+    Args:
+        values (array-like): The values to average.
+        periods (list): The number of trailing values included in each mean.
+
+    Returns:
+        numpy.ndarray: One mean per period, NaN where a window holds no valid value.
+    """
+    values = np.asarray(values, dtype=float)
+    periods = np.maximum(np.asarray(periods, dtype=int), 1)
+    if not len(values) or not len(periods):
+        return np.full(len(periods), np.nan)
+
+    tail = values[-int(periods.max()) :][::-1]
+    valid = ~np.isnan(tail)
+    sums = np.cumsum(np.where(valid, tail, 0.0))
+    counts = np.cumsum(valid)
+
+    indexes = np.minimum(periods, len(tail)) - 1
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.where(counts[indexes] > 0, sums[indexes] / counts[indexes], np.nan)
+
+
+def get_settings_fields(hunter: object) -> Dict[str, Any]:
+    """
+    Returns the configuration fields of a hunter model or settings namespace.
+
+    Args:
+        hunter (TechnicalAnalysisHunter or SimpleNamespace): The hunter settings.
+
+    Returns:
+        dict: The field values keyed by field name.
+    """
+    if hasattr(hunter, "_meta"):
+        return vars(hunter_settings_snapshot(hunter))
+    return vars(hunter)
+
+
+def stack_hunter_settings(hunters: Sequence[object]) -> SimpleNamespace:
+    """
+    Stacks the settings of many hunters into one array per field.
+
+    The result can be passed wherever the vectorised checks expect settings, so each
+    threshold and flag is compared against the matching hunter's market values.
+
+    Args:
+        hunters (list): The hunters to stack.
+
+    Returns:
+        SimpleNamespace: One array per field, with one value per hunter.
+    """
+    fields = [get_settings_fields(hunter) for hunter in hunters]
+    names = fields[0].keys() if fields else []
+    return SimpleNamespace(
+        **{name: np.array([field[name] for field in fields]) for name in names}
+    )
+
+
+@exception_handler()
+def calculate_ta_latest_averages(
+    df: pd.DataFrame, hunters: Sequence[object]
+) -> Union[pd.DataFrame, Optional[int]]:
+    """
+    Calculates the averages of `calculate_ta_averages` on the latest candle for many hunters.
+
+    All hunters share the same indicator frame but may use different averaging periods.
+    The ADX average used by the trend check is included as 'avg_adx'.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+        hunters (list): The hunters evaluated on this frame.
+
+    Returns:
+        pandas.DataFrame: One row of averages per hunter.
+    """
+    mappings = []
+    for hunter in hunters:
+        average_mappings = get_ta_average_mappings(hunter)
+        average_mappings["avg_adx"] = ("adx", hunter.avg_adx_period)
+        mappings.append(average_mappings)
+
+    averages = {}
+    for avg_name, (column, _) in mappings[0].items():
+        periods = [mapping[avg_name][1] for mapping in mappings]
+        if column in df:
+            values = pd.to_numeric(df[column], errors="coerce")
+            averages[avg_name] = tail_nanmeans(values, periods)
+        else:
+            averages[avg_name] = np.full(len(hunters), np.nan)
+
+    return pd.DataFrame(averages)
+
+
+@exception_handler()
+def evaluate_hunters_matrix(
+    hunters: Sequence[object],
+    frames: Sequence[pd.DataFrame],
+    timings: Optional[Dict[str, float]] = None,
+) -> Union[pd.DataFrame, Optional[int]]:
+    """
+    Evaluates the latest-candle buy and sell signals of many hunters in one pass.
+
+    The latest and previous indicator values of every hunter's market and each hunter's
+    thresholds are stacked into arrays, then every enabled condition of every hunter is
+    evaluated by the same vectorised checks the backtests use. Hunters sharing a market
+    and indicator parameters should share one frame object: its rows are read once.
+
+    Args:
+        hunters (list): The hunters to evaluate.
+        frames (list): The DataFrame with the calculated technical indicators of each hunter.
+        timings (dict, optional): Filled with the seconds spent on the 'averages', 'trend'
+                                  and 'signal' steps for all hunters together.
+
+    Returns:
+        pandas.DataFrame: The 'trend' and the boolean 'buy' and 'sell' columns, indexed by
+                          hunter id. Hunters with fewer than two candles never signal.
+    """
+    timings = {} if timings is None else timings
+    started = time.perf_counter()
+    columns = ["trend", "buy", "sell"]
+    hunters = [
+        hunter
+        for hunter, frame in zip(hunters, frames)
+        if isinstance(frame, pd.DataFrame) and len(frame) > 1
+    ]
+    frames = [
+        frame for frame in frames if isinstance(frame, pd.DataFrame) and len(frame) > 1
+    ]
+    if not hunters:
+        return pd.DataFrame(columns=columns)
+
+    groups: Dict[int, List[int]] = {}
+    for position, frame in enumerate(frames):
+        groups.setdefault(id(frame), []).append(position)
+
+    order, latest_rows, previous_rows, averages = [], [], [], []
+    for positions in groups.values():
+        frame = frames[positions[0]]
+        group_hunters = [hunters[position] for position in positions]
+        latest_rows.append(frame.iloc[[-1] * len(positions)])
+        previous_rows.append(frame.iloc[[-2] * len(positions)])
+        averages.append(calculate_ta_latest_averages(frame, group_hunters))
+        order.extend(positions)
+
+    hunters = [hunters[position] for position in order]
+    latest = pd.concat(latest_rows, ignore_index=True)
+    previous = pd.concat(previous_rows, ignore_index=True)
+    averages = pd.concat(averages, ignore_index=True)
+    settings = stack_hunter_settings(hunters)
+    timings["averages"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    trend = check_ta_trend_arrays(latest, averages, settings)
+    timings["trend"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    buy = check_classic_ta_buy_mask(latest, previous, averages, trend, settings)
+    sell = check_classic_ta_sell_mask(latest, previous, averages, trend, settings)
+    timings["signal"] = time.perf_counter() - started
+
+    return pd.DataFrame(
+        {
+            "trend": trend,
+            "buy": np.broadcast_to(buy, len(hunters)),
+            "sell": np.broadcast_to(sell, len(hunters)),
+        },
+        index=pd.Index([hunter.id for hunter in hunters], name="hunter_id"),
+    )
+
+
+def get_fired_hunter_signals(signals: pd.DataFrame) -> Dict[int, str]:
+    """
+    Returns the hunters that fired and their signal, buy taking precedence over sell.
+
+    Args:
+        signals (pandas.DataFrame): The result of `evaluate_hunters_matrix`.
+
+    Returns:
+        dict: 'buy' or 'sell' keyed by hunter id.
+    """
+    if signals is None or signals.empty:
+        return {}
+    fired = signals[signals["buy"] | signals["sell"]]
+    return {
+        hunter_id: "buy" if row["buy"] else "sell"
+        for hunter_id, row in fired.iterrows()
+    }
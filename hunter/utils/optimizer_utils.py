@@ -0,0 +1,704 @@
+import os
+import math
+import random
+import itertools
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from django.db import models
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from analysis.utils.calc_utils import calculate_ta_indicators, indicator_cache_key
+from hunter.utils.vectorized_signals import calculate_ta_signal_masks
+from hunter.utils.backtest_utils import (
+    BACKTEST_WARMUP_CANDLES,
+    DEFAULT_BACKTEST_HORIZONS,
+    calculate_window_statistics,
+    evaluate_backtest,
+    hunter_settings_snapshot,
+)
+
+DEFAULT_SWEEP_METRICS = ("buy_avg_return_24",)
+
+
+class IndicatorCache:
+    """
+    Keeps calculated indicator frames keyed by their indicator parameters.
+
+    Variants sharing indicator parameters reuse the same frame instead of
+    recalculating every indicator from the raw klines.
+
+    Attributes:
+        klines (pandas.DataFrame): The raw kline data every frame is calculated from.
+        frames (dict): The calculated frames keyed by `indicator_cache_key`.
+    """
+
+    def __init__(self, klines: pd.DataFrame) -> None:
+        self.klines = klines
+        self.frames: Dict[Tuple[Any, ...], pd.DataFrame] = {}
+
+    def get(self, settings: object) -> pd.DataFrame:
+        """
+        Returns the indicator frame for the settings, calculating it on first use.
+
+        Args:
+            settings (object): The hunter settings.
+
+        Returns:
+            pandas.DataFrame: The klines with the calculated technical indicators.
+        """
+        key = indicator_cache_key(settings)
+        if key not in self.frames:
+            self.frames[key] = calculate_ta_indicators(self.klines.copy(), settings)
+        return self.frames[key]
+
+
+def get_field_type(field_name: str) -> type:
+    """
+    Returns the Python type of a TechnicalAnalysisHunter field.
+
+    Args:
+        field_name (str): The model field name.
+
+    Returns:
+        type: bool, int, float or str.
+
+    Raises:
+        ValueError: If the hunter has no such field.
+    """
+    from hunter.models import TechnicalAnalysisHunter
+
+    try:
+        field = TechnicalAnalysisHunter._meta.get_field(field_name)
+    except Exception:
+        raise ValueError(f"Unknown hunter field: {field_name}")
+
+    if isinstance(field, models.BooleanField):
+        return bool
+    if isinstance(field, models.IntegerField):
+        return int
+    if isinstance(field, models.FloatField):
+        return float
+    return str
+
+
+def parse_parameter_value(value: str, value_type: type) -> Any:
+    """
+    Converts a single parameter value from the command line to the field type.
+
+    Args:
+        value (str): The raw value.
+        value_type (type): The field type.
+
+    Returns:
+        Any: The converted value.
+    """
+    if value_type is bool:
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return value_type(value.strip())
+
+
+def parse_parameter_space(specs: Sequence[str]) -> Dict[str, List[Any]]:
+    """
+    Parses parameter specifications into the values to sweep.
+
+    Each spec is either a list ('rsi_buy=20,25,30') or an inclusive range with a step
+    ('rsi_buy=20:40:5', 'bollinger_nbdev=1:3').
+
+    Args:
+        specs (list): The parameter specifications.
+
+    Returns:
+        dict: The candidate values keyed by hunter field name.
+
+    Raises:
+        ValueError: If a spec is malformed or names an unknown field.
+    """
+    space = {}
+    for spec in specs:
+        if "=" not in spec:
+            raise ValueError(f"Invalid parameter spec: {spec}")
+        name, raw_values = spec.split("=", 1)
+        name = name.strip()
+        value_type = get_field_type(name)
+
+        if ":" in raw_values and value_type in (int, float):
+            parts = [value_type(part) for part in raw_values.split(":")]
+            start, stop = parts[0], parts[1]
+            step = parts[2] if len(parts) > 2 else value_type(1)
+            if step <= 0:
+                raise ValueError(f"Invalid step in parameter spec: {spec}")
+            count = int(math.floor((stop - start) / step + 1e-9)) + 1
+            values = [value_type(round(start + i * step, 10)) for i in range(count)]
+        else:
+            values = [
+                parse_parameter_value(v, value_type) for v in raw_values.split(",")
+            ]
+
+        space[name] = list(dict.fromkeys(values))
+    return space
+
+
+def generate_parameter_grid(space: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Returns every combination of the parameter space.
+
+    Args:
+        space (dict): The candidate values keyed by field name.
+
+    Returns:
+        list: One dict of field values per variant.
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+
+def sample_parameter_space(
+    space: Dict[str, List[Any]], samples: int, seed: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Draws distinct random variants from the parameter space.
+
+    Args:
+        space (dict): The candidate values keyed by field name.
+        samples (int): The number of variants to draw.
+        seed (int, optional): The random seed, for repeatable sweeps.
+
+    Returns:
+        list: At most `samples` distinct variants, fewer if the space is smaller.
+    """
+    total = math.prod(len(values) for values in space.values())
+    if samples >= total:
+        return generate_parameter_grid(space)
+
+    rng = random.Random(seed)
+    names = list(space)
+    drawn = set()
+    while len(drawn) < samples:
+        drawn.add(tuple(rng.randrange(len(space[name])) for name in names))
+
+    return [
+        {name: space[name][index] for name, index in zip(names, indexes)}
+        for indexes in sorted(drawn)
+    ]
+
+
+def group_variants_by_indicators(
+    base_settings: object, variants: List[Dict[str, Any]], chunks: int = 1
+) -> List[List[Dict[str, Any]]]:
+    """
+    Groups variants by their indicator parameters and splits the groups into batches.
+
+    Every batch shares one indicator frame. Large groups are split so that at least
+    `chunks` batches exist when possible, which keeps all worker processes busy.
+
+    Args:
+        base_settings (object): The settings the variants modify.
+        variants (list): The variants to group.
+        chunks (int): The minimum number of batches wanted.
+
+    Returns:
+        list: The batches of variants.
+    """
+    groups: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+    for variant in variants:
+        settings = hunter_settings_snapshot_from(base_settings, variant)
+        groups.setdefault(indicator_cache_key(settings), []).append(variant)
+
+    batch_size = max(1, math.ceil(len(variants) / max(chunks, 1)))
+    batches = []
+    for group in groups.values():
+        for start in range(0, len(group), batch_size):
+            batches.append(group[start : start + batch_size])
+    return batches
+
+
+def hunter_settings_snapshot_from(
+    base_settings: object, variant: Dict[str, Any]
+) -> object:
+    """
+    Returns a copy of the base settings with the variant values applied.
+
+    Args:
+        base_settings (SimpleNamespace): The settings snapshot the variant modifies.
+        variant (dict): The field values of the variant.
+
+    Returns:
+        SimpleNamespace: The settings of the variant.
+    """
+    settings = type(base_settings)(**vars(base_settings))
+    for name, value in variant.items():
+        setattr(settings, name, value)
+    return settings
+
+
+def evaluate_variant_batch(
+    klines: pd.DataFrame,
+    base_settings: object,
+    variants: List[Dict[str, Any]],
+    horizons: Sequence[int],
+    start: Optional[Any] = None,
+    end: Optional[Any] = None,
+    cache: Optional[IndicatorCache] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Backtests a batch of variants, reusing indicator frames between equal parameters.
+
+    This is the unit of work sent to the process pool, so it only takes picklable
+    arguments and touches no database state.
+
+    Args:
+        klines (pandas.DataFrame): The raw kline data.
+        base_settings (SimpleNamespace): The settings the variants modify.
+        variants (list): The variants to evaluate.
+        horizons (list): The forward horizons, in candles.
+        start (datetime, optional): The first reported candle open time.
+        end (datetime, optional): The last reported candle open time.
+        cache (IndicatorCache, optional): A cache to reuse, a new one by default.
+
+    Returns:
+        list: One dict per variant with its field values and backtest statistics.
+    """
+    cache = cache or IndicatorCache(klines)
+    rows = []
+    for variant in variants:
+        settings = hunter_settings_snapshot_from(base_settings, variant)
+        result = evaluate_backtest(
+            cache.get(settings), settings, horizons=horizons, start=start, end=end
+        )
+        rows.append({**variant, **result["stats"]})
+    return rows
+
+
+def get_base_settings(hunter: object) -> object:
+    """
+    Returns the settings snapshot of a hunter model, or the given settings namespace.
+
+    Args:
+        hunter (TechnicalAnalysisHunter or SimpleNamespace): The base configuration.
+
+    Returns:
+        SimpleNamespace: The picklable base settings.
+    """
+    return hunter_settings_snapshot(hunter) if hasattr(hunter, "_meta") else hunter
+
+
+def run_variant_batches(
+    worker: Any,
+    klines: pd.DataFrame,
+    base_settings: object,
+    variants: List[Dict[str, Any]],
+    processes: int,
+    *args: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Runs a batch worker over all variants, in a process pool when `processes` > 1.
+
+    The worker is called as `worker(klines, base_settings, batch, *args)` and returns a
+    list of rows. Batches group variants by indicator parameters, see
+    `group_variants_by_indicators`.
+
+    Args:
+        worker (callable): A picklable module-level batch function.
+        klines (pandas.DataFrame): The raw kline data.
+        base_settings (SimpleNamespace): The settings the variants modify.
+        variants (list): The variants to evaluate.
+        processes (int): The number of worker processes.
+        *args: Further arguments passed to the worker.
+
+    Returns:
+        list: The rows returned by every batch.
+    """
+    if processes == 1:
+        return worker(klines, base_settings, variants, *args)
+
+    batches = group_variants_by_indicators(base_settings, variants, processes * 4)
+    rows = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(worker, klines, base_settings, batch, *args)
+            for batch in batches
+        ]
+        for future in futures:
+            rows.extend(future.result())
+    return rows
+
+
+@exception_handler()
+def run_parameter_sweep(
+    hunter: object,
+    klines: pd.DataFrame,
+    variants: List[Dict[str, Any]],
+    horizons: Sequence[int] = DEFAULT_BACKTEST_HORIZONS,
+    processes: Optional[int] = None,
+    start: Optional[Any] = None,
+    end: Optional[Any] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    Backtests every variant of a hunter configuration on the same klines.
+
+    Variants are grouped by indicator parameters so each distinct set of indicator
+    columns is calculated once per batch, and the batches are spread across a process
+    pool. With `processes=1` everything runs in the calling process.
+
+    Args:
+        hunter (TechnicalAnalysisHunter or SimpleNamespace): The base configuration.
+        klines (pandas.DataFrame): The raw kline data.
+        variants (list): The field values of each variant.
+        horizons (list): The forward horizons, in candles.
+        processes (int, optional): The number of worker processes. Defaults to the CPU count.
+        start (datetime, optional): The first reported candle open time.
+        end (datetime, optional): The last reported candle open time.
+
+    Returns:
+        pandas.DataFrame: One row per variant with its field values and statistics.
+    """
+    base_settings = get_base_settings(hunter)
+    processes = processes or os.cpu_count() or 1
+    rows = run_variant_batches(
+        evaluate_variant_batch,
+        klines,
+        base_settings,
+        variants,
+        processes,
+        horizons,
+        start,
+        end,
+    )
+
+    logger.info(
+        f"Parameter sweep hunter {getattr(base_settings, 'id', None)} "
+        f"{len(variants)} variants evaluated with {processes} processes."
+    )
+
+    return pd.DataFrame(rows)
+
+
+def rank_sweep_results(
+    results: pd.DataFrame,
+    metrics: Sequence[str] = DEFAULT_SWEEP_METRICS,
+    min_signals: int = 1,
+    signal: str = "buy",
+) -> pd.DataFrame:
+    """
+    Orders sweep results by the chosen metrics, best first.
+
+    Every metric is ranked descending (for drawdowns, the value closest to zero wins).
+    Prefix a metric with '-' to rank it ascending instead. Variants with fewer than
+    `min_signals` signals of the given type are dropped.
+
+    Args:
+        results (pandas.DataFrame): The results of `run_parameter_sweep`.
+        metrics (list): The metric columns, in order of priority.
+        min_signals (int): The minimum '<signal>_count' a variant needs.
+        signal (str): 'buy' or 'sell', the signal type counted by `min_signals`.
+
+    Returns:
+        pandas.DataFrame: The filtered and ordered results.
+
+    Raises:
+        ValueError: If a metric is not a result column.
+    """
+    columns = [metric.lstrip("-") for metric in metrics]
+    missing = [column for column in columns if column not in results]
+    if missing:
+        raise ValueError(f"Unknown sweep metrics: {', '.join(missing)}")
+
+    ranked = results[results[f"{signal}_count"] >= min_signals]
+    return ranked.sort_values(
+        by=columns,
+        ascending=[metric.startswith("-") for metric in metrics],
+        na_position="last",
+        kind="mergesort",
+    )
+
+
+@exception_handler()
+def save_sweep_winner_as_hunter(
+    hunter: object, variant: Dict[str, Any], comment: Optional[str] = None
+) -> object:
+    """
+    Saves a copy of the hunter with the variant values as a new, sleeping hunter.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter the sweep started from.
+        variant (dict): The field values of the winning variant.
+        comment (str, optional): The comment of the new hunter.
+
+    Returns:
+        TechnicalAnalysisHunter: The new hunter.
+    """
+    from hunter.models import TechnicalAnalysisHunter
+
+    winner = TechnicalAnalysisHunter.objects.get(pk=hunter.pk)
+    winner.pk = None
+    winner.id = None
+    winner.running = False
+    for name, value in variant.items():
+        setattr(winner, name, value.item() if isinstance(value, np.generic) else value)
+    winner.comment = comment or f"Optimised from hunter {hunter.pk}"
+    winner.save()
+
+    logger.info(f"Hunter {winner.id} saved from parameter sweep of hunter {hunter.pk}.")
+    return winner
+
+
+def get_first_backtest_candle(klines: pd.DataFrame, start: Optional[Any] = None) -> int:
+    """
+    Returns the position of the first candle a walk-forward may use.
+
+    Args:
+        klines (pandas.DataFrame): The kline data with an 'open_time' column.
+        start (datetime, optional): The start of the evaluated history. Defaults to the
+            first candle after the `BACKTEST_WARMUP_CANDLES` warmup.
+
+    Returns:
+        int: The position of the first candle.
+    """
+    if start is None:
+        return min(BACKTEST_WARMUP_CANDLES, len(klines))
+    open_time = get_open_times(klines)
+    return int(
+        np.searchsorted(open_time.to_numpy(), np.datetime64(pd.Timestamp(start)))
+    )
+
+
+def get_open_times(klines: pd.DataFrame) -> pd.Series:
+    """
+    Returns the candle open times as datetimes, whether stored as milliseconds or dates.
+
+    Args:
+        klines (pandas.DataFrame): The kline data with an 'open_time' column.
+
+    Returns:
+        pandas.Series: The open times.
+    """
+    open_time = klines["open_time"]
+    if pd.api.types.is_numeric_dtype(open_time):
+        return pd.to_datetime(open_time, unit="ms")
+    return pd.to_datetime(open_time)
+
+
+def generate_walk_forward_folds(
+    length: int,
+    first: int,
+    train_candles: int,
+    test_candles: int,
+    step_candles: Optional[int] = None,
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Splits candle positions into rolling train/test folds.
+
+    Each fold trains on `train_candles` candles and tests on the `test_candles` that
+    follow. The window then moves by `step_candles` (by default one test window, so the
+    test slices tile the history). Incomplete folds at the end are dropped.
+
+    Args:
+        length (int): The number of candles.
+        first (int): The position of the first usable candle.
+        train_candles (int): The number of candles of each train slice.
+        test_candles (int): The number of candles of each test slice.
+        step_candles (int, optional): The number of candles between fold starts.
+
+    Returns:
+        list: (train_first, train_last, test_first, test_last) positions per fold, inclusive.
+
+    Raises:
+        ValueError: If a window size is not positive.
+    """
+    step_candles = step_candles or test_candles
+    if min(train_candles, test_candles, step_candles) <= 0:
+        raise ValueError("Walk-forward window sizes must be positive.")
+
+    folds = []
+    train_first = first
+    while train_first + train_candles + test_candles <= length:
+        test_first = train_first + train_candles
+        folds.append(
+            (train_first, test_first - 1, test_first, test_first + test_candles - 1)
+        )
+        train_first += step_candles
+    return folds
+
+
+def evaluate_variant_folds(
+    klines: pd.DataFrame,
+    base_settings: object,
+    variants: List[Dict[str, Any]],
+    horizons: Sequence[int],
+    folds: List[Tuple[int, int, int, int]],
+    cache: Optional[IndicatorCache] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Scores a batch of variants on the train and test slice of every fold.
+
+    Indicators and signal masks are calculated once per variant over the whole history
+    and every slice is scored from them, so overlapping windows never recalculate
+    indicator columns. Indicators only look back, which keeps this free of look-ahead.
+
+    Args:
+        klines (pandas.DataFrame): The raw kline data.
+        base_settings (SimpleNamespace): The settings the variants modify.
+        variants (list): The variants to evaluate.
+        horizons (list): The forward horizons, in candles.
+        folds (list): The folds of `generate_walk_forward_folds`.
+        cache (IndicatorCache, optional): A cache to reuse, a new one by default.
+
+    Returns:
+        list: One row per variant and fold with the variant values and the 'train' and
+              'test' statistics.
+    """
+    cache = cache or IndicatorCache(klines)
+    rows = []
+    for variant in variants:
+        settings = hunter_settings_snapshot_from(base_settings, variant)
+        df = cache.get(settings)
+        masks = calculate_ta_signal_masks(df, settings)
+        for fold, (train_first, train_last, test_first, test_last) in enumerate(folds):
+            rows.append(
+                {
+                    "fold": fold,
+                    "variant": variant,
+                    "train": calculate_window_statistics(
+                        df, masks, train_first, train_last, horizons
+                    ),
+                    "test": calculate_window_statistics(
+                        df, masks, test_first, test_last, horizons
+                    ),
+                }
+            )
+    return rows
+
+
+def run_walk_forward(
+    hunter: object,
+    klines: pd.DataFrame,
+    variants: List[Dict[str, Any]],
+    train_candles: int,
+    test_candles: int,
+    step_candles: Optional[int] = None,
+    metrics: Sequence[str] = DEFAULT_SWEEP_METRICS,
+    min_signals: int = 1,
+    signal: str = "buy",
+    horizons: Sequence[int] = DEFAULT_BACKTEST_HORIZONS,
+    processes: Optional[int] = None,
+    start: Optional[Any] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    Re-optimises the variants on each train slice and scores the winner on the next test slice.
+
+    Args:
+        hunter (TechnicalAnalysisHunter or SimpleNamespace): The base configuration.
+        klines (pandas.DataFrame): The raw kline data.
+        variants (list): The field values of each variant.
+        train_candles (int): The number of candles of each train slice.
+        test_candles (int): The number of candles of each test slice.
+        step_candles (int, optional): The number of candles between fold starts.
+        metrics (list): The ranking metrics, see `rank_sweep_results`.
+        min_signals (int): The minimum train signals a variant needs to be selected.
+        signal (str): 'buy' or 'sell', the signal type counted by `min_signals`.
+        horizons (list): The forward horizons, in candles.
+        processes (int, optional): The number of worker processes. Defaults to the CPU count.
+        start (datetime, optional): The start of the evaluated history.
+
+    Returns:
+        pandas.DataFrame: One row per fold with its candle range, the winning variant,
+                          its 'train_*' ranking metrics and all its 'test_*' statistics.
+                          Folds where no variant had enough signals have no winner.
+
+    Raises:
+        ValueError: If a window size is not positive or a metric is unknown, so the
+                    caller can report the cause instead of an empty result.
+    """
+    base_settings = get_base_settings(hunter)
+    processes = processes or os.cpu_count() or 1
+    folds = generate_walk_forward_folds(
+        len(klines),
+        get_first_backtest_candle(klines, start),
+        train_candles,
+        test_candles,
+        step_candles,
+    )
+    if not folds:
+        return pd.DataFrame()
+
+    rows = run_variant_batches(
+        evaluate_variant_folds,
+        klines,
+        base_settings,
+        variants,
+        processes,
+        horizons,
+        folds,
+    )
+
+    open_time = get_open_times(klines)
+    metric_columns = [metric.lstrip("-") for metric in metrics]
+    reports = []
+    for fold, (train_first, train_last, test_first, test_last) in enumerate(folds):
+        fold_rows = [row for row in rows if row["fold"] == fold]
+        train = pd.DataFrame([{**row["variant"], **row["train"]} for row in fold_rows])
+        ranked = rank_sweep_results(train, metrics, min_signals, signal)
+
+        report = {
+            "fold": fold,
+            "train_start": open_time.iloc[train_first],
+            "train_end": open_time.iloc[train_last],
+            "test_start": open_time.iloc[test_first],
+            "test_end": open_time.iloc[test_last],
+        }
+        if not ranked.empty:
+            winner = fold_rows[ranked.index[0]]
+            report.update(winner["variant"])
+            report[f"train_{signal}_count"] = winner["train"][f"{signal}_count"]
+            report.update(
+                {
+                    f"train_{column}": winner["train"][column]
+                    for column in metric_columns
+                }
+            )
+            report.update(
+                {f"test_{key}": value for key, value in winner["test"].items()}
+            )
+        reports.append(report)
+
+    logger.info(
+        f"Walk-forward hunter {getattr(base_settings, 'id', None)} {len(folds)} folds, "
+        f"{len(variants)} variants evaluated with {processes} processes."
+    )
+
+    return pd.DataFrame(reports)
+
+
+def summarize_walk_forward(
+    folds: pd.DataFrame, metrics: Sequence[str] = DEFAULT_SWEEP_METRICS
+) -> Dict[str, Any]:
+    """
+    Summarises how stable a configuration was across walk-forward folds.
+
+    Args:
+        folds (pandas.DataFrame): The result of `run_walk_forward`.
+        metrics (list): The ranking metrics.
+
+    Returns:
+        dict: The number of folds and of folds with a winner, and the mean, standard
+              deviation and positive share of each test metric.
+    """
+    summary = {"folds": len(folds)}
+    column = f"test_{metrics[0].lstrip('-')}" if metrics else None
+    summary["folds_with_winner"] = (
+        int(folds[column].notna().sum()) if column in folds else 0
+    )
+
+    for metric in metrics:
+        column = f"test_{metric.lstrip('-')}"
+        if column not in folds:
+            continue
+        values = folds[column].dropna()
+        summary[f"{column}_mean"] = float(values.mean()) if len(values) else np.nan
+        summary[f"{column}_std"] = float(values.std()) if len(values) > 1 else np.nan
+        summary[f"{column}_positive"] = (
+            float((values > 0).mean()) if len(values) else np.nan
+        )
+    return summary
@@ -0,0 +1,109 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from django.conf import settings
+from django.db import models, transaction
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+
+DEFAULT_BULK_UPDATE_BATCH_SIZE = 200
+
+
+class BulkUpdateBuffer:
+    """
+    Collects model updates and inserts of a scheduler run and writes them in bulk.
+
+    Updates of the same row are merged, keeping the latest instance and the union of
+    the changed fields. `flush` writes everything in one transaction: one `bulk_update`
+    per model and field set, touching only the changed columns, and one `bulk_create`
+    per model. This replaces a full-row `save()` per hunter per tick, which under SQLite
+    serialises every write and competes with web requests for the database lock.
+
+    The buffer is thread-safe, so the pipeline workers can share it.
+
+    Args:
+        batch_size (int, optional): Rows per UPDATE or INSERT statement.
+            Defaults to `settings.HUNTER_BULK_UPDATE_BATCH_SIZE`.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None) -> None:
+        self.batch_size = batch_size or getattr(
+            settings, "HUNTER_BULK_UPDATE_BATCH_SIZE", DEFAULT_BULK_UPDATE_BATCH_SIZE
+        )
+        self._updates: Dict[
+            Tuple[Type[models.Model], Any], Tuple[models.Model, set]
+        ] = {}
+        self._creates: List[models.Model] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._updates) + len(self._creates)
+
+    def update(self, instance: models.Model, fields: Iterable[str]) -> None:
+        """
+        Schedules saving `fields` of an existing row.
+
+        Args:
+            instance (Model): The saved model instance holding the new values.
+            fields (list): The names of the changed fields.
+
+        Returns:
+            None
+        """
+        key = (type(instance), instance.pk)
+        with self._lock:
+            _, pending_fields = self._updates.get(key, (instance, set()))
+            self._updates[key] = (instance, pending_fields | set(fields))
+
+    def create(self, instance: models.Model) -> None:
+        """
+        Schedules inserting a new row.
+
+        Args:
+            instance (Model): The unsaved model instance.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._creates.append(instance)
+
+    @exception_handler(default_return=0)
+    def flush(self) -> int:
+        """
+        Writes all pending updates and inserts in one transaction and empties the buffer.
+
+        Returns:
+            int: The number of written rows.
+        """
+        with self._lock:
+            updates, self._updates = self._updates, {}
+            creates, self._creates = self._creates, []
+
+        if not updates and not creates:
+            return 0
+
+        update_groups: Dict[Tuple[Type[models.Model], Tuple[str, ...]], List] = {}
+        for (model, _), (instance, fields) in updates.items():
+            update_groups.setdefault((model, tuple(sorted(fields))), []).append(
+                instance
+            )
+
+        create_groups: Dict[Type[models.Model], List] = {}
+        for instance in creates:
+            create_groups.setdefault(type(instance), []).append(instance)
+
+        with transaction.atomic():
+            for (model, fields), instances in update_groups.items():
+                model.objects.bulk_update(
+                    instances, list(fields), batch_size=self.batch_size
+                )
+            for model, instances in create_groups.items():
+                model.objects.bulk_create(instances, batch_size=self.batch_size)
+
+        written = len(updates) + len(creates)
+        logger.info(
+            f"Bulk saved {len(updates)} updated and {len(creates)} new rows "
+            f"in {len(update_groups) + len(create_groups)} groups."
+        )
+        return written
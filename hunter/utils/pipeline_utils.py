@@ -0,0 +1,300 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from django.conf import settings
+from django.db import connection
+from fomo_sapiens.utils.logging import logger
+
+DEFAULT_HUNTER_PIPELINE = {
+    "fetch_workers": 4,
+    "compute_workers": 2,
+    "notify_workers": 4,
+    "queue_size": 8,
+}
+
+_DONE = object()
+
+
+class PipelineStats:
+    """
+    Busy time and item counts of the stages of one pipeline run.
+
+    With the stages overlapping, the wall time of a run approaches the busy time of the
+    slowest stage divided by its workers, instead of the sum of all stages.
+
+    Attributes:
+        busy (dict): Seconds spent inside each stage, summed over its workers.
+        items (dict): Items processed by each stage.
+        wall (float): The wall time of the run in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.busy = {"fetch": 0.0, "compute": 0.0, "notify": 0.0}
+        self.items = {"fetch": 0, "compute": 0, "notify": 0}
+        self.wall = 0.0
+
+    def record(self, stage: str, started: float) -> None:
+        """Adds one item processed by `stage` since `started` (a monotonic time)."""
+        self.busy[stage] += time.monotonic() - started
+        self.items[stage] += 1
+
+    def __str__(self) -> str:
+        stages = " ".join(
+            f"{stage} {self.items[stage]} items {self.busy[stage]:.2f}s"
+            for stage in self.busy
+        )
+        return f"{stages} wall {self.wall:.2f}s"
+
+
+def get_pipeline_config(**overrides: Optional[int]) -> Dict[str, int]:
+    """
+    Returns the pipeline worker counts and queue size from `settings.HUNTER_PIPELINE`.
+
+    Args:
+        **overrides: Values replacing the configured ones, None values are ignored.
+
+    Returns:
+        dict: The 'fetch_workers', 'compute_workers', 'notify_workers' and 'queue_size'.
+    """
+    config = dict(DEFAULT_HUNTER_PIPELINE)
+    config.update(getattr(settings, "HUNTER_PIPELINE", {}))
+    config.update({key: value for key, value in overrides.items() if value})
+    return config
+
+
+def call_closing_connection(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Calls `func` in a pipeline thread and closes the thread's database connection.
+
+    Args:
+        func (callable): The function touching the database.
+        *args: The arguments of `func`.
+
+    Returns:
+        Any: The result of `func`.
+    """
+    try:
+        return func(*args)
+    finally:
+        connection.close()
+
+
+def call_on_failure(
+    on_failure: Optional[Callable[[List[Any]], Any]], hunters: List[Any]
+) -> None:
+    """
+    Reports the hunters of a market dropped by a failed stage.
+
+    Args:
+        on_failure (callable, optional): Called with the dropped hunters.
+        hunters (list): The hunters of the market.
+    """
+    if on_failure is None:
+        return
+    try:
+        on_failure(hunters)
+    except Exception as e:
+        logger.error(f"Error reporting failed hunter pipeline hunters: {e}")
+
+
+async def fetch_stage(
+    loop: asyncio.AbstractEventLoop,
+    executor: ThreadPoolExecutor,
+    fetch: Callable[[Hashable], Any],
+    inbox: asyncio.Queue,
+    outbox: asyncio.Queue,
+    stats: PipelineStats,
+    on_failure: Optional[Callable[[List[Any]], Any]] = None,
+) -> None:
+    """Fetches the klines of each market and passes the valid ones on."""
+    while (item := await inbox.get()) is not _DONE:
+        key, hunters = item
+        started = time.monotonic()
+        try:
+            df = await loop.run_in_executor(executor, fetch, key)
+        except Exception as e:
+            logger.error(f"Error fetching hunter pipeline market {key}: {e}")
+            df = None
+        stats.record("fetch", started)
+        if df is not None:
+            await outbox.put((hunters, df))
+        else:
+            call_on_failure(on_failure, hunters)
+
+
+async def compute_stage(
+    loop: asyncio.AbstractEventLoop,
+    executor: ThreadPoolExecutor,
+    compute: Callable[[List[Any], Any], List[Tuple]],
+    inbox: asyncio.Queue,
+    outbox: asyncio.Queue,
+    stats: PipelineStats,
+    on_failure: Optional[Callable[[List[Any]], Any]] = None,
+) -> None:
+    """Calculates the indicators and signals of each fetched market."""
+    while (item := await inbox.get()) is not _DONE:
+        hunters, df = item
+        started = time.monotonic()
+        try:
+            results = await loop.run_in_executor(executor, compute, hunters, df)
+        except Exception as e:
+            logger.error(f"Error computing hunter pipeline signals: {e}")
+            results = None
+        stats.record("compute", started)
+        if results:
+            await outbox.put(results)
+        else:
+            call_on_failure(on_failure, hunters)
+
+
+async def notify_stage(
+    loop: asyncio.AbstractEventLoop,
+    executor: ThreadPoolExecutor,
+    handle: Callable[..., Any],
+    inbox: asyncio.Queue,
+    stats: PipelineStats,
+) -> None:
+    """Notifies and saves the results of each computed market."""
+
+    def handle_results(results: List[Tuple]) -> None:
+        for result in results:
+            try:
+                handle(*result)
+            except Exception as e:
+                logger.error(f"Error handling hunter pipeline result: {e}")
+
+    while (results := await inbox.get()) is not _DONE:
+        started = time.monotonic()
+        await loop.run_in_executor(
+            executor, call_closing_connection, handle_results, results
+        )
+        stats.record("notify", started)
+
+
+async def run_pipeline_stages(
+    markets: Sequence[Tuple[Hashable, List[Any]]],
+    fetch: Callable[[Hashable], Any],
+    compute: Callable[[List[Any], Any], List[Tuple]],
+    handle: Callable[..., Any],
+    config: Dict[str, int],
+    on_failure: Optional[Callable[[List[Any]], Any]] = None,
+) -> PipelineStats:
+    """
+    Runs the fetch, compute and notify stages connected by bounded queues.
+
+    Every stage has its own thread pool, so network fetches, indicator calculations and
+    database writes or notifications of different markets run at the same time. A full
+    queue blocks the stage feeding it, which bounds the klines and results held in
+    memory to the queue sizes plus the items in progress.
+
+    Args:
+        markets (list): (key, hunters) pairs, one per distinct klines request.
+        fetch (callable): Returns the klines of a market key, None when unavailable.
+        compute (callable): Returns the (hunter, ...) result tuples of hunters and klines.
+        handle (callable): Called with each result tuple.
+        config (dict): The worker counts and queue size, see `get_pipeline_config`.
+        on_failure (callable, optional): Called with the hunters of each market whose
+                                         fetch or compute failed, so every hunter is
+                                         either handled or reported.
+
+    Returns:
+        PipelineStats: The stage timings of the run.
+    """
+    loop = asyncio.get_running_loop()
+    stats = PipelineStats()
+    started = time.monotonic()
+
+    queue_size = config["queue_size"]
+    markets_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    fetched_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    computed_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    fetch_workers = config["fetch_workers"]
+    compute_workers = config["compute_workers"]
+    notify_workers = config["notify_workers"]
+
+    with ThreadPoolExecutor(fetch_workers) as fetch_executor, ThreadPoolExecutor(
+        compute_workers
+    ) as compute_executor, ThreadPoolExecutor(notify_workers) as notify_executor:
+        fetchers = [
+            asyncio.create_task(
+                fetch_stage(
+                    loop,
+                    fetch_executor,
+                    fetch,
+                    markets_queue,
+                    fetched_queue,
+                    stats,
+                    on_failure,
+                )
+            )
+            for _ in range(fetch_workers)
+        ]
+        computers = [
+            asyncio.create_task(
+                compute_stage(
+                    loop,
+                    compute_executor,
+                    compute,
+                    fetched_queue,
+                    computed_queue,
+                    stats,
+                    on_failure,
+                )
+            )
+            for _ in range(compute_workers)
+        ]
+        notifiers = [
+            asyncio.create_task(
+                notify_stage(loop, notify_executor, handle, computed_queue, stats)
+            )
+            for _ in range(notify_workers)
+        ]
+
+        for market in markets:
+            await markets_queue.put(market)
+
+        for workers, queue in (
+            (fetchers, markets_queue),
+            (computers, fetched_queue),
+            (notifiers, computed_queue),
+        ):
+            for _ in workers:
+                await queue.put(_DONE)
+            await asyncio.gather(*workers)
+
+    stats.wall = time.monotonic() - started
+    return stats
+
+
+def run_hunter_pipeline(
+    markets: Sequence[Tuple[Hashable, List[Any]]],
+    fetch: Callable[[Hashable], Any],
+    compute: Callable[[List[Any], Any], List[Tuple]],
+    handle: Callable[..., Any],
+    on_failure: Optional[Callable[[List[Any]], Any]] = None,
+    **config: Optional[int],
+) -> PipelineStats:
+    """
+    Runs the hunters of many markets through the staged pipeline and logs its timings.
+
+    Args:
+        markets (list): (key, hunters) pairs, one per distinct klines request.
+        fetch (callable): Returns the klines of a market key, None when unavailable.
+        compute (callable): Returns the (hunter, ...) result tuples of hunters and klines.
+        handle (callable): Called with each result tuple.
+        on_failure (callable, optional): Called with the hunters of each market whose
+                                         fetch or compute failed.
+        **config: Worker counts or queue size overriding `settings.HUNTER_PIPELINE`.
+
+    Returns:
+        PipelineStats: The stage timings of the run.
+    """
+    stats = asyncio.run(
+        run_pipeline_stages(
+            markets, fetch, compute, handle, get_pipeline_config(**config), on_failure
+        )
+    )
+    logger.info(f"Hunter pipeline {stats}")
+    return stats
@@ -283,3 +283,25 @@ def generate_hunter_signal_content(
         )
 
     return subject, content
+
+
+@exception_handler(default_return="")
+def generate_hunter_signal_summary(
+    signal: str, hunter: object, df: DataFrame, trend: str
+) -> str:
+    """
+    Generates the one-line summary of a Hunter signal listed in notification digests.
+
+    Args:
+        signal (str): The type of signal (e.g., "buy", "sell").
+        hunter (object): The Hunter object that fired the signal.
+        df (DataFrame): The DataFrame with the calculated technical indicators.
+        trend (str): The current market trend (e.g., "bullish", "bearish").
+
+    Returns:
+        str: The summary, e.g. "Hunter 12 BTCUSDC 1h BUY, close 65000.00, trend bull".
+    """
+    return (
+        f"Hunter {hunter.id} {hunter.symbol} {hunter.interval} {signal.upper()}, "
+        f"close {df['close'].iloc[-1]:.2f}, trend {trend}"
+    )
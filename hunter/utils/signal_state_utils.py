@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import List, Optional
+from django.utils import timezone
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from analysis.utils.fetch_utils import interval_to_timedelta
+
+
+def get_hunter_signal_state(hunter: object) -> object:
+    """
+    Returns the signal state of a hunter, creating an unsaved one if it has none yet.
+
+    The state is read through the `signal_state` relation, so querysets using
+    `select_related("signal_state")` need no extra query per hunter.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter.
+
+    Returns:
+        HunterSignalState: The signal state of the hunter.
+    """
+    from hunter.models import HunterSignalState
+
+    try:
+        return hunter.signal_state
+    except HunterSignalState.DoesNotExist:
+        return HunterSignalState(hunter=hunter)
+
+
+def get_signal_state_fields() -> List[str]:
+    """
+    Returns the names of the signal state fields updated on every candle.
+
+    Returns:
+        list: All concrete fields except the primary key and the hunter.
+    """
+    from hunter.models import HunterSignalState
+
+    return [
+        field.name
+        for field in HunterSignalState._meta.concrete_fields
+        if not field.primary_key and field.name != "hunter"
+    ]
+
+
+def update_signal_state(
+    state: object, signal: Optional[str], hunter: object, now: datetime
+) -> bool:
+    """
+    Applies the signal of the latest candle to a hunter signal state.
+
+    A signal enters its state on the first candle its conditions hold and stays there
+    until `signal_hysteresis_candles` consecutive candles pass without it. With
+    `signal_edge_trigger` only the entering candle is notified, otherwise every candle
+    is. `signal_cooldown_candles` additionally delays repeated notifications of the same
+    signal. A switch from buy to sell (or back) is always a transition.
+
+    Args:
+        state (HunterSignalState): The state to update in place.
+        signal (str): 'buy', 'sell' or None when the conditions did not hold.
+        hunter (TechnicalAnalysisHunter): The hunter providing the interval and settings.
+        now (datetime): The time of the evaluation.
+
+    Returns:
+        bool: True if the signal should be notified.
+    """
+    if not signal:
+        state.clear_candles += 1
+        if state.state != "none" and state.clear_candles >= max(
+            hunter.signal_hysteresis_candles, 1
+        ):
+            state.state = "none"
+            state.state_since = now
+            state.active_candles = 0
+        return False
+
+    state.clear_candles = 0
+    state.last_signal_time = now
+
+    transition = signal != state.state
+    if transition:
+        state.state = signal
+        state.state_since = now
+        state.active_candles = 1
+    else:
+        state.active_candles += 1
+
+    notify = transition or not hunter.signal_edge_trigger
+
+    if notify and hunter.signal_cooldown_candles > 0:
+        cooldown = (
+            interval_to_timedelta(hunter.interval) * hunter.signal_cooldown_candles
+        )
+        if (
+            state.last_notified_signal == signal
+            and state.last_notified_time
+            and now - state.last_notified_time < cooldown
+        ):
+            notify = False
+
+    if notify:
+        state.last_notified_signal = signal
+        state.last_notified_time = now
+        state.notified_count += 1
+    else:
+        state.suppressed_count += 1
+
+    return notify
+
+
+@exception_handler(default_return=True)
+def process_hunter_signal_state(
+    hunter: object, signal: Optional[str], buffer: Optional[object] = None
+) -> bool:
+    """
+    Updates and saves the signal state of a hunter and decides whether to notify.
+
+    Errors fall back to notifying, so a broken state never hides a signal.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter.
+        signal (str): 'buy', 'sell' or None when the conditions did not hold.
+        buffer (BulkUpdateBuffer, optional): Collects the write instead of saving it now.
+
+    Returns:
+        bool: True if the signal should be notified.
+    """
+    state = get_hunter_signal_state(hunter)
+    now = timezone.now()
+    notify = update_signal_state(state, signal, hunter, now)
+    if buffer is None:
+        state.save()
+    elif state.pk:
+        state.updated_at = now
+        buffer.update(state, get_signal_state_fields())
+    else:
+        state.updated_at = now
+        buffer.create(state)
+
+    if signal and not notify:
+        logger.info(
+            f"Hunter {hunter.id} {hunter.symbol} {hunter.interval} {signal.upper()} signal suppressed. "
+            f"State {state.state} for {state.active_candles} candles."
+        )
+
+    return notify
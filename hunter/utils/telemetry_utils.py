@@ -0,0 +1,259 @@
+import csv
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.utils import timezone
+from fomo_sapiens.utils.logging import logger
+from fomo_sapiens.utils.exception_handlers import exception_handler
+
+TELEMETRY_STAGES = (
+    "fetch",
+    "compute",
+    "averages",
+    "trend",
+    "signal",
+    "notify",
+    "save",
+)
+TELEMETRY_SUMMARY_ROWS = 10000
+DEFAULT_TELEMETRY_RETENTION_DAYS = 14
+
+
+class RunTimer:
+    """
+    Accumulates the stage timings of one hunter run.
+
+    Attributes:
+        timings (dict): Seconds spent in each stage of `TELEMETRY_STAGES`.
+    """
+
+    def __init__(self) -> None:
+        self.timings = dict.fromkeys(TELEMETRY_STAGES, 0.0)
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Adds `seconds` to the timing of `stage`."""
+        self.timings[stage] += seconds
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Times the enclosed block as part of `stage`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+
+def get_candle_time(df: Any) -> Optional[datetime]:
+    """
+    Returns the open time of the latest candle of an indicator DataFrame.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+
+    Returns:
+        datetime: The aware UTC open time, None if unknown.
+    """
+    if not isinstance(df, pd.DataFrame) or df.empty or "open_time" not in df:
+        return None
+    open_time = df["open_time"].iloc[-1]
+    if not isinstance(open_time, (pd.Timestamp, datetime)):
+        open_time = pd.to_datetime(open_time, unit="ms")
+    open_time = pd.Timestamp(open_time).to_pydatetime()
+    if timezone.is_naive(open_time):
+        open_time = open_time.replace(tzinfo=dt_timezone.utc)
+    return open_time
+
+
+@exception_handler()
+def record_hunter_run(
+    hunter: object,
+    timer: RunTimer,
+    result: str,
+    notified: bool = False,
+    df: Any = None,
+    lag: Optional[float] = None,
+    buffer: Optional[object] = None,
+) -> Any:
+    """
+    Saves the telemetry row of a hunter run.
+
+    Args:
+        hunter (TechnicalAnalysisHunter): The hunter that ran.
+        timer (RunTimer): The stage timings of the run.
+        result (str): 'buy', 'sell', 'none' or 'sleeping'.
+        notified (bool, optional): Whether a signal was sent. Default is False.
+        df (pandas.DataFrame, optional): The evaluated DataFrame, for the candle time.
+        lag (float, optional): The seconds from the candle close until the run finished.
+        buffer (BulkUpdateBuffer, optional): Collects the insert instead of saving it now.
+
+    Returns:
+        HunterRunTelemetry: The saved (or buffered) row.
+    """
+    from hunter.models import HunterRunTelemetry
+
+    timings_ms = {
+        f"{stage}_ms": seconds * 1000 for stage, seconds in timer.timings.items()
+    }
+    run = HunterRunTelemetry(
+        hunter_id=hunter.id,
+        candle_time=get_candle_time(df),
+        result=result,
+        notified=notified,
+        total_ms=sum(timings_ms.values()),
+        lag_ms=lag * 1000 if lag is not None else None,
+        **timings_ms,
+    )
+    if buffer is None:
+        run.save()
+    else:
+        buffer.create(run)
+    return run
+
+
+def get_telemetry_frame(queryset: Any) -> pd.DataFrame:
+    """
+    Loads the most recent telemetry rows of a queryset into a DataFrame.
+
+    At most `TELEMETRY_SUMMARY_ROWS` rows are loaded, so summaries stay cheap however
+    long the retention is.
+
+    Args:
+        queryset (QuerySet): The HunterRunTelemetry rows to summarise.
+
+    Returns:
+        pandas.DataFrame: The hunter, symbol, interval and the timing columns.
+    """
+    columns = ["hunter_id", "hunter__symbol", "hunter__interval"]
+    columns += [f"{stage}_ms" for stage in TELEMETRY_STAGES] + ["total_ms", "lag_ms"]
+    rows = queryset.order_by("-created_at").values_list(*columns)[
+        :TELEMETRY_SUMMARY_ROWS
+    ]
+    return pd.DataFrame(list(rows), columns=columns)
+
+
+def calculate_stage_percentiles(queryset: Any) -> List[Dict[str, Any]]:
+    """
+    Calculates the p50, p95 and maximum duration of every stage.
+
+    Args:
+        queryset (QuerySet): The HunterRunTelemetry rows to summarise.
+
+    Returns:
+        list: One dict per stage (and 'total' and the candle close 'lag') with 'stage',
+              'runs', 'p50', 'p95' and 'max' in milliseconds.
+    """
+    frame = get_telemetry_frame(queryset)
+    summary = []
+    for stage in TELEMETRY_STAGES + ("total", "lag"):
+        values = frame[f"{stage}_ms"].dropna().to_numpy(dtype=float)
+        p50, p95 = np.percentile(values, [50, 95]) if len(values) else (0.0, 0.0)
+        summary.append(
+            {
+                "stage": stage,
+                "runs": len(values),
+                "p50": round(float(p50), 2),
+                "p95": round(float(p95), 2),
+                "max": round(float(values.max()), 2) if len(values) else 0.0,
+            }
+        )
+    return summary
+
+
+def get_slowest_hunters(queryset: Any, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Returns the hunters with the highest p95 total run time.
+
+    Args:
+        queryset (QuerySet): The HunterRunTelemetry rows to summarise.
+        limit (int, optional): The number of hunters returned. Default is 10.
+
+    Returns:
+        list: One dict per hunter with 'hunter_id', 'symbol', 'interval', 'runs', 'p50',
+              'p95' and 'slowest_stage', slowest first.
+    """
+    frame = get_telemetry_frame(queryset)
+    if frame.empty:
+        return []
+
+    stage_columns = [f"{stage}_ms" for stage in TELEMETRY_STAGES]
+    hunters = []
+    for (hunter_id, symbol, interval), runs in frame.groupby(
+        ["hunter_id", "hunter__symbol", "hunter__interval"]
+    ):
+        totals = runs["total_ms"].to_numpy(dtype=float)
+        hunters.append(
+            {
+                "hunter_id": hunter_id,
+                "symbol": symbol,
+                "interval": interval,
+                "runs": len(runs),
+                "p50": round(float(np.percentile(totals, 50)), 2),
+                "p95": round(float(np.percentile(totals, 95)), 2),
+                "slowest_stage": runs[stage_columns].mean().idxmax()[:-3],
+            }
+        )
+    hunters.sort(key=lambda hunter: hunter["p95"], reverse=True)
+    return hunters[:limit]
+
+
+def write_telemetry_summary_csv(queryset: Any, file: TextIO) -> None:
+    """
+    Writes the stage percentiles and the slowest hunters as CSV.
+
+    Args:
+        queryset (QuerySet): The HunterRunTelemetry rows to summarise.
+        file (file-like): The text stream written to, e.g. an HttpResponse.
+
+    Returns:
+        None
+    """
+    writer = csv.writer(file)
+    writer.writerow(["stage", "runs", "p50_ms", "p95_ms", "max_ms"])
+    for row in calculate_stage_percentiles(queryset):
+        writer.writerow([row["stage"], row["runs"], row["p50"], row["p95"], row["max"]])
+
+    writer.writerow([])
+    writer.writerow(
+        ["hunter_id", "symbol", "interval", "runs", "p50_ms", "p95_ms", "slowest_stage"]
+    )
+    for row in get_slowest_hunters(queryset):
+        writer.writerow(
+            [
+                row["hunter_id"],
+                row["symbol"],
+                row["interval"],
+                row["runs"],
+                row["p50"],
+                row["p95"],
+                row["slowest_stage"],
+            ]
+        )
+
+
+@exception_handler()
+def purge_hunter_telemetry(days: Optional[int] = None) -> int:
+    """
+    Deletes telemetry rows older than the retention period.
+
+    Args:
+        days (int, optional): The retention in days.
+            Defaults to `settings.HUNTER_TELEMETRY_RETENTION_DAYS`.
+
+    Returns:
+        int: The number of deleted rows.
+    """
+    from hunter.models import HunterRunTelemetry
+
+    days = days or getattr(
+        settings, "HUNTER_TELEMETRY_RETENTION_DAYS", DEFAULT_TELEMETRY_RETENTION_DAYS
+    )
+    deleted, _ = HunterRunTelemetry.objects.filter(
+        created_at__lt=timezone.now() - timedelta(days=days)
+    ).delete()
+    logger.info(f"Purged {deleted} hunter telemetry rows older than {days} days.")
+    return deleted
@@ -0,0 +1,299 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Union, Optional
+from fomo_sapiens.utils.exception_handlers import exception_handler
+from analysis.utils.calc_utils import (
+    is_df_valid,
+    get_array_values,
+    get_setting_values,
+    check_ta_trend_arrays,
+    calculate_ta_rolling_averages,
+)
+
+
+def classic_ta_buy_conditions(
+    latest: Any, previous: Any, averages: Any, trend: Any, settings: object
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorised counterparts of the predicates in `hunter.utils.buy_signals`.
+
+    Every condition is evaluated element-wise, regardless of whether the corresponding
+    signal is enabled in the settings. The conditions are keyed by the settings flag
+    that enables them; `combine_signal_conditions` applies the flags.
+
+    Args:
+        latest (DataFrame or dict): The latest market data (one element per candle or hunter).
+        previous (DataFrame or dict): The previous market data, aligned with `latest`.
+        averages (DataFrame or dict): The average market data, aligned with `latest`.
+        trend (array-like): The trend per element.
+        settings (object): The hunter settings, single values or one value per element.
+
+    Returns:
+        dict: The boolean array of each buy condition keyed by its settings flag.
+    """
+    value = lambda name: get_array_values(latest, name)
+    prev = lambda name: get_array_values(previous, name)
+    avg = lambda name: get_array_values(averages, name)
+    setting = lambda name: get_setting_values(settings, name)
+
+    close = value("close")
+    rsi = value("rsi")
+    cci = value("cci")
+    mfi = value("mfi")
+    atr = value("atr")
+    stoch_k = value("stoch_k")
+    stoch_rsi_k = value("stoch_rsi_k")
+
+    with np.errstate(invalid="ignore"):
+        return {
+            "trend_signals": np.asarray(trend) == "uptrend",
+            "rsi_signals": (rsi <= setting("rsi_buy")) & (rsi >= avg("avg_rsi")),
+            "rsi_divergence_signals": (close <= avg("avg_close"))
+            & (rsi >= avg("avg_rsi")),
+            "vol_signals": value("volume") >= avg("avg_volume"),
+            "macd_cross_signals": (prev("macd") <= prev("macd_signal"))
+            & (value("macd") >= value("macd_signal")),
+            "macd_histogram_signals": (prev("macd_histogram") <= 0)
+            & (value("macd_histogram") >= 0),
+            "bollinger_signals": close <= value("lower_band"),
+            "stoch_signals": (prev("stoch_k") <= prev("stoch_d"))
+            & (stoch_k >= value("stoch_d"))
+            & (stoch_k <= setting("stoch_buy")),
+            "stoch_divergence_signals": (stoch_k >= avg("avg_stoch_k"))
+            & (close <= avg("avg_close")),
+            "stoch_rsi_signals": (stoch_rsi_k <= setting("stoch_buy"))
+            & (stoch_rsi_k >= avg("avg_stoch_rsi_k")),
+            "ema_cross_signals": (prev("ema_fast") <= prev("ema_slow"))
+            & (value("ema_fast") >= value("ema_slow")),
+            "ema_fast_signals": close >= avg("avg_ema_fast"),
+            "ema_slow_signals": close >= avg("avg_ema_slow"),
+            "di_signals": (prev("plus_di") <= prev("minus_di"))
+            & (value("plus_di") >= value("minus_di")),
+            "cci_signals": (cci <= setting("cci_buy")) & (cci >= avg("avg_cci")),
+            "cci_divergence_signals": (close <= avg("avg_close"))
+            & (cci >= avg("avg_cci")),
+            "mfi_signals": (mfi <= setting("mfi_buy")) & (mfi >= avg("avg_mfi")),
+            "mfi_divergence_signals": (close <= avg("avg_close"))
+            & (mfi >= avg("avg_mfi")),
+            "atr_signals": (atr >= avg("avg_atr"))
+            & (atr >= setting("atr_buy_threshold") * close),
+            "vwap_signals": close >= value("vwap"),
+            "psar_signals": (prev("psar") >= prev("close")) & (value("psar") <= close),
+            "ma50_signals": close >= value("ma_50"),
+            "ma200_signals": close >= value("ma_200"),
+            "ma_cross_signals": (prev("ma_50") <= prev("ma_200"))
+            & (value("ma_50") >= value("ma_200")),
+        }
+
+
+def classic_ta_sell_conditions(
+    latest: Any, previous: Any, averages: Any, trend: Any, settings: object
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorised counterparts of the predicates in `hunter.utils.sell_signals`.
+
+    Args:
+        latest (DataFrame or dict): The latest market data (one element per candle or hunter).
+        previous (DataFrame or dict): The previous market data, aligned with `latest`.
+        averages (DataFrame or dict): The average market data, aligned with `latest`.
+        trend (array-like): The trend per element.
+        settings (object): The hunter settings, single values or one value per element.
+
+    Returns:
+        dict: The boolean array of each sell condition keyed by its settings flag.
+    """
+    value = lambda name: get_array_values(latest, name)
+    prev = lambda name: get_array_values(previous, name)
+    avg = lambda name: get_array_values(averages, name)
+    setting = lambda name: get_setting_values(settings, name)
+
+    close = value("close")
+    rsi = value("rsi")
+    stoch_k = value("stoch_k")
+    stoch_rsi_k = value("stoch_rsi_k")
+
+    with np.errstate(invalid="ignore"):
+        return {
+            "trend_signals": np.asarray(trend) == "downtrend",
+            "rsi_signals": rsi >= setting("rsi_sell"),
+            "rsi_divergence_signals": (close >= avg("avg_close"))
+            & (rsi <= avg("avg_rsi")),
+            "macd_cross_signals": (prev("macd") >= prev("macd_signal"))
+            & (value("macd") <= value("macd_signal")),
+            "macd_histogram_signals": (prev("macd_histogram") >= 0)
+            & (value("macd_histogram") <= 0),
+            "bollinger_signals": close >= value("upper_band"),
+            "stoch_signals": (prev("stoch_k") >= prev("stoch_d"))
+            & (stoch_k <= value("stoch_d"))
+            & (stoch_k >= setting("stoch_sell")),
+            "stoch_divergence_signals": (stoch_k <= avg("avg_stoch_k"))
+            & (close >= avg("avg_close")),
+            "stoch_rsi_signals": (stoch_rsi_k >= setting("stoch_sell"))
+            & (stoch_rsi_k <= value("stoch_rsi_d")),
+            "ema_cross_signals": (prev("ema_fast") >= prev("ema_slow"))
+            & (value("ema_fast") <= value("ema_slow")),
+            "ema_fast_signals": close <= value("ema_fast"),
+            "ema_slow_signals": close <= value("ema_slow"),
+            "di_signals": (prev("plus_di") >= prev("minus_di"))
+            & (value("plus_di") <= value("minus_di")),
+            "cci_signals": value("cci") >= setting("cci_sell"),
+            "cci_divergence_signals": (close >= avg("avg_close"))
+            & (value("cci") <= avg("avg_cci")),
+            "mfi_signals": value("mfi") >= setting("mfi_sell"),
+            "mfi_divergence_signals": (close >= avg("avg_close"))
+            & (value("mfi") <= avg("avg_mfi")),
+            "atr_signals": value("atr") <= avg("avg_atr"),
+            "vwap_signals": close <= value("vwap"),
+            "psar_signals": close <= value("psar"),
+            "ma50_signals": close <= value("ma_50"),
+            "ma200_signals": close <= value("ma_200"),
+            "ma_cross_signals": (prev("ma_50") >= prev("ma_200"))
+            & (value("ma_50") <= value("ma_200")),
+        }
+
+
+def combine_signal_conditions(
+    conditions: Dict[str, np.ndarray], settings: object
+) -> np.ndarray:
+    """
+    Combines signal conditions into a single mask, honouring the settings flags.
+
+    A disabled signal always passes, an enabled one passes only where its condition holds,
+    which mirrors the `return True` branch of every predicate in the row-by-row checks.
+
+    Args:
+        conditions (dict): The boolean arrays keyed by their settings flag.
+        settings (object): The hunter settings, single values or one value per element.
+
+    Returns:
+        numpy.ndarray: True where every enabled condition holds.
+    """
+    mask = np.bool_(True)
+    for flag, condition in conditions.items():
+        enabled = get_setting_values(settings, flag, dtype=bool)
+        mask = mask & np.where(enabled, condition, True)
+    return mask
+
+
+def check_classic_ta_buy_mask(
+    latest: Any, previous: Any, averages: Any, trend: Any, settings: object
+) -> np.ndarray:
+    """
+    Vectorised counterpart of `check_classic_ta_buy_signal`.
+
+    Args:
+        latest (DataFrame or dict): The latest market data.
+        previous (DataFrame or dict): The previous market data.
+        averages (DataFrame or dict): The average market data.
+        trend (array-like): The trend per element.
+        settings (object): The hunter settings.
+
+    Returns:
+        numpy.ndarray: True where a buy signal is triggered.
+    """
+    conditions = classic_ta_buy_conditions(latest, previous, averages, trend, settings)
+    not_downtrend = np.asarray(trend) != "downtrend"
+    return combine_signal_conditions(conditions, settings) & not_downtrend
+
+
+def check_classic_ta_sell_mask(
+    latest: Any, previous: Any, averages: Any, trend: Any, settings: object
+) -> np.ndarray:
+    """
+    Vectorised counterpart of `check_classic_ta_sell_signal`.
+
+    Args:
+        latest (DataFrame or dict): The latest market data.
+        previous (DataFrame or dict): The previous market data.
+        averages (DataFrame or dict): The average market data.
+        trend (array-like): The trend per element.
+        settings (object): The hunter settings.
+
+    Returns:
+        numpy.ndarray: True where a sell signal is triggered.
+    """
+    conditions = classic_ta_sell_conditions(latest, previous, averages, trend, settings)
+    return combine_signal_conditions(conditions, settings)
+
+
+@exception_handler()
+def calculate_ta_signal_masks(
+    df: pd.DataFrame, settings: object
+) -> Union[pd.DataFrame, Optional[int]]:
+    """
+    Evaluates the buy and sell signals of a hunter for every candle of the DataFrame.
+
+    The previous candle is taken from the shifted frame and the averages from
+    `calculate_ta_rolling_averages`, so each row holds exactly what
+    `check_classic_ta_buy_signal` / `check_classic_ta_sell_signal` would return if that
+    row were the latest candle. The first row has no previous candle and never signals.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+        settings (object): The hunter settings.
+
+    Returns:
+        pandas.DataFrame: A DataFrame aligned with `df` holding the 'trend' and the boolean
+                          'buy' and 'sell' columns.
+    """
+    if not is_df_valid(df):
+        return pd.DataFrame(columns=["trend", "buy", "sell"])
+
+    previous = df.shift(1)
+    averages = calculate_ta_rolling_averages(df, settings)
+    trend = check_ta_trend_arrays(df, averages, settings)
+
+    buy = check_classic_ta_buy_mask(df, previous, averages, trend, settings)
+    sell = check_classic_ta_sell_mask(df, previous, averages, trend, settings)
+
+    masks = pd.DataFrame(
+        {
+            "trend": trend,
+            "buy": np.broadcast_to(buy, len(df)).copy(),
+            "sell": np.broadcast_to(sell, len(df)).copy(),
+        },
+        index=df.index,
+    )
+    masks.iloc[0, masks.columns.get_indexer(["buy", "sell"])] = False
+
+    return masks
+
+
+@exception_handler()
+def count_ta_signal_conditions(
+    df: pd.DataFrame, settings: object
+) -> Union[Dict[str, Any], Optional[int]]:
+    """
+    Counts how often a hunter would have signalled over the DataFrame, and how often
+    each of its enabled conditions held on its own.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame with the calculated technical indicators.
+        settings (object): The hunter settings.
+
+    Returns:
+        dict: The 'buy' and 'sell' signal counts and the per-condition counts under
+              'buy_conditions' and 'sell_conditions'.
+    """
+    masks = calculate_ta_signal_masks(df, settings)
+    previous = df.shift(1)
+    averages = calculate_ta_rolling_averages(df, settings)
+    trend = masks["trend"].to_numpy()
+
+    counts = {
+        "buy": int(masks["buy"].sum()),
+        "sell": int(masks["sell"].sum()),
+    }
+
+    for name, conditions_func in (
+        ("buy_conditions", classic_ta_buy_conditions),
+        ("sell_conditions", classic_ta_sell_conditions),
+    ):
+        conditions = conditions_func(df, previous, averages, trend, settings)
+        counts[name] = {
+            flag: int(np.count_nonzero(np.broadcast_to(condition, len(df))[1:]))
+            for flag, condition in conditions.items()
+            if getattr(settings, flag)
+        }
+
+    return counts
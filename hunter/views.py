@@ -6,6 +6,11 @@ from typing import Optional, Any
 import pandas as pd
 from .forms import TechnicalAnalysisHunterForm
 from .models import TechnicalAnalysisHunter
+from .utils.market_cache_utils import (
+    has_stale_sleeping_hunters,
+    refresh_sleeping_hunter_dfs,
+)
+from fomo_sapiens.utils.job_utils import enqueue_job
 from fomo_sapiens.utils.exception_handlers import exception_handler
 from fomo_sapiens.utils.logging import logger
 
@@ -16,6 +21,9 @@ def show_hunters_list(request: Any) -> Any:
     """
     View function to display a list of hunters associated with the logged-in user.
     Each hunter's data is processed to calculate technical analysis indicators.
+    The stale data of sleeping hunters, which the hunter ticks skip, is refreshed here
+    from the klines cached by the ticks; markets missing from the cache are fetched by
+    a background job the page polls.
 
     Args:
         request: The HTTP request object.
@@ -23,9 +31,21 @@ def show_hunters_list(request: Any) -> Any:
     Returns:
         A rendered 'hunters_list.html' template with the hunters' data and plot URLs.
     """
-    hunters = TechnicalAnalysisHunter.objects.filter(user=request.user)
+    hunters = TechnicalAnalysisHunter.objects.filter(user=request.user).select_related(
+        "signal_state"
+    )
+    refresh_sleeping_hunter_dfs(hunters)
+    job = (
+        enqueue_job("hunter_dfs", request.user)
+        if has_stale_sleeping_hunters(hunters)
+        else None
+    )
 
-    return render(request, "hunter/hunters_list.html", {"hunters": hunters})
+    return render(
+        request,
+        "hunter/hunters_list.html",
+        {"hunters": hunters, "job_id": job.id if job else None},
+    )
 
 
 @exception_handler(default_return=lambda: redirect("show_hunters_list"))
@@ -0,0 +1,4 @@
+#!/bin/bash
+cd /home/pedro/FomoSapiensCryptoDipHunter
+source venv/bin/activate
+python manage.py run_hunter_worker
@@ -0,0 +1,86 @@
+function buildChartTraces(data) {
+  const times = data.t.map(t => new Date(t));
+  return data.traces.map(trace => {
+    const style = trace.mode === "markers"
+      ? { marker: { color: trace.color, size: 4 } }
+      : { line: { color: trace.color } };
+    return {
+      type: "scatter",
+      x: times,
+      y: data.series[trace.column],
+      name: trace.name,
+      mode: trace.mode,
+      ...style,
+    };
+  });
+}
+
+function buildChartShapes(data) {
+  if (!data.t.length) {
+    return [];
+  }
+  const x0 = new Date(data.t[0]);
+  const x1 = new Date(data.t[data.t.length - 1]);
+  return data.lines.map(line => ({
+    type: "line",
+    x0,
+    x1,
+    y0: line.y,
+    y1: line.y,
+    line: { color: line.color, width: 2, dash: "dash" },
+  }));
+}
+
+function buildChartLayout(data) {
+  return {
+    plot_bgcolor: "rgba(0,0,0,0)",
+    paper_bgcolor: "rgba(0,0,0,0)",
+    margin: { l: 50, r: 20, t: 20, b: 40 },
+    xaxis: { type: "date", showgrid: true },
+    yaxis: { showgrid: true },
+    legend: { orientation: "h", yanchor: "top", y: 1.1, xanchor: "center", x: 0.5 },
+    shapes: buildChartShapes(data),
+  };
+}
+
+function renderChart(container, data, plotly) {
+  container.innerHTML = "";
+  return plotly.newPlot(container, buildChartTraces(data), buildChartLayout(data), {
+    responsive: true,
+    displaylogo: false,
+  });
+}
+
+function loadChart(container, fetchFn, plotly) {
+  return fetchFn(container.dataset.url, { credentials: "same-origin" })
+    .then(response => {
+      if (!response.ok) {
+        throw new Error(`Chart data request failed: ${response.status}`);
+      }
+      return response.json();
+    })
+    .then(data => renderChart(container, data, plotly))
+    .catch(error => {
+      console.error(error);
+      container.textContent = "No data available for Technical Analysis Plot.";
+    });
+}
+
+if (typeof document !== "undefined") {
+  document.addEventListener("DOMContentLoaded", () => {
+    const container = document.getElementById("ta-chart");
+    if (container && window.Plotly) {
+      loadChart(container, window.fetch.bind(window), window.Plotly);
+    }
+  });
+}
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = {
+    buildChartTraces,
+    buildChartShapes,
+    buildChartLayout,
+    renderChart,
+    loadChart,
+  };
+}
@@ -0,0 +1,54 @@
+const JOB_POLL_INTERVAL = 2000;
+
+function handleJobStatus(container, job, navigate) {
+  if (job.status === "done") {
+    navigate(container.dataset.doneUrl);
+    return true;
+  }
+  if (job.status === "failed") {
+    container.className = container.className.replace("alert-info", "alert-danger");
+    container.textContent = `Refresh failed: ${job.error || "unknown error"}`;
+    return true;
+  }
+  return false;
+}
+
+function pollJob(container, fetchFn, navigate, schedule) {
+  return fetchFn(container.dataset.url, { credentials: "same-origin" })
+    .then(response => {
+      if (!response.ok) {
+        throw new Error(`Job status request failed: ${response.status}`);
+      }
+      return response.json();
+    })
+    .then(job => {
+      if (!handleJobStatus(container, job, navigate)) {
+        schedule(() => pollJob(container, fetchFn, navigate, schedule), JOB_POLL_INTERVAL);
+      }
+    })
+    .catch(error => {
+      console.error(error);
+      container.remove();
+    });
+}
+
+if (typeof document !== "undefined") {
+  document.addEventListener("DOMContentLoaded", () => {
+    const container = document.getElementById("background-job");
+    if (container) {
+      pollJob(
+        container,
+        window.fetch.bind(window),
+        url => window.location.assign(url),
+        window.setTimeout.bind(window),
+      );
+    }
+  });
+}
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = {
+    handleJobStatus,
+    pollJob,
+  };
+}